@@ -1,25 +1,41 @@
 """Aurora Monitor — community source monitor entry point.
 
 Usage:
-    python -m aurora_monitor --mode steady-state
-    python -m aurora_monitor --mode backfill [--dry-run]
-    python -m aurora_monitor --mode dry-run
+    python -m aurora_monitor --mode steady-state [--debug-http]
+    python -m aurora_monitor --mode backfill [--dry-run] [--scoring-backend rapidfuzz] [--workers N]
+    python -m aurora_monitor --mode dry-run [--offline]
+    python -m aurora_monitor --mode rematch [--dry-run]
+    python -m aurora_monitor --mode backfill --dry-run --record run.cassette.gz
+    python -m aurora_monitor --mode backfill --dry-run --replay run.cassette.gz [--replay-latency MS]
 """
 
 import argparse
-import json
 import os
-import subprocess
 import sys
 import time
 from datetime import datetime, timezone
 
 import yaml
 
-from aurora_monitor.sources.reddit import RedditFetcher
+from aurora_monitor.cassette import Cassette
+from aurora_monitor.github_client import API_URL, GitHubClient, GitHubError
+from aurora_monitor.sources.http_cache import ResponseCache
+from aurora_monitor.sources.reddit import AsyncRedditFetcher
+from aurora_monitor.keywords import KeywordAutomaton
 from aurora_monitor.matcher import Matcher
 from aurora_monitor.new_content import NewContentDetector
-from aurora_monitor.state import load_state, save_state, is_seen, mark_seen
+from aurora_monitor.ledger import PostLedger
+from aurora_monitor.parallel import MatcherPool
+from aurora_monitor.post_queue import PostQueue
+from aurora_monitor.score_cache import ScoreCache
+from aurora_monitor.state import (
+    load_state, save_state, is_seen, mark_seen,
+    changed_issues, record_issue_snapshot, load_corpus, save_corpus, record_item,
+    get_watermark,
+)
+from aurora_monitor.pipeline import (
+    TopOpportunities, counted, match_items, page_items, tally, unseen,
+)
 from aurora_monitor.digest import DigestGenerator
 from aurora_monitor import github_api
 
@@ -27,6 +43,11 @@ from aurora_monitor import github_api
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(BASE_DIR, "config.yaml")
 STATE_PATH = os.path.join(BASE_DIR, "state", "reddit.json")
+CORPUS_PATH = os.path.join(BASE_DIR, "state", "reddit_corpus.json")
+
+# Backfill comment targets fetched concurrently per batch; a run of failed
+# fetches triggers a cooldown before the next batch
+COMMENT_FETCH_CHUNK = 50
 
 
 def load_config():
@@ -35,16 +56,137 @@ def load_config():
 
 
 def load_unverified_issues(repo):
-    """Fetch open issues labeled 'unverified' via gh CLI."""
-    result = subprocess.run(
-        ["gh", "issue", "list", "--repo", repo, "--label", "unverified",
-         "--state", "open", "--json", "number,title,body", "--limit", "500"],
-        capture_output=True, text=True,
+    """Fetch open issues labeled 'unverified'. Returns [] if the fetch failed."""
+    return github_api.list_issues(["unverified"], repo=repo, limit=500)
+
+
+def open_github_client(config, cassette=None):
+    """Route github_api calls through an in-process GitHubClient, if possible.
+
+    Needs GITHUB_TOKEN or GH_TOKEN unless github.transport is "gh"; without
+    a token github_api keeps using `gh`. A replay uses the client only if
+    the cassette recorded client traffic, so it needs no token.
+    """
+    if config["github"].get("transport", "auto") == "gh":
+        return None
+    if cassette is not None and cassette.mode == "replay":
+        if not any(e["url"].startswith(API_URL) for e in cassette.http):
+            return None
+        client = GitHubClient("replay")
+    else:
+        client = GitHubClient.from_env()
+        if client is None:
+            return None
+    if cassette is not None:
+        cassette.install(client.session)
+    github_api.client = client
+    return client
+
+
+def open_score_cache(config, matcher):
+    """Attach the on-disk score cache to matcher, if enabled in config."""
+    cache_cfg = config["matching"].get("score_cache", {})
+    if not cache_cfg.get("enabled", True):
+        return None
+    path = os.path.join(BASE_DIR, cache_cfg.get("path", "state/score_cache.json"))
+    cache = ScoreCache(path, matcher.config_hash,
+                       max_entries=cache_cfg.get("max_entries", 200000))
+    matcher.score_cache = cache
+    return cache
+
+
+def open_response_cache(config, fetcher):
+    """Attach the on-disk Reddit response cache to fetcher, if enabled.
+
+    Offline runs always use the cache, since it is their only source.
+    """
+    cache_cfg = config["reddit"].get("response_cache", {})
+    if not cache_cfg.get("enabled", True) and not fetcher.offline:
+        return None
+    path = os.path.join(BASE_DIR, cache_cfg.get("path", "state/http_cache"))
+    cache = ResponseCache(path, ttls=cache_cfg.get("ttl", {}))
+    fetcher.response_cache = cache
+    return cache
+
+
+def open_fetcher(config, cassette=None):
+    """Build the Reddit fetcher, routed through cassette if one is given.
+
+    Without a cassette the on-disk response cache is attached (if enabled);
+    with one it is not, so recordings capture every request. A replay
+    cassette also turns off rate limiting, so replayed runs take the
+    cassette's latency rather than Reddit's request budget.
+    """
+    fetcher = AsyncRedditFetcher(config)
+    if cassette is not None:
+        cassette.install(fetcher.session)
+        if cassette.mode == "replay":
+            fetcher.paced = False
+            fetcher.rate_limit_delay = 0
+    else:
+        open_response_cache(config, fetcher)
+    return fetcher
+
+
+def open_node_id_cache(config, cassette=None):
+    """Memoize GitHub node ID lookups for the run, on disk too if enabled.
+
+    The disk cache is skipped with a cassette, so recordings capture every
+    lookup and replays don't depend on local state.
+    """
+    cache_cfg = config["github"].get("node_id_cache", {})
+    if cassette is None and cache_cfg.get("enabled", True):
+        path = os.path.join(BASE_DIR, cache_cfg.get("path", "state/github_node_ids.json"))
+        cache = github_api.NodeIdCache(path, ttl=cache_cfg.get("ttl", 604800))
+    else:
+        cache = github_api.NodeIdCache()
+    github_api.node_ids = cache
+    return cache
+
+
+def discussion_category(config):
+    """The digest discussion category ID, from config or looked up by slug."""
+    github_cfg = config["github"]
+    if github_cfg.get("discussion_category_id"):
+        return github_cfg["discussion_category_id"]
+    try:
+        return github_api.discussion_category_id(
+            github_cfg["discussion_category_slug"], repo=github_cfg["repo"]
+        )
+    except GitHubError as e:
+        print(f"Warning: Could not resolve discussion category: {e}")
+        return None
+
+
+def open_post_ledger(config):
+    """Open the local ledger of posted comments."""
+    ledger_cfg = config["github"].get("ledger", {})
+    days = ledger_cfg.get("reconcile_days", 7)
+    return PostLedger(
+        os.path.join(BASE_DIR, ledger_cfg.get("path", "state/post_ledger.jsonl")),
+        reconcile_interval=days * 86400 if days is not None else None,
+    )
+
+
+def open_post_queue(config, ledger):
+    """Open the persisted GitHub write queue, with any writes a killed run left."""
+    queue_cfg = config["github"].get("post_queue", {})
+    return PostQueue(
+        os.path.join(BASE_DIR, queue_cfg.get("path", "state/post_queue.json")),
+        repo=config["github"]["repo"],
+        workers=queue_cfg.get("workers", 3),
+        requests_per_minute=queue_cfg.get("requests_per_minute", 60),
+        max_retries=queue_cfg.get("max_retries", 5),
+        ledger=ledger,
     )
-    if result.returncode != 0:
-        print(f"Warning: Could not fetch issues: {result.stderr}")
-        return []
-    return json.loads(result.stdout)
+
+
+def resume_post_queue(config):
+    """Post the writes an earlier run queued but did not finish."""
+    queue = open_post_queue(config, open_post_ledger(config))
+    if queue.pending():
+        print(f"Resuming {len(queue.pending())} queued GitHub posts from an earlier run...")
+        _print_summary(queue.run())
 
 
 def format_issue_comment(match):
@@ -64,7 +206,94 @@ def format_issue_comment(match):
     )
 
 
-def run_steady_state(config, dry_run=False):
+def post_match_comments(pending, repo, ledger):
+    """Comment each (reddit_id, match) on its issue unless already referenced there.
+
+    Duplicates are checked against the local post ledger. When a reconcile
+    is due, the existing comments on the target issues and the ledger's
+    issues are first fetched in one batched GraphQL pre-flight and synced
+    into the ledger; issues the pre-flight could not load are checked on
+    GitHub directly. Returns the number of comments posted.
+    """
+    if not pending:
+        return 0
+    references = None
+    if ledger.reconcile_due():
+        issues = {match["issue"] for _, match in pending} | ledger.issues()
+        references = github_api.fetch_issue_references(issues, repo=repo)
+        added, dropped = ledger.reconcile(references)
+        print(f"Reconciled post ledger with {len(references.ids)} issues: "
+              f"{added} references found, {dropped} deleted comments forgotten")
+    posted = 0
+    for reddit_id, match in pending:
+        issue = match["issue"]
+        if ledger.has(issue, reddit_id):
+            continue
+        if (references is not None and issue not in references.ids
+                and references.has(issue, reddit_id)):
+            continue
+        body = format_issue_comment(match)
+        if github_api.post_issue_comment(issue, body, repo=repo):
+            ledger.record(issue, reddit_id, body)
+            posted += 1
+    return posted
+
+
+def rematch_changed_issues(config, state, corpus, issues, dry_run=False,
+                           keyword_automaton=None):
+    """Match previously seen posts and comments against new or edited issues.
+
+    Items already seen were only ever scored against the issue set of the
+    run that fetched them. Scoring the stored corpus against just the issues
+    that changed since the last snapshot gives new issues their community
+    references without a full backfill. Returns (reddit_id, match) pairs for
+    the auto_comment matches, for post_match_comments().
+    """
+    changed = changed_issues(state, issues)
+    items = list(corpus["posts"].values()) + list(corpus["comments"].values())
+    if not changed or not items:
+        return []
+
+    print(f"Re-matching {len(items)} seen items against {len(changed)} new or edited issues...")
+    matcher = Matcher(config, keyword_automaton=keyword_automaton)
+    matcher.issues = changed
+
+    rematches = []
+    for item, match in zip(items, matcher.find_matches(items)):
+        if match["routing"] != "auto_comment":
+            continue
+        if dry_run:
+            print(f"  [REMATCH] #{match['issue']} <- r/{item['subreddit']}/u/{item['author']}")
+        rematches.append((item["id"], match))
+    return rematches
+
+
+def run_rematch(config, dry_run=False):
+    """Rematch mode: match the stored corpus against new or edited issues only."""
+    state = load_state(STATE_PATH)
+    corpus = load_corpus(CORPUS_PATH)
+    issues = load_unverified_issues(config["github"]["repo"])
+    if not issues:
+        # An empty snapshot would re-match every issue against the corpus next run
+        print("No unverified issues loaded. State not saved.")
+        return
+
+    rematches = rematch_changed_issues(config, state, corpus, issues, dry_run=dry_run)
+    if not dry_run:
+        post_match_comments(rematches, config["github"]["repo"], open_post_ledger(config))
+    record_issue_snapshot(state, issues)
+    if not dry_run:
+        save_state(STATE_PATH, state)
+        print("State saved.")
+
+    _print_summary({
+        "corpus_posts": len(corpus["posts"]),
+        "corpus_comments": len(corpus["comments"]),
+        "rematch_matches": len(rematches),
+    })
+
+
+def run_steady_state(config, dry_run=False, cassette=None):
     """Daily steady-state mode: fetch new, dedup, match, route, comment."""
     state = load_state(STATE_PATH)
     if not state["backfill_complete"]:
@@ -73,22 +302,25 @@ def run_steady_state(config, dry_run=False):
         sys.exit(1)
 
     repo = config["github"]["repo"]
-    category_id = config["github"]["discussion_category_id"]
 
     # Load issues for matching
     issues = load_unverified_issues(repo)
-    matcher = Matcher(config)
+    keyword_automaton = KeywordAutomaton(config)
+    matcher = Matcher(config, keyword_automaton=keyword_automaton)
     matcher.issues = issues
+    score_cache = open_score_cache(config, matcher)
+    corpus = load_corpus(CORPUS_PATH)
+    corpus_max_items = config["reddit"].get("corpus_max_items")
 
-    fetcher = RedditFetcher(config)
+    fetcher = open_fetcher(config, cassette)
     digest_gen = DigestGenerator()
-    nc_detector = NewContentDetector(config)
+    nc_detector = NewContentDetector(config, keyword_automaton=keyword_automaton)
     nc_config = config.get("new_content", {})
     max_nc_issues = nc_config.get("max_issues_steady", 1)
     nc_labels = nc_config.get("labels", ["content-opportunity"])
 
-    all_matches = []
-    all_posts_raw = {}  # Accumulate raw posts for new content detection
+    all_matches = []  # auto_comment and triage matches, for the digest
+    opportunities = TopOpportunities(nc_detector, max_nc_issues)
     stats = {
         "posts_scanned": 0,
         "comments_scanned": 0,
@@ -97,164 +329,182 @@ def run_steady_state(config, dry_run=False):
         "cross_references": 0,
         "skipped": 0,
         "new_content": 0,
+        "rematch_matches": 0,
+        "listing_pages": 0,
+        "issue_comments_posted": 0,
     }
 
+    # Give new or edited issues a pass over previously seen items first
+    rematches = rematch_changed_issues(
+        config, state, corpus, issues, dry_run=dry_run,
+        keyword_automaton=keyword_automaton,
+    )
+    stats["rematch_matches"] = len(rematches)
+    # (reddit_id, match) auto_comment matches, posted after one dedup pre-flight
+    pending_comments = list(rematches)
+
     comment_targets = []
 
-    for sub in config["reddit"]["subreddits"]:
-        print(f"Fetching r/{sub}...")
-        posts, _ = fetcher.fetch_new_posts(sub)
+    subreddits = config["reddit"]["subreddits"]
+    print(f"Fetching r/{', r/'.join(subreddits)} back to the last run...")
+    fetched = fetcher.fetch_until_seen_many(
+        subreddits,
+        lambda post_id: is_seen(state, post_id, kind="post"),
+        {sub: get_watermark(state, sub) for sub in subreddits},
+    )
 
-        for post in posts:
-            stats["posts_scanned"] += 1
-            if is_seen(state, post["id"], kind="post"):
-                stats["skipped"] += 1
-                continue
+    def listing_pages():
+        for sub, (posts, pages) in fetched.items():
+            print(f"  r/{sub}: {len(posts)} posts from {pages} page(s)")
+            stats["listing_pages"] += pages
+            yield sub, posts
+
+    posts = counted(page_items(listing_pages(), state), stats, "posts_scanned")
+    posts = unseen(posts, state, "post", stats)
+    for post, match in tally(match_items(posts, matcher.find_matches, matcher.batch_size), stats):
+        sub = post["subreddit"]
+        if match["routing"] == "auto_comment":
+            pending_comments.append((post["id"], match))
+            if dry_run:
+                print(f"  [MATCH] #{match['issue']} <- r/{sub}/u/{post['author']}: {post['title']}")
+            all_matches.append(match)
+            opportunities.offer(post, match)
+            # Track for comment extraction
+            comment_targets.append({
+                "subreddit": post["subreddit"],
+                "post_id": post["id"],
+                "title": post.get("title", ""),
+            })
+
+        elif match["routing"] == "triage":
+            all_matches.append(match)
+            opportunities.offer(post, match)
+            if dry_run:
+                print(f"  [TRIAGE] r/{sub}/u/{post['author']}: {post['title']}")
 
-            all_posts_raw[post["id"]] = post
+        mark_seen(state, post["id"], kind="post", timestamp=post.get("created_utc"))
+        record_item(corpus, post, kind="post", max_items=corpus_max_items)
 
-            # Match against issues
-            matches = matcher.find_matches([post])
-            for match in matches:
+    # Fetch comments for newly matched posts
+    if comment_targets:
+        print(f"Fetching comments for {len(comment_targets)} matched posts...")
+        fetched = fetcher.fetch_comments_many(
+            [(target["subreddit"], target["post_id"]) for target in comment_targets]
+        )
+        for target, comments in zip(comment_targets, fetched):
+            if isinstance(comments, Exception):
+                raise comments
+            pairs = match_items(unseen(comments, state, "comment"),
+                                matcher.find_matches, matcher.batch_size)
+            for comment, match in tally(pairs, stats):
+                match["parent_title"] = target["title"]
                 if match["routing"] == "auto_comment":
-                    stats["matches"] += 1
-                    # Check for duplicate comment
-                    if not dry_run and not github_api.check_existing_comment(
-                        match["issue"], post["id"], repo=repo
-                    ):
-                        comment = format_issue_comment(match)
-                        github_api.post_issue_comment(
-                            match["issue"], comment, repo=repo, dry_run=dry_run
-                        )
-                    elif dry_run:
-                        print(f"  [MATCH] #{match['issue']} <- r/{sub}/u/{post['author']}: {post['title']}")
+                    pending_comments.append((comment["id"], match))
+                    if dry_run:
+                        print(f"  [COMMENT MATCH] #{match['issue']} <- reply by u/{comment['author']}")
                     all_matches.append(match)
-                    # Track for comment extraction
-                    comment_targets.append({
-                        "subreddit": post["subreddit"],
-                        "post_id": post["id"],
-                        "title": post.get("title", ""),
-                    })
-
                 elif match["routing"] == "triage":
-                    stats["triage_items"] += 1
                     all_matches.append(match)
-                    if dry_run:
-                        print(f"  [TRIAGE] r/{sub}/u/{post['author']}: {post['title']}")
-
-                else:
-                    stats["skipped"] += 1
-
-                if match.get("cross_references"):
-                    stats["cross_references"] += len(match["cross_references"])
-
-            mark_seen(state, post["id"], kind="post", timestamp=post.get("created_utc"))
-
-    # Fetch comments for newly matched posts
-    if comment_targets:
-        print(f"Fetching comments for {len(comment_targets)} matched posts...")
-        for target in comment_targets:
-            comments = fetcher.fetch_post_comments(target["subreddit"], target["post_id"])
-            for comment in comments:
-                if is_seen(state, comment["id"], kind="comment"):
-                    continue
-                comment_matches = matcher.find_matches([comment])
-                for match in comment_matches:
-                    match["parent_title"] = target["title"]
-                    if match["routing"] == "auto_comment":
-                        stats["matches"] += 1
-                        if not dry_run and not github_api.check_existing_comment(
-                            match["issue"], comment["id"], repo=repo
-                        ):
-                            formatted = format_issue_comment(match)
-                            github_api.post_issue_comment(
-                                match["issue"], formatted, repo=repo, dry_run=dry_run
-                            )
-                        elif dry_run:
-                            print(f"  [COMMENT MATCH] #{match['issue']} <- reply by u/{comment['author']}")
-                        all_matches.append(match)
-                    elif match["routing"] == "triage":
-                        stats["triage_items"] += 1
-                        all_matches.append(match)
-                    else:
-                        stats["skipped"] += 1
-
-                    if match.get("cross_references"):
-                        stats["cross_references"] += len(match["cross_references"])
 
                 mark_seen(state, comment["id"], kind="comment",
                           timestamp=comment.get("created_utc"))
+                record_item(corpus, comment, kind="comment", max_items=corpus_max_items)
             stats["comments_scanned"] += len(comments)
 
+    if not dry_run:
+        ledger = open_post_ledger(config)
+        stats["issue_comments_posted"] = post_match_comments(pending_comments, repo, ledger)
+        stats.update(ledger.stats())
+
     # New content detection on unmatched posts
     new_content_opps = []
-    if all_posts_raw:
-        opportunities = nc_detector.assess_unmatched(all_matches, all_posts_raw)
-        qualified = [o for o in opportunities if o["score"] >= nc_detector.min_score]
-        if qualified:
-            print(f"New content: {len(qualified)} opportunities detected (max {max_nc_issues} issues)")
-            for opp in qualified[:max_nc_issues]:
-                title = nc_detector.format_issue_title(opp)
-                body = nc_detector.format_issue_body(opp)
-                # Dedup: check if similar issue already exists
-                existing = github_api.search_issues(
-                    opp["title"][:60], nc_labels, repo=repo
-                )
-                if existing:
-                    if dry_run:
-                        print(f"  [DEDUP] Skipping — similar issue exists: #{existing[0]['number']}")
-                    continue
+    qualified = opportunities.ranked()
+    if qualified:
+        print(f"New content: {opportunities.qualified} opportunities detected (max {max_nc_issues} issues)")
+        for opp in qualified[:max_nc_issues]:
+            title = nc_detector.format_issue_title(opp)
+            body = nc_detector.format_issue_body(opp)
+            # Dedup: check if similar issue already exists
+            existing = github_api.search_issues(
+                opp["title"][:60], nc_labels, repo=repo
+            )
+            if existing:
                 if dry_run:
-                    print(f"  [NEW CONTENT] {title} (score: {opp['score']})")
-                else:
-                    success, issue_num = github_api.create_issue(
-                        title, body, nc_labels, repo=repo, dry_run=dry_run
-                    )
-                    if success and issue_num:
-                        print(f"  Created issue #{issue_num}: {title}")
-                stats["new_content"] += 1
-                new_content_opps.append(opp)
+                    print(f"  [DEDUP] Skipping — similar issue exists: #{existing[0]['number']}")
+                continue
+            if dry_run:
+                print(f"  [NEW CONTENT] {title} (score: {opp['score']})")
+            else:
+                success, issue_num = github_api.create_issue(
+                    title, body, nc_labels, repo=repo, dry_run=dry_run
+                )
+                if success and issue_num:
+                    print(f"  Created issue #{issue_num}: {title}")
+            stats["new_content"] += 1
+            new_content_opps.append(opp)
 
     # Weekly digest check
     if digest_gen.should_post_digest():
         print("Sunday — generating weekly digest...")
         digest = digest_gen.generate_digest(all_matches, stats)
         title = digest_gen.digest_title()
-        success, _ = github_api.post_discussion(title, digest, category_id, repo=repo, dry_run=dry_run)
+        success, _ = github_api.post_discussion(
+            title, digest, discussion_category(config), repo=repo, dry_run=dry_run
+        )
 
     # Save state
     state["last_run"] = datetime.now(tz=timezone.utc).isoformat()
+    if issues:  # Keep the last snapshot if the issue fetch failed
+        record_issue_snapshot(state, issues)
     if not dry_run:
         save_state(STATE_PATH, state)
+        save_corpus(CORPUS_PATH, corpus, max_items=corpus_max_items)
         print(f"State saved. Processed {stats['posts_scanned']} posts.")
     else:
         print(f"\n[DRY RUN] Would save state. Processed {stats['posts_scanned']} posts.")
 
+    if score_cache:
+        score_cache.save()
+        stats.update(score_cache.stats())
+    stats["fuzzy_calls"] = matcher.fuzzy_calls
+    stats["fuzzy_calls_avoided"] = matcher.fuzzy_calls_avoided
+    stats.update(fetcher.timing_summary())
+    stats.update(fetcher.rate_summary())
+    if cassette is not None:
+        stats.update(cassette.stats())
+
     _print_summary(stats)
 
 
-def run_backfill(config, dry_run=False):
-    """Backfill mode: two-pass — match posts, then fetch comments for triage+ posts."""
+def run_backfill(config, dry_run=False, workers=1, cassette=None):
+    """Backfill mode: two-pass — match posts, then fetch comments for triage+ posts.
+
+    With workers != 1, PASS 1 matching runs on a process pool (0 = one
+    worker per CPU). cassette, if given, records or replays Reddit traffic.
+    """
     state = load_state(STATE_PATH)
     repo = config["github"]["repo"]
-    category_id = config["github"]["discussion_category_id"]
     cross_ref_targets = config["github"].get("cross_ref_targets", {})
     triage_threshold = config["matching"]["thresholds"]["low"]
 
     issues = load_unverified_issues(repo)
-    matcher = Matcher(config)
+    keyword_automaton = KeywordAutomaton(config)
+    matcher = Matcher(config, keyword_automaton=keyword_automaton)
     matcher.issues = issues
+    score_cache = open_score_cache(config, matcher)
+    corpus = load_corpus(CORPUS_PATH)
+    corpus_max_items = config["reddit"].get("corpus_max_items")
 
-    fetcher = RedditFetcher(config)
+    fetcher = open_fetcher(config, cassette)
     digest_gen = DigestGenerator()
-    nc_detector = NewContentDetector(config)
+    nc_detector = NewContentDetector(config, keyword_automaton=keyword_automaton)
     nc_config = config.get("new_content", {})
     max_nc_issues = nc_config.get("max_issues_backfill", 5)
     nc_labels = nc_config.get("labels", ["content-opportunity"])
 
-    all_matches = []
-    all_posts_raw = {}  # Accumulate raw posts for new content detection
-    comment_targets = []  # posts scoring >= triage threshold
+    all_matches = []  # auto_comment and triage matches, for the digest
+    opportunities = TopOpportunities(nc_detector, max_nc_issues)
+    comment_targets = {}  # post_id -> target, for posts scoring >= triage threshold
     stats = {
         "posts_scanned": 0,
         "comments_scanned": 0,
@@ -265,99 +515,89 @@ def run_backfill(config, dry_run=False):
         "new_content": 0,
     }
 
-    # PASS 1: Score all posts against issues
-    for sub in config["reddit"]["subreddits"]:
-        print(f"Backfilling r/{sub}...")
-        posts = fetcher.backfill(sub)
-        print(f"  Fetched {len(posts)} posts")
-
-        for post in posts:
-            stats["posts_scanned"] += 1
-            all_posts_raw[post["id"]] = post
-
-            matches = matcher.find_matches([post])
-            for match in matches:
-                if match["routing"] in ("auto_comment", "triage"):
-                    if match["routing"] == "auto_comment":
-                        stats["matches"] += 1
-                    else:
-                        stats["triage_items"] += 1
-                    all_matches.append(match)
-                    # Track posts above triage threshold for comment extraction
-                    if match["score"] >= triage_threshold:
-                        comment_targets.append({
-                            "subreddit": post["subreddit"],
-                            "post_id": post["id"],
-                            "title": post.get("title", ""),
-                        })
-                else:
-                    stats["skipped"] += 1
-
-                if match.get("cross_references"):
-                    stats["cross_references"] += len(match["cross_references"])
+    # PASS 1: Score posts against issues as listing pages arrive
+    subreddits = config["reddit"]["subreddits"]
+    print(f"Backfilling r/{', r/'.join(subreddits)}...")
+    fetched_counts = {}
+    pages = fetcher.iter_backfill(
+        subreddits, buffer_pages=config["reddit"].get("backfill_buffer_pages", 4)
+    )
+    posts = counted(page_items(pages, state, fetched_counts), stats, "posts_scanned")
+
+    # Posts are matched a batch at a time (one result per post, in order)
+    pool = None
+    find_matches, batch_size = matcher.find_matches, matcher.batch_size
+    if workers != 1:
+        pool = MatcherPool(config, issues, workers=workers, score_cache=score_cache)
+        print(f"Matching posts across {pool.workers} worker processes...")
+        find_matches, batch_size = pool.find_matches, matcher.batch_size * pool.workers
+    try:
+        for post, match in tally(match_items(posts, find_matches, batch_size), stats):
+            if match["routing"] in ("auto_comment", "triage"):
+                all_matches.append(match)
+                opportunities.offer(post, match)
+                # Track posts above triage threshold for comment extraction
+                if match["score"] >= triage_threshold:
+                    comment_targets.setdefault(post["id"], {
+                        "subreddit": post["subreddit"],
+                        "post_id": post["id"],
+                        "title": post.get("title", ""),
+                    })
 
             # Seed state with all seen posts
             mark_seen(state, post["id"], kind="post", timestamp=post.get("created_utc"))
+            record_item(corpus, post, kind="post", max_items=corpus_max_items)
+    finally:
+        if pool is not None:
+            pool.close()
+    for sub in subreddits:
+        print(f"  r/{sub}: fetched {fetched_counts.get(sub, 0)} posts")
 
     # PASS 2: Fetch comments for posts that scored above triage threshold
     if comment_targets:
-        # Deduplicate targets (a post may match multiple issues)
-        seen_targets = set()
-        unique_targets = []
-        for t in comment_targets:
-            if t["post_id"] not in seen_targets:
-                seen_targets.add(t["post_id"])
-                unique_targets.append(t)
-
+        unique_targets = list(comment_targets.values())
         print(f"\nPass 2: Fetching comments for {len(unique_targets)} matched posts...")
         consecutive_failures = 0
-        for i, target in enumerate(unique_targets):
-            try:
-                comments = fetcher.fetch_post_comments(target["subreddit"], target["post_id"])
-                consecutive_failures = 0
-            except Exception as e:
-                consecutive_failures += 1
-                print(f"  Warning: Failed to fetch comments for {target['post_id']}: {e}")
-                if consecutive_failures >= 3:
-                    cooldown = 60 * consecutive_failures
-                    print(f"  {consecutive_failures} consecutive failures — cooling down {cooldown}s...")
-                    time.sleep(cooldown)
-                continue
-            for comment in comments:
-                if is_seen(state, comment["id"], kind="comment"):
+        for start in range(0, len(unique_targets), COMMENT_FETCH_CHUNK):
+            chunk = unique_targets[start:start + COMMENT_FETCH_CHUNK]
+            if consecutive_failures >= 3:
+                cooldown = 60 * consecutive_failures
+                print(f"  {consecutive_failures} consecutive failures — cooling down {cooldown}s...")
+                time.sleep(cooldown)
+            results = fetcher.fetch_comments_many(
+                [(target["subreddit"], target["post_id"]) for target in chunk]
+            )
+            for target, comments in zip(chunk, results):
+                if isinstance(comments, Exception):
+                    consecutive_failures += 1
+                    print(f"  Warning: Failed to fetch comments for {target['post_id']}: {comments}")
                     continue
-                # Match comment independently against all issues
-                comment_matches = matcher.find_matches([comment])
-                for match in comment_matches:
+                consecutive_failures = 0
+                # Match each unseen comment independently against all issues
+                pairs = match_items(unseen(comments, state, "comment"),
+                                    matcher.find_matches, matcher.batch_size)
+                for comment, match in tally(pairs, stats):
                     if match["routing"] in ("auto_comment", "triage"):
                         # Attach parent post title for formatting
                         match["parent_title"] = target["title"]
-                        if match["routing"] == "auto_comment":
-                            stats["matches"] += 1
-                        else:
-                            stats["triage_items"] += 1
                         all_matches.append(match)
-                    else:
-                        stats["skipped"] += 1
-
-                    if match.get("cross_references"):
-                        stats["cross_references"] += len(match["cross_references"])
 
-                mark_seen(state, comment["id"], kind="comment",
-                          timestamp=comment.get("created_utc"))
-            stats["comments_scanned"] += len(comments)
+                    mark_seen(state, comment["id"], kind="comment",
+                              timestamp=comment.get("created_utc"))
+                    record_item(corpus, comment, kind="comment", max_items=corpus_max_items)
+                stats["comments_scanned"] += len(comments)
 
-            if (i + 1) % 50 == 0:
-                print(f"  Processed {i + 1}/{len(unique_targets)} posts' comments...")
+            done = start + len(chunk)
+            if done % 50 == 0:
+                print(f"  Processed {done}/{len(unique_targets)} posts' comments...")
 
         print(f"  Scanned {stats['comments_scanned']} comments total")
 
     # PASS 2.5: New content detection on unmatched posts
     new_content_opps = []
-    print(f"\nPass 2.5: Detecting new content opportunities from {len(all_posts_raw)} posts...")
-    opportunities = nc_detector.assess_unmatched(all_matches, all_posts_raw)
-    qualified = [o for o in opportunities if o["score"] >= nc_detector.min_score]
-    print(f"  {len(qualified)} qualified opportunities (score >= {nc_detector.min_score})")
+    print(f"\nPass 2.5: Ranking new content opportunities from {stats['posts_scanned']} posts...")
+    qualified = opportunities.ranked()
+    print(f"  {opportunities.qualified} qualified opportunities (score >= {nc_detector.min_score})")
 
     for opp in qualified[:max_nc_issues]:
         title = nc_detector.format_issue_title(opp)
@@ -390,19 +630,45 @@ def run_backfill(config, dry_run=False):
     if dry_run:
         _print_dry_run_outputs(outputs, cross_ref_targets)
     else:
-        _post_backfill_outputs(outputs, category_id, repo, cross_ref_targets)
-        state["backfill_complete"] = True
-        state["last_run"] = datetime.now(tz=timezone.utc).isoformat()
-        save_state(STATE_PATH, state)
-        print("Backfill complete. State saved.")
+        # State is saved once every write is queued; the queue outlives a killed run
+        queue = open_post_queue(config, open_post_ledger(config))
+        if _queue_backfill_outputs(outputs, discussion_category(config), repo,
+                                   cross_ref_targets, queue):
+            state["backfill_complete"] = True
+            state["last_run"] = datetime.now(tz=timezone.utc).isoformat()
+            if issues:  # Keep the last snapshot if the issue fetch failed
+                record_issue_snapshot(state, issues)
+            save_state(STATE_PATH, state)
+            save_corpus(CORPUS_PATH, corpus, max_items=corpus_max_items)
+            print("Backfill complete. State saved.")
+            if queue.pending():
+                print(f"Posting {len(queue.pending())} queued comments...")
+                stats.update(queue.run())
+        else:
+            # Nothing was queued; leave backfill_complete unset so the next run retries
+            print("Backfill incomplete. State not saved.")
+
+    if score_cache:
+        score_cache.save()
+        stats.update(score_cache.stats())
+    stats["fuzzy_calls"] = matcher.fuzzy_calls
+    stats["fuzzy_calls_avoided"] = matcher.fuzzy_calls_avoided
+    if pool is not None:
+        stats["fuzzy_calls"] += pool.fuzzy_calls
+        stats["fuzzy_calls_avoided"] += pool.fuzzy_calls_avoided
+    stats.update(fetcher.timing_summary())
+    stats.update(fetcher.rate_summary())
+    if cassette is not None:
+        stats.update(cassette.stats())
 
     _print_summary(stats)
 
 
-def _post_backfill_outputs(outputs, category_id, repo, cross_ref_targets):
-    """Post multi-tier backfill outputs to GitHub."""
-    rate_delay = 1.5  # seconds between API calls
+def _queue_backfill_outputs(outputs, category_id, repo, cross_ref_targets, queue):
+    """Post the backfill summary discussion and queue every other output.
 
+    Returns False if the summary discussion could not be created.
+    """
     # 1. Post summary dashboard discussion
     title = f"[Reddit Monitor] Backfill Report — {datetime.now(tz=timezone.utc).strftime('%Y-%m-%d')}"
     success, discussion_id = github_api.post_discussion(
@@ -410,49 +676,34 @@ def _post_backfill_outputs(outputs, category_id, repo, cross_ref_targets):
     )
     if not success:
         print("ERROR: Failed to create summary discussion. Aborting.")
-        return
-
-    # 2. Post matched items as batched comments on each unverified issue
-    issue_comments = outputs["issue_comments"]
-    if issue_comments:
-        print(f"Posting matched items to {len(issue_comments)} issues...")
-        for issue_num, comments in issue_comments.items():
-            if isinstance(comments, list):
-                for comment in comments:
-                    github_api.post_issue_comment(issue_num, comment, repo=repo)
-                    time.sleep(rate_delay)
-            else:
-                github_api.post_issue_comment(issue_num, comments, repo=repo)
-                time.sleep(rate_delay)
-
-    # 3. Post triage items as paginated discussion comments
-    triage_comments = outputs["triage_comments"]
-    if triage_comments and discussion_id:
-        print(f"Posting {len(triage_comments)} triage comment pages...")
-        for comment in triage_comments:
-            github_api.post_discussion_comment(discussion_id, comment, repo=repo)
-            time.sleep(rate_delay)
+        return False
+
+    # 2. Matched items as batched comments on each unverified issue
+    for issue_num, comments in outputs["issue_comments"].items():
+        if not isinstance(comments, list):
+            comments = [comments]
+        for comment in comments:
+            queue.add("issue_comment", issue_num, comment)
+
+    # 3. Triage items and 4. new content opportunities as paginated
+    # discussion comments
+    if discussion_id:
+        for comment in outputs["triage_comments"]:
+            queue.add("discussion_comment", discussion_id, comment)
+        for comment in outputs.get("new_content_comments", []):
+            queue.add("discussion_comment", discussion_id, comment)
+
+    # 5. Cross-references on sibling monitor issues
+    for ref_type, comments in outputs["cross_ref_comments"].items():
+        target_issue = cross_ref_targets.get(ref_type)
+        if not target_issue:
+            print(f"  Warning: No target issue configured for {ref_type} cross-refs")
+            continue
+        for comment in comments:
+            queue.add("issue_comment", target_issue, comment)
 
-    # 4. Post new content opportunity comments on discussion
-    new_content_comments = outputs.get("new_content_comments", [])
-    if new_content_comments and discussion_id:
-        print(f"Posting {len(new_content_comments)} new content comment pages...")
-        for comment in new_content_comments:
-            github_api.post_discussion_comment(discussion_id, comment, repo=repo)
-            time.sleep(rate_delay)
-
-    # 5. Post cross-references on sibling monitor issues
-    cross_ref_comments = outputs["cross_ref_comments"]
-    if cross_ref_comments:
-        print("Posting cross-references to sibling issues...")
-        for ref_type, comments in cross_ref_comments.items():
-            target_issue = cross_ref_targets.get(ref_type)
-            if not target_issue:
-                print(f"  Warning: No target issue configured for {ref_type} cross-refs")
-                continue
-            for comment in comments:
-                github_api.post_issue_comment(target_issue, comment, repo=repo)
-                time.sleep(rate_delay)
+    queue.save()
+    return True
 
 
 def _print_dry_run_outputs(outputs, cross_ref_targets):
@@ -495,7 +746,7 @@ def main():
     parser = argparse.ArgumentParser(description="Aurora community source monitor")
     parser.add_argument(
         "--mode",
-        choices=["steady-state", "backfill", "dry-run"],
+        choices=["steady-state", "backfill", "dry-run", "rematch"],
         default="steady-state",
         help="Run mode (default: steady-state)",
     )
@@ -504,16 +755,89 @@ def main():
         action="store_true",
         help="Process but don't post or save state",
     )
+    parser.add_argument(
+        "--scoring-backend",
+        choices=sorted(Matcher.SCORING_BACKENDS),
+        help="Override matching.scoring_backend (rapidfuzz scores each batch "
+             "of posts as one multi-core score matrix)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for backfill matching (default: 1, 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve every Reddit request from the local response cache; "
+             "uncached URLs fail instead of hitting the network",
+    )
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record every Reddit request and gh call to a gzip cassette file",
+    )
+    cassette_group.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Serve Reddit requests and gh calls from a recorded cassette, offline",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        metavar="MS",
+        help="Milliseconds each replayed exchange takes (default: as recorded)",
+    )
+    parser.add_argument(
+        "--debug-http",
+        action="store_true",
+        help="Print a connect/TLS/TTFB/body timing line for every Reddit request",
+    )
     args = parser.parse_args()
+    if args.workers < 0:
+        parser.error("--workers must be >= 0")
 
     config = load_config()
+    if args.scoring_backend:
+        config["matching"]["scoring_backend"] = args.scoring_backend
+    if args.debug_http:
+        config["reddit"]["debug_http"] = True
+    if args.offline:
+        config["reddit"]["offline"] = True
 
     dry_run = args.dry_run or args.mode == "dry-run"
 
-    if args.mode == "backfill":
-        run_backfill(config, dry_run=dry_run)
-    else:
-        run_steady_state(config, dry_run=dry_run)
+    cassette = None
+    if args.record:
+        cassette = Cassette(args.record, "record")
+    elif args.replay:
+        latency = args.replay_latency / 1000 if args.replay_latency is not None else None
+        cassette = Cassette.load(args.replay, latency=latency)
+    github_api.cassette = cassette
+    client = open_github_client(config, cassette)
+    node_ids = open_node_id_cache(config, cassette)
+
+    start = time.perf_counter()
+    try:
+        if not dry_run:
+            resume_post_queue(config)
+        if args.mode == "backfill":
+            run_backfill(config, dry_run=dry_run, workers=args.workers, cassette=cassette)
+        elif args.mode == "rematch":
+            run_rematch(config, dry_run=dry_run)
+        else:
+            run_steady_state(config, dry_run=dry_run, cassette=cassette)
+    finally:
+        if cassette is not None and cassette.mode == "record":
+            cassette.save()
+            print(f"Recorded {len(cassette.http)} HTTP and {len(cassette.commands)} "
+                  f"gh exchanges to {cassette.path}")
+    node_ids.save()
+    if client is not None:
+        print(f"GitHub API: {client.requests} requests over one session")
+    print(f"Run time: {time.perf_counter() - start:.2f}s")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,408 @@
+"""Matcher and new content detection throughput benchmark.
+
+Builds synthetic posts, comments and issues from the tests/fixtures
+vocabulary at fixed sizes, times Matcher.find_matches and
+NewContentDetector.score_new_content / map_to_chapters, and writes the
+results as JSON so runs can be compared across commits. With --recall it
+also checks the configured candidate index offline against brute-force
+scores; with --record-memory it compares the memory held by items and
+match results as plain dicts and as slotted records.
+
+Usage:
+    python -m aurora_monitor.benchmark [--sizes 1k 10k] [--output bench.json]
+        [--seed 0] [--latency-sample 500] [--scoring-backend rapidfuzz]
+        [--recall] [--index-method minhash] [--record-memory]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import re
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import yaml
+
+from aurora_monitor.keywords import KeywordAutomaton
+from aurora_monitor.matcher import Matcher
+from aurora_monitor.new_content import NewContentDetector
+from aurora_monitor.records import Comment, MatchResult, Post
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, "config.yaml")
+FIXTURES_DIR = os.path.join(BASE_DIR, "tests", "fixtures")
+
+# Size name -> (posts and comments, issues)
+SIZES = {
+    "1k": (1000, 100),
+    "10k": (10000, 500),
+    "100k": (100000, 2000),
+}
+
+# Share of synthetic items generated as comments rather than posts
+COMMENT_RATIO = 0.3
+
+
+def load_vocabulary(fixtures_dir=FIXTURES_DIR):
+    """Collect words and authors from the fixture posts and issues."""
+    words = []
+    authors = set()
+    for name in ("reddit_posts.json", "new_content_posts.json"):
+        with open(os.path.join(fixtures_dir, name)) as f:
+            for post in json.load(f):
+                words.extend(re.findall(r"\S+", f"{post.get('title', '')} {post.get('selftext', '')}"))
+                authors.add(post.get("author", "[deleted]"))
+    with open(os.path.join(fixtures_dir, "github_issues.json")) as f:
+        for issue in json.load(f):
+            words.extend(re.findall(r"\S+", f"{issue['title']} {issue.get('body') or ''}"))
+    return words, sorted(authors)
+
+
+def synthetic_issues(count, words, rng):
+    """Build unverified issues with fixture-like titles and body lengths."""
+    issues = []
+    for number in range(1, count + 1):
+        section = f"{rng.randint(1, 18)}.{rng.randint(1, 9)}"
+        title = f"Verify: [{section}] {' '.join(rng.choices(words, k=rng.randint(4, 10)))}"
+        body = " ".join(rng.choices(words, k=rng.randint(15, 120)))
+        issues.append({"number": number, "title": title, "body": body,
+                       "labels": [{"name": "unverified"}]})
+    return issues
+
+
+def synthetic_items(count, words, authors, rng):
+    """Build a mix of normalized posts and comments, about COMMENT_RATIO comments."""
+    items = []
+    for n in range(count):
+        item = {
+            "id": f"bench{n}",
+            "subreddit": "aurora4x",
+            "author": rng.choice(authors),
+            "permalink": f"/r/aurora4x/comments/bench{n}/",
+            "created_utc": 1708000000 + n,
+        }
+        if rng.random() < COMMENT_RATIO:
+            item["body"] = " ".join(rng.choices(words, k=rng.randint(3, 80)))
+            item["link_id"] = item["parent_id"] = f"t3_bench{rng.randrange(max(n, 1))}"
+        else:
+            item["title"] = " ".join(rng.choices(words, k=rng.randint(3, 14)))
+            item["selftext"] = " ".join(rng.choices(words, k=rng.randint(0, 150)))
+        items.append(item)
+    return items
+
+
+def _percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _latency_stats(latencies):
+    """Summarize per-post latencies in milliseconds."""
+    return {
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 4),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 4),
+    }
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process so far, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _time_per_item(func, items):
+    """Call func on each item; return (total seconds, per-item seconds)."""
+    latencies = []
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        latencies.append(time.perf_counter() - start)
+    return sum(latencies), latencies
+
+
+def measure_recall(config, issues, items):
+    """Check the configured candidate index against a brute-force full scan.
+
+    For every item whose best full-scan score reaches thresholds.medium
+    (auto_comment routing), checks whether the index returns that issue as
+    a candidate. Also reports the mean share of issues returned as
+    candidates, how often find_matches behind the index picks the same
+    routing and issue as the full scan (routing_agreement) and the same
+    issue and score too (result_agreement), and the fuzzy calls
+    find_matches makes with and without the index.
+    """
+    indexed = Matcher(config)
+    indexed.issues = issues
+    full = Matcher({
+        **config,
+        "matching": {**config["matching"], "candidate_index": {"enabled": False}},
+    })
+    full.issues = issues
+    medium = config["matching"]["thresholds"]["medium"]
+
+    relevant = 0
+    retrieved = 0
+    candidate_counts = []
+    for item in items:
+        prepared = indexed._prepare_post(item)
+        candidates = indexed._candidate_issues(prepared)
+        candidate_counts.append(len(candidates))
+        scores = full._score_issues(prepared, full._corpus)
+        if not scores:
+            continue
+        best_issue, best_score = max(scores, key=lambda pair: pair[1])
+        if best_score >= medium:
+            relevant += 1
+            retrieved += any(c.issue is best_issue for c in candidates)
+
+    indexed.fuzzy_calls = full.fuzzy_calls = 0
+    pairs = list(zip(indexed.find_matches(items), full.find_matches(items)))
+    routed = sum((a["routing"], a["issue"]) == (b["routing"], b["issue"]) for a, b in pairs)
+    agreement = sum((a["issue"], a["score"]) == (b["issue"], b["score"]) for a, b in pairs)
+    return {
+        "method": indexed.index_config.get("method", "tokens")
+        if indexed.index_config.get("enabled", True) else "disabled",
+        "auto_comment_posts": relevant,
+        "recall": round(retrieved / relevant, 4) if relevant else None,
+        "mean_candidate_fraction": round(
+            sum(candidate_counts) / (len(items) * len(issues)), 4
+        ) if items and issues else None,
+        "routing_agreement": round(routed / len(items), 4) if items else None,
+        "result_agreement": round(agreement / len(items), 4) if items else None,
+        "fuzzy_calls": indexed.fuzzy_calls,
+        "full_scan_fuzzy_calls": full.fuzzy_calls,
+    }
+
+
+def _retained_bytes(build):
+    """Bytes still allocated once build() returns, measured with tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        built = build()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del built
+    return retained
+
+
+def _as_record(item):
+    return Comment.from_dict(item) if "body" in item else Post.from_dict(item)
+
+
+def _match_fields(item):
+    """The fields Matcher.find_matches fills in for an item."""
+    is_comment = "body" in item
+    return {
+        "post_id": item["id"], "subreddit": item["subreddit"], "author": item["author"],
+        "title": item.get("title", ""), "permalink": item["permalink"],
+        "created_utc": item["created_utc"], "score": 0, "routing": "ignore",
+        "issue": None, "issue_title": None, "quote": "", "cross_references": None,
+        "content_type": "comment" if is_comment else "post",
+        "parent_post_id": item["link_id"][3:] if is_comment else None,
+    }
+
+
+def measure_record_memory(items):
+    """Compare memory held by items and match results as dicts and as records.
+
+    Each item is JSON-decoded on its own, as if from its own API page, so
+    repeated strings such as authors are separate objects unless interned.
+    Match results are built over the decoded items, sharing their values.
+    """
+    encoded = [json.dumps(item) for item in items]
+    decoded = [json.loads(text) for text in encoded]
+
+    def compare(dict_bytes, record_bytes):
+        return {
+            "dict_mb": round(dict_bytes / 2 ** 20, 2),
+            "record_mb": round(record_bytes / 2 ** 20, 2),
+            "saved_pct": round(100 * (1 - record_bytes / dict_bytes), 1) if dict_bytes else None,
+        }
+
+    return {
+        "items": len(items),
+        "posts_and_comments": compare(
+            _retained_bytes(lambda: [json.loads(text) for text in encoded]),
+            _retained_bytes(lambda: [_as_record(json.loads(text)) for text in encoded]),
+        ),
+        "match_results": compare(
+            _retained_bytes(lambda: [_match_fields(item) for item in decoded]),
+            _retained_bytes(lambda: [MatchResult(**_match_fields(item)) for item in decoded]),
+        ),
+    }
+
+
+def bench_size(config, num_items, num_issues, seed=0, latency_sample=500,
+               recall=False, record_memory=False):
+    """Benchmark one corpus size. Returns a JSON-serializable dict.
+
+    find_matches is timed as one batch call over every item, which gives
+    pairs/sec; per-post latency comes from single-item calls on the first
+    latency_sample items. New content scoring and chapter mapping are timed
+    per item over the whole corpus.
+    """
+    rng = random.Random(seed)
+    words, authors = load_vocabulary()
+    issues = synthetic_issues(num_issues, words, rng)
+    items = synthetic_items(num_items, words, authors, rng)
+
+    keyword_automaton = KeywordAutomaton(config)
+    matcher = Matcher(config, keyword_automaton=keyword_automaton)
+    start = time.perf_counter()
+    matcher.issues = issues
+    prepare_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher.find_matches(items)
+    match_seconds = time.perf_counter() - start
+    fuzzy_calls = matcher.fuzzy_calls
+    fuzzy_calls_avoided = matcher.fuzzy_calls_avoided
+
+    _, match_latencies = _time_per_item(
+        lambda item: matcher.find_matches([item]), items[:latency_sample]
+    )
+
+    detector = NewContentDetector(config, keyword_automaton=keyword_automaton)
+    nc_seconds, nc_latencies = _time_per_item(detector.score_new_content, items)
+    chapter_seconds, chapter_latencies = _time_per_item(detector.map_to_chapters, items)
+
+    pairs = num_items * num_issues
+    result = {
+        "posts": num_items,
+        "issues": num_issues,
+        "pairs": pairs,
+        "find_matches": {
+            "prepare_issues_seconds": round(prepare_seconds, 4),
+            "seconds": round(match_seconds, 4),
+            "pairs_per_sec": round(pairs / match_seconds, 1) if match_seconds else None,
+            "fuzzy_calls": fuzzy_calls,
+            "fuzzy_calls_avoided": fuzzy_calls_avoided,
+            "latency_sample": len(match_latencies),
+            **_latency_stats(match_latencies),
+        },
+        "score_new_content": {
+            "seconds": round(nc_seconds, 4),
+            "posts_per_sec": round(num_items / nc_seconds, 1) if nc_seconds else None,
+            **_latency_stats(nc_latencies),
+        },
+        "map_to_chapters": {
+            "seconds": round(chapter_seconds, 4),
+            "posts_per_sec": round(num_items / chapter_seconds, 1) if chapter_seconds else None,
+            **_latency_stats(chapter_latencies),
+        },
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    if recall:
+        result["recall"] = measure_recall(config, issues, items)
+    if record_memory:
+        result["record_memory"] = measure_record_memory(items)
+    return result
+
+
+def _git_commit():
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=BASE_DIR,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run_benchmark(config, sizes, seed=0, latency_sample=500, recall=False,
+                  record_memory=False):
+    """Benchmark each named size in order. Returns the full JSON report."""
+    results = {}
+    for name in sizes:
+        num_items, num_issues = SIZES[name]
+        print(f"Benchmarking {name}: {num_items} posts x {num_issues} issues...", file=sys.stderr)
+        results[name] = bench_size(config, num_items, num_issues,
+                                   seed=seed, latency_sample=latency_sample,
+                                   recall=recall, record_memory=record_memory)
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scoring_backend": config["matching"].get("scoring_backend", "thefuzz"),
+        "candidate_index": config["matching"].get("candidate_index", {}),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aurora monitor matching benchmark")
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(SIZES),
+        default=["1k"],
+        help="Corpus sizes to run, in order (default: 1k). Peak RSS is per "
+             "process, so list sizes smallest first.",
+    )
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic corpus seed")
+    parser.add_argument(
+        "--latency-sample",
+        type=int,
+        default=500,
+        help="Posts timed individually for find_matches latency (default: 500)",
+    )
+    parser.add_argument(
+        "--scoring-backend",
+        choices=sorted(Matcher.SCORING_BACKENDS),
+        help="Override matching.scoring_backend",
+    )
+    parser.add_argument(
+        "--recall",
+        action="store_true",
+        help="Also check candidate index recall against a brute-force full scan",
+    )
+    parser.add_argument(
+        "--record-memory",
+        action="store_true",
+        help="Also compare memory held by items and match results as dicts vs slotted records",
+    )
+    parser.add_argument(
+        "--index-method",
+        choices=["tokens", "minhash"],
+        help="Override matching.candidate_index.method",
+    )
+    args = parser.parse_args()
+
+    with open(CONFIG_PATH) as f:
+        config = yaml.safe_load(f)
+    if args.scoring_backend:
+        config["matching"]["scoring_backend"] = args.scoring_backend
+    if args.index_method:
+        config["matching"].setdefault("candidate_index", {})["method"] = args.index_method
+
+    report = run_benchmark(config, args.sizes, seed=args.seed,
+                           latency_sample=args.latency_sample, recall=args.recall,
+                           record_memory=args.record_memory)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Record and replay of Reddit HTTP and GitHub `gh` traffic.
+
+A cassette is a gzip-compressed JSON file of request/response pairs. In
+record mode the Reddit session and `gh` invocations run for real and each
+exchange is captured; in replay mode the same exchanges are served from
+the cassette without touching the network, after a configurable latency,
+so whole monitor runs can be timed reproducibly on an offline machine.
+
+Exchanges are keyed by method, URL and, for requests other than GET, a
+hash of the request body (HTTP), or by argv (`gh`), so GraphQL queries to
+the one endpoint are told apart. Repeats of a key are served in recorded
+order, and the last one is reused once they run out.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+CASSETTE_VERSION = 2
+
+# Headers that describe the wire encoding, not the decoded body we store
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CassetteMiss(Exception):
+    """Raised in replay mode when a request has no recorded exchange."""
+
+
+def _body_hash(request):
+    """SHA-1 of the body of a request other than GET, or None."""
+    if request.method == "GET" or request.body is None:
+        return None
+    body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+    return hashlib.sha1(body).hexdigest()
+
+
+class Cassette:
+    """Recorded HTTP and command exchanges, in record or replay mode.
+
+    latency is the seconds each replayed exchange takes; None replays each
+    at its recorded duration.
+    """
+
+    def __init__(self, path, mode, latency=None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.http = []
+        self.commands = []
+        self.replayed = 0
+        self._lock = threading.Lock()
+        self._index = {}  # (kind, key) -> recorded exchanges, for replay
+        self._cursors = {}
+
+    @classmethod
+    def load(cls, path, latency=None):
+        """Open a recorded cassette for replay."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {path}")
+        cassette = cls(path, "replay", latency=latency)
+        cassette.http = data["http"]
+        cassette.commands = data["commands"]
+        for exchange in cassette.http:
+            key = ("http", (exchange["method"], exchange["url"], exchange["body_sha1"]))
+            cassette._index.setdefault(key, []).append(exchange)
+        for exchange in cassette.commands:
+            cassette._index.setdefault(("command", tuple(exchange["argv"])), []).append(exchange)
+        return cassette
+
+    def save(self):
+        """Write recorded exchanges to path, atomically."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"version": CASSETTE_VERSION, "http": self.http,
+                       "commands": self.commands}, f)
+        os.replace(tmp_path, self.path)
+
+    def install(self, session):
+        """Route session's HTTP(S) requests through this cassette."""
+        for prefix in ("https://", "http://"):
+            session.mount(prefix, CassetteAdapter(self, session.get_adapter(prefix)))
+
+    def _next(self, kind, key):
+        """Take the next recorded exchange for key, reusing the last one."""
+        found = self._index.get((kind, key))
+        if not found:
+            raise CassetteMiss(f"No recorded {kind} exchange for {key}")
+        with self._lock:
+            cursor = self._cursors.get((kind, key), 0)
+            self._cursors[(kind, key)] = cursor + 1
+            self.replayed += 1
+        return found[min(cursor, len(found) - 1)]
+
+    def _wait(self, recorded_seconds):
+        delay = recorded_seconds if self.latency is None else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def run_command(self, cmd, runner):
+        """Run cmd through runner (record) or serve its recorded result (replay).
+
+        runner takes the argv and returns a CompletedProcess with text output.
+        """
+        if self.mode == "replay":
+            exchange = self._next("command", tuple(cmd))
+            self._wait(exchange["seconds"])
+            return subprocess.CompletedProcess(
+                cmd, exchange["returncode"], exchange["stdout"], exchange["stderr"]
+            )
+        start = time.perf_counter()
+        result = runner(cmd)
+        with self._lock:
+            self.commands.append({
+                "argv": list(cmd),
+                "returncode": result.returncode,
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+                "seconds": round(time.perf_counter() - start, 4),
+            })
+        return result
+
+    def stats(self):
+        """Return exchange counts for the run summary."""
+        if self.mode == "replay":
+            return {"cassette_replayed": self.replayed}
+        return {"cassette_recorded": len(self.http) + len(self.commands)}
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter that records through, or replays instead of, another adapter."""
+
+    def __init__(self, cassette, adapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, **kwargs):
+        if self.cassette.mode == "replay":
+            return self._replay(request)
+        start = time.perf_counter()
+        response = self.adapter.send(request, **kwargs)
+        body = response.content  # Reads and decodes the whole body
+        seconds = time.perf_counter() - start
+        self._record(request, response, body, seconds)
+        return response
+
+    def _record(self, request, response, body, seconds):
+        exchange = {
+            "method": request.method,
+            "url": request.url,
+            "body_sha1": _body_hash(request),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items()
+                        if k.lower() not in _WIRE_HEADERS},
+            "seconds": round(seconds, 4),
+        }
+        try:
+            exchange["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            exchange["body_b64"] = base64.b64encode(body).decode("ascii")
+        with self.cassette._lock:
+            self.cassette.http.append(exchange)
+
+    def _replay(self, request):
+        cassette = self.cassette
+        exchange = cassette._next("http", (request.method, request.url, _body_hash(request)))
+        cassette._wait(exchange["seconds"])
+
+        response = requests.Response()
+        response.status_code = exchange["status"]
+        response.reason = exchange["reason"]
+        response.headers = CaseInsensitiveDict(exchange["headers"])
+        if "body_b64" in exchange:
+            response._content = base64.b64decode(exchange["body_b64"])
+        else:
+            response._content = exchange["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        self.adapter.close()
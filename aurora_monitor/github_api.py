@@ -1,17 +1,65 @@
 """GitHub API integration for posting issue comments and discussions.
 
-Uses the `gh` CLI for issue operations and GraphQL for discussions.
+Calls go through an in-process GitHubClient when one is set (see
+github_client), and through the `gh` CLI otherwise: REST-style `gh`
+commands for issues and `gh api graphql` for discussions.
 """
 
 import json
+import os
 import re
 import subprocess
+import time
+
+from aurora_monitor.github_client import GitHubError
 
 
 MAX_COMMENT_LENGTH = 10000
 MAX_DISCUSSION_COMMENT_LENGTH = 65000
 REPO = "ErikEvenson/aurora-manual"
 
+# Optional Cassette recording or replaying every `gh` call; set by the caller
+cassette = None
+# Optional GitHubClient used instead of `gh`; set by the caller
+client = None
+# Optional NodeIdCache memoizing node ID lookups; set by the caller
+node_ids = None
+
+NODE_ID_CACHE_VERSION = 1
+
+
+def run_gh(args):
+    """Run `gh` with args, capturing text output (through cassette, if set)."""
+    cmd = ["gh", *args]
+    if cassette is not None:
+        return cassette.run_command(cmd, _run)
+    return _run(cmd)
+
+
+def _run(cmd):
+    return subprocess.run(cmd, capture_output=True, text=True)
+
+
+def _gh_error(result):
+    """GitHubError for a failed `gh` run; gh reports rate limits only in stderr."""
+    return GitHubError(result.stderr, rate_limited="rate limit" in result.stderr.lower())
+
+
+def _graphql(query):
+    """Run a GraphQL query through client or `gh api graphql`. Returns its data.
+
+    Raises GitHubError on failure with either transport.
+    """
+    if client is not None:
+        return client.graphql(query)
+    result = run_gh(["api", "graphql", "-f", f"query={query}"])
+    if result.returncode != 0:
+        raise _gh_error(result)
+    try:
+        return json.loads(result.stdout)["data"]
+    except (ValueError, KeyError, TypeError):
+        raise GitHubError(f"Unexpected GraphQL response: {result.stdout[:200]}")
+
 
 def _sanitize(text, max_length=MAX_COMMENT_LENGTH):
     """Sanitize text for safe GitHub markdown posting."""
@@ -27,30 +75,42 @@ def _sanitize(text, max_length=MAX_COMMENT_LENGTH):
     return text
 
 
-def post_issue_comment(issue_number, body, repo=REPO, dry_run=False):
-    """Post a comment on a GitHub issue via `gh`."""
+def write_issue_comment(issue_number, body, repo=REPO):
+    """Post a sanitized comment on a GitHub issue. Raises GitHubError on failure."""
     body = _sanitize(body)
+    if client is not None:
+        client.rest("POST", f"repos/{repo}/issues/{issue_number}/comments", body={"body": body})
+        return
+    result = run_gh(["issue", "comment", str(issue_number), "--repo", repo, "--body", body])
+    if result.returncode != 0:
+        raise _gh_error(result)
+
+
+def post_issue_comment(issue_number, body, repo=REPO, dry_run=False):
+    """Post a comment on a GitHub issue."""
     if dry_run:
         print(f"[DRY RUN] Would comment on issue #{issue_number}:")
-        print(body[:200])
+        print(_sanitize(body)[:200])
         return True
-    result = subprocess.run(
-        ["gh", "issue", "comment", str(issue_number),
-         "--repo", repo, "--body", body],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        print(f"Error commenting on issue #{issue_number}: {result.stderr}")
+    try:
+        write_issue_comment(issue_number, body, repo=repo)
+    except GitHubError as e:
+        print(f"Error commenting on issue #{issue_number}: {e}")
         return False
     return True
 
 
 def check_existing_comment(issue_number, reddit_id, repo=REPO):
     """Check if a comment referencing this Reddit ID already exists on the issue."""
-    result = subprocess.run(
-        ["gh", "api", f"repos/{repo}/issues/{issue_number}/comments",
+    if client is not None:
+        try:
+            comments = client.paginate(f"repos/{repo}/issues/{issue_number}/comments")
+        except GitHubError:
+            return False
+        return any(reddit_id in (c.get("body") or "") for c in comments)
+    result = run_gh(
+        ["api", f"repos/{repo}/issues/{issue_number}/comments",
          "--jq", f'[.[] | select(.body | contains("{reddit_id}"))] | length'],
-        capture_output=True, text=True,
     )
     if result.returncode != 0:
         return False
@@ -60,6 +120,184 @@ def check_existing_comment(issue_number, reddit_id, repo=REPO):
         return False
 
 
+# Reddit references in issue comments: a reddit.com comments URL references
+# its last ID (the comment if it has one, otherwise the post), a redd.it
+# short link its post, and a t1_/t3_ fullname its comment or post. Unprefixed
+# IDs are not matched, since they can't be told apart from other words.
+_REDDIT_REFERENCE = re.compile(
+    r"reddit\.com(?:/r/[^/\s)]+)?/comments/(\w+)(?:/[^/\s)]*/(\w+))?"
+    r"|redd\.it/(\w+)"
+    r"|\bt[13]_([a-z0-9]+)\b"
+)
+
+ISSUES_PER_QUERY = 25
+COMMENTS_PER_PAGE = 100
+
+
+class IssueReferences:
+    """Reddit IDs already referenced in comments on each issue.
+
+    Built by fetch_issue_references() in one batched pre-flight, so each
+    duplicate check is a set lookup instead of a `gh api` call that
+    downloads the issue's comments. Issues whose comments could not be
+    fetched fall back to check_existing_comment().
+    """
+
+    def __init__(self, repo=REPO):
+        self.repo = repo
+        self.ids = {}  # issue number -> set of referenced Reddit IDs
+
+    def add_body(self, issue_number, body):
+        ids = self.ids.setdefault(issue_number, set())
+        for post_id, comment_id, short_id, fullname_id in _REDDIT_REFERENCE.findall(body or ""):
+            ids.add(comment_id or post_id or short_id or fullname_id)
+
+    def add(self, issue_number, reddit_id):
+        """Record a reference made by a comment posted this run."""
+        self.ids.setdefault(issue_number, set()).add(reddit_id)
+
+    def has(self, issue_number, reddit_id):
+        if issue_number not in self.ids:
+            return check_existing_comment(issue_number, reddit_id, repo=self.repo)
+        return reddit_id in self.ids[issue_number]
+
+
+def _issue_comments_query(repo, cursors):
+    """GraphQL query for one page of comments on each issue in cursors."""
+    owner, name = repo.split("/")
+    fields = []
+    for number, cursor in cursors.items():
+        after = f', after: "{cursor}"' if cursor else ""
+        fields.append(
+            f"i{number}: issue(number: {number}) {{ comments(first: {COMMENTS_PER_PAGE}{after}) "
+            f"{{ pageInfo {{ hasNextPage endCursor }} nodes {{ body }} }} }}"
+        )
+    return f'query {{ repository(owner: "{owner}", name: "{name}") {{ {" ".join(fields)} }} }}'
+
+
+def fetch_issue_references(issue_numbers, repo=REPO):
+    """Fetch the Reddit IDs referenced on each issue, ISSUES_PER_QUERY per query.
+
+    Issues with more than COMMENTS_PER_PAGE comments are paged in later
+    queries alongside the rest. Returns an IssueReferences.
+    """
+    references = IssueReferences(repo)
+    cursors = {number: None for number in sorted(set(issue_numbers))}
+    while cursors:
+        batch = dict(list(cursors.items())[:ISSUES_PER_QUERY])
+        for number in batch:
+            del cursors[number]
+        try:
+            repository = _graphql(_issue_comments_query(repo, batch))["repository"]
+        except (GitHubError, KeyError, TypeError) as e:
+            # Partly paged issues are dropped too, so they fall back to a full check
+            print(f"Warning: Comment pre-flight failed for {len(batch)} issues: {e}")
+            for number in batch:
+                references.ids.pop(number, None)
+            continue
+        for number in batch:
+            issue = repository.get(f"i{number}")
+            if not issue:
+                continue
+            comments = issue["comments"]
+            for node in comments["nodes"]:
+                references.add_body(number, node["body"])
+            references.ids.setdefault(number, set())
+            if comments["pageInfo"]["hasNextPage"]:
+                cursors[number] = comments["pageInfo"]["endCursor"]
+    return references
+
+
+class NodeIdCache:
+    """GraphQL node IDs (repositories, discussion categories), looked up once.
+
+    Node IDs never change for an object, so each is resolved at most once
+    per run. With a path, IDs are also kept on disk for ttl seconds and
+    reused by later runs.
+    """
+
+    def __init__(self, path=None, ttl=0, clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.entries = {}  # key -> {"id", "resolved_at"}
+        if path:
+            self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            print(f"Warning: Ignoring unreadable node ID cache {self.path}")
+            return
+        if data.get("version") != NODE_ID_CACHE_VERSION:
+            return
+        now = self._clock()
+        self.entries = {key: entry for key, entry in data.get("entries", {}).items()
+                        if now - entry["resolved_at"] < self.ttl}
+
+    def get(self, key, resolve):
+        """Return the ID for key, calling resolve() to look it up on a miss."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry["id"]
+        self.misses += 1
+        node_id = resolve()
+        self.entries[key] = {"id": node_id, "resolved_at": self._clock()}
+        return node_id
+
+    def save(self):
+        """Write the cache atomically, if it has a path."""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": NODE_ID_CACHE_VERSION, "entries": self.entries}, f)
+        os.replace(tmp_path, self.path)
+
+    def stats(self):
+        """Return hit/miss counters for the run summary."""
+        return {"node_id_hits": self.hits, "node_id_lookups": self.misses}
+
+
+def _node_id(key, resolve):
+    if node_ids is None:
+        return resolve()
+    return node_ids.get(key, resolve)
+
+
+def repository_id(repo=REPO):
+    """Node ID of repo. Raises GitHubError if the lookup fails."""
+    owner, name = repo.split("/")
+    return _node_id(f"repository:{repo}", lambda: _graphql(
+        f'query {{ repository(owner: "{owner}", name: "{name}") {{ id }} }}'
+    )["repository"]["id"])
+
+
+def discussion_category_id(slug, repo=REPO):
+    """Node ID of the discussion category with slug. Raises GitHubError if not found."""
+    owner, name = repo.split("/")
+
+    def resolve():
+        data = _graphql(
+            f'query {{ repository(owner: "{owner}", name: "{name}") '
+            f'{{ discussionCategory(slug: "{slug}") {{ id }} }} }}'
+        )
+        category = data["repository"]["discussionCategory"]
+        if not category:
+            raise GitHubError(f"No discussion category {slug!r} in {repo}")
+        return category["id"]
+
+    return _node_id(f"discussion_category:{repo}:{slug}", resolve)
+
+
 def post_discussion(title, body, category_id, repo=REPO, dry_run=False):
     """Post a GitHub Discussion via GraphQL mutation.
 
@@ -73,18 +311,12 @@ def post_discussion(title, body, category_id, repo=REPO, dry_run=False):
         print(body[:200])
         return (True, None)
 
-    # Get repository ID
-    repo_id_result = subprocess.run(
-        ["gh", "api", "graphql", "-f", f'query=query {{ repository(owner: "{repo.split("/")[0]}", name: "{repo.split("/")[1]}") {{ id }} }}'],
-        capture_output=True, text=True,
-    )
-    if repo_id_result.returncode != 0:
-        print(f"Error getting repo ID: {repo_id_result.stderr}")
+    try:
+        repo_id = repository_id(repo)
+    except GitHubError as e:
+        print(f"Error getting repo ID: {e}")
         return (False, None)
 
-    repo_data = json.loads(repo_id_result.stdout)
-    repo_id = repo_data["data"]["repository"]["id"]
-
     # Escape body for GraphQL JSON
     escaped_body = json.dumps(body)[1:-1]  # Remove outer quotes from json.dumps
     escaped_title = json.dumps(title)[1:-1]
@@ -100,16 +332,13 @@ def post_discussion(title, body, category_id, repo=REPO, dry_run=False):
         }}
     }}'''
 
-    result = subprocess.run(
-        ["gh", "api", "graphql", "-f", f"query={mutation}"],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        print(f"Error posting discussion: {result.stderr}")
+    try:
+        data = _graphql(mutation)
+    except GitHubError as e:
+        print(f"Error posting discussion: {e}")
         return (False, None)
 
-    data = json.loads(result.stdout)
-    discussion = data.get("data", {}).get("createDiscussion", {}).get("discussion", {})
+    discussion = (data.get("createDiscussion") or {}).get("discussion") or {}
     url = discussion.get("url", "")
     node_id = discussion.get("id")
     if url:
@@ -118,7 +347,7 @@ def post_discussion(title, body, category_id, repo=REPO, dry_run=False):
 
 
 def create_issue(title, body, labels, repo=REPO, dry_run=False):
-    """Create a GitHub issue via `gh issue create`.
+    """Create a GitHub issue.
 
     Returns (success: bool, issue_number: int|None).
     """
@@ -130,11 +359,20 @@ def create_issue(title, body, labels, repo=REPO, dry_run=False):
         print(body[:200])
         return (True, None)
 
-    cmd = ["gh", "issue", "create", "--repo", repo, "--title", title, "--body", body]
+    if client is not None:
+        try:
+            issue = client.rest("POST", f"repos/{repo}/issues",
+                                body={"title": title, "body": body, "labels": list(labels)})
+        except GitHubError as e:
+            print(f"Error creating issue: {e}")
+            return (False, None)
+        return (True, issue.get("number"))
+
+    args = ["issue", "create", "--repo", repo, "--title", title, "--body", body]
     for label in labels:
-        cmd.extend(["--label", label])
+        args.extend(["--label", label])
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = run_gh(args)
     if result.returncode != 0:
         print(f"Error creating issue: {result.stderr}")
         return (False, None)
@@ -148,20 +386,31 @@ def create_issue(title, body, labels, repo=REPO, dry_run=False):
 
 
 def search_issues(query, labels, repo=REPO):
-    """Search for existing issues via `gh issue list --search`.
+    """Search open issues with the given labels, like `gh issue list --search`.
 
     Returns list of issue dicts with 'number' and 'title'.
     """
-    cmd = [
-        "gh", "issue", "list", "--repo", repo,
+    if client is not None:
+        terms = [f"repo:{repo}", "is:issue", "is:open", query]
+        terms.extend(f'label:"{label}"' for label in labels)
+        try:
+            found = client.rest("GET", "search/issues",
+                                params={"q": " ".join(terms), "per_page": 20})
+        except GitHubError as e:
+            print(f"Warning: Issue search failed: {e}")
+            return []
+        return [{"number": i["number"], "title": i["title"]} for i in found["items"]]
+
+    args = [
+        "issue", "list", "--repo", repo,
         "--search", query,
         "--json", "number,title",
         "--limit", "20",
     ]
     for label in labels:
-        cmd.extend(["--label", label])
+        args.extend(["--label", label])
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = run_gh(args)
     if result.returncode != 0:
         print(f"Warning: Issue search failed: {result.stderr}")
         return []
@@ -172,15 +421,37 @@ def search_issues(query, labels, repo=REPO):
         return []
 
 
-def post_discussion_comment(discussion_id, body, repo=REPO, dry_run=False):
-    """Post a comment on a GitHub Discussion via GraphQL mutation."""
-    body = _sanitize(body, max_length=MAX_DISCUSSION_COMMENT_LENGTH)
+def list_issues(labels, repo=REPO, limit=500):
+    """List open issues with all the given labels.
 
-    if dry_run:
-        print(f"[DRY RUN] Would comment on discussion {discussion_id}:")
-        print(body[:200])
-        return True
+    Returns issue dicts with 'number', 'title' and 'body', or [] on failure.
+    """
+    if client is not None:
+        try:
+            issues = client.paginate(f"repos/{repo}/issues",
+                                     params={"labels": ",".join(labels), "state": "open"})
+        except GitHubError as e:
+            print(f"Warning: Could not fetch issues: {e}")
+            return []
+        # The issues endpoint also lists pull requests
+        issues = [i for i in issues if "pull_request" not in i][:limit]
+        return [{"number": i["number"], "title": i["title"], "body": i.get("body") or ""}
+                for i in issues]
+
+    args = ["issue", "list", "--repo", repo]
+    for label in labels:
+        args.extend(["--label", label])
+    args.extend(["--state", "open", "--json", "number,title,body", "--limit", str(limit)])
+    result = run_gh(args)
+    if result.returncode != 0:
+        print(f"Warning: Could not fetch issues: {result.stderr}")
+        return []
+    return json.loads(result.stdout)
 
+
+def write_discussion_comment(discussion_id, body, repo=REPO):
+    """Post a sanitized comment on a GitHub Discussion. Raises GitHubError on failure."""
+    body = _sanitize(body, max_length=MAX_DISCUSSION_COMMENT_LENGTH)
     escaped_body = json.dumps(body)[1:-1]
 
     mutation = f'''mutation {{
@@ -192,12 +463,20 @@ def post_discussion_comment(discussion_id, body, repo=REPO, dry_run=False):
         }}
     }}'''
 
-    result = subprocess.run(
-        ["gh", "api", "graphql", "-f", f"query={mutation}"],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        print(f"Error commenting on discussion: {result.stderr}")
+    _graphql(mutation)
+
+
+def post_discussion_comment(discussion_id, body, repo=REPO, dry_run=False):
+    """Post a comment on a GitHub Discussion via GraphQL mutation."""
+    if dry_run:
+        print(f"[DRY RUN] Would comment on discussion {discussion_id}:")
+        print(_sanitize(body, max_length=MAX_DISCUSSION_COMMENT_LENGTH)[:200])
+        return True
+
+    try:
+        write_discussion_comment(discussion_id, body, repo=repo)
+    except GitHubError as e:
+        print(f"Error commenting on discussion: {e}")
         return False
 
     return True
@@ -0,0 +1,151 @@
+"""In-process GitHub REST and GraphQL client.
+
+Shelling out to `gh` costs a process start, an auth config load and a new
+HTTPS connection on every call. GitHubClient keeps one pooled keep-alive
+session authenticated with a token from the environment instead. The
+functions in github_api use it when github_api.client is set, and fall
+back to `gh` otherwise; sanitization and dry-run handling stay there.
+"""
+
+import os
+import time
+
+import requests
+
+from aurora_monitor.sources.http import build_session
+
+
+API_URL = "https://api.github.com"
+USER_AGENT = "aurora-manual-monitor/1.0 (github.com/ErikEvenson/aurora-manual)"
+TOKEN_VARIABLES = ("GITHUB_TOKEN", "GH_TOKEN")
+
+
+class GitHubError(Exception):
+    """A failed GitHub API call; status is the HTTP status, if there was one.
+
+    rate_limited is set for primary and secondary rate limit responses,
+    with retry_after the seconds GitHub asked us to wait, if it said.
+    """
+
+    def __init__(self, message, status=None, rate_limited=False, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
+
+
+def _retry_after(headers):
+    """Seconds GitHub asked us to wait in Retry-After or X-RateLimit-Reset, or None."""
+    if headers.get("Retry-After"):
+        try:
+            return max(0.0, float(headers["Retry-After"]))
+        except ValueError:
+            return None
+    if headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset"):
+        try:
+            return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time())
+        except ValueError:
+            return None
+    return None
+
+
+def _rate_limit_wait(response, message):
+    """(rate_limited, retry_after seconds or None) for an error response."""
+    headers = response.headers
+    if response.status_code not in (403, 429):
+        return False, None
+    if headers.get("Retry-After") or (
+            headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset")):
+        return True, _retry_after(headers)
+    return response.status_code == 429 or "rate limit" in message.lower(), None
+
+
+class GitHubClient:
+    """Token-authenticated GitHub API client over one pooled session.
+
+    api_url can point at a local stand-in server for tests.
+    """
+
+    def __init__(self, token, api_url=API_URL, timeout=30, pool_size=4):
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.requests = 0
+        # build_session retries only GETs, so a POST is never sent twice
+        self.session = build_session(USER_AGENT, pool_size=pool_size)
+        self.session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        })
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        """Build a client from GITHUB_TOKEN or GH_TOKEN; None if neither is set."""
+        for name in TOKEN_VARIABLES:
+            if os.environ.get(name):
+                return cls(os.environ[name], **kwargs)
+        return None
+
+    def rest(self, method, path, params=None, body=None):
+        """Call a REST endpoint (path relative to the API root). Returns decoded JSON."""
+        response = self._request(method, path, params, body)
+        return response.json() if response.content else None
+
+    def _request(self, method, path, params=None, body=None):
+        """Send one request; raises GitHubError on failure. Returns the response."""
+        try:
+            response = self.session.request(
+                method, f"{self.api_url}/{path.lstrip('/')}",
+                params=params, json=body, timeout=self.timeout,
+            )
+        except requests.RequestException as e:
+            raise GitHubError(str(e))
+        self.requests += 1
+        if response.status_code >= 400:
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            rate_limited, retry_after = _rate_limit_wait(response, str(message))
+            raise GitHubError(f"HTTP {response.status_code}: {message}",
+                              status=response.status_code, rate_limited=rate_limited,
+                              retry_after=retry_after)
+        return response
+
+    def paginate(self, path, params=None, limit=None):
+        """GET every page of a list endpoint, up to limit items."""
+        items = []
+        page = 1
+        while limit is None or len(items) < limit:
+            batch = self.rest("GET", path, params={**(params or {}), "per_page": 100,
+                                                   "page": page})
+            items.extend(batch)
+            if len(batch) < 100:
+                break
+            page += 1
+        return items if limit is None else items[:limit]
+
+    def graphql(self, query, variables=None):
+        """Run a GraphQL query or mutation. Returns its data.
+
+        GraphQL reports rate limiting as an error of type RATE_LIMITED on a
+        200 response; the wait comes from the response headers.
+        """
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        response = self._request("POST", "graphql", body=payload)
+        result = response.json()
+        errors = result.get("errors")
+        if errors:
+            rate_limited = any(e.get("type") == "RATE_LIMITED" for e in errors)
+            raise GitHubError(
+                "; ".join(e.get("message", "") for e in errors),
+                status=response.status_code, rate_limited=rate_limited,
+                retry_after=_retry_after(response.headers) if rate_limited else None,
+            )
+        return result["data"]
+
+    def stats(self):
+        """Return request counts for the run summary."""
+        return {"github_api_requests": self.requests}
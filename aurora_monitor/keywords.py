@@ -0,0 +1,115 @@
+"""Shared keyword automaton for community source monitors.
+
+Matcher and NewContentDetector both look for config.yaml keywords in post
+text: the matching tiers (high, medium, aurora_terms), the new-content
+evidence keywords, and every chapter's keyword list. Rather than one
+substring scan per keyword, all keywords are compiled into a single
+Aho-Corasick automaton that finds every hit in one pass over the text.
+
+Hits keep the semantics of the `kw.lower() in text` checks they replace:
+case-insensitive substring matches, each keyword counted once per text.
+"""
+
+from collections import deque
+
+
+EVIDENCE_TIER = "evidence"
+
+
+class KeywordHits:
+    """Keywords found in one text, resolved back to tiers and chapters."""
+
+    def __init__(self, automaton, found):
+        self._automaton = automaton
+        self.found = found
+
+    def tier(self, name):
+        """Return keywords of a tier present in the text, in config order."""
+        return [kw for kw, key in self._automaton.tiers.get(name, ()) if key in self.found]
+
+    def chapter(self, chapter_num):
+        """Return the number of a chapter's keywords present in the text."""
+        keys = self._automaton.chapters.get(chapter_num, ())
+        return sum(1 for key in keys if key in self.found)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over every keyword list in the monitor config."""
+
+    def __init__(self, config):
+        matching_keywords = config.get("matching", {}).get("keywords", {})
+        nc_config = config.get("new_content", {})
+
+        # Tier name -> [(keyword as configured, lowercased keyword)]
+        self.tiers = {
+            tier: [(kw, kw.lower()) for kw in keywords]
+            for tier, keywords in matching_keywords.items()
+        }
+        self.tiers[EVIDENCE_TIER] = [
+            (kw, kw.lower()) for kw in nc_config.get("evidence_keywords", [])
+        ]
+
+        # Chapter number -> [lowercased keyword]
+        self.chapters = {
+            int(chapter_num): [kw.lower() for kw in info["keywords"]]
+            for chapter_num, info in nc_config.get("chapter_keywords", {}).items()
+        }
+
+        patterns = {key for entries in self.tiers.values() for _, key in entries}
+        for keys in self.chapters.values():
+            patterns.update(keys)
+        patterns.discard("")
+        self._build(sorted(patterns))
+
+    def _build(self, patterns):
+        """Build the goto trie, failure links and a full transition table."""
+        goto = [{}]
+        outputs = [set()]
+        for pattern in patterns:
+            state = 0
+            for ch in pattern:
+                if ch not in goto[state]:
+                    goto.append({})
+                    outputs.append(set())
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            outputs[state].add(pattern)
+
+        # Breadth-first failure links; each state inherits its fallback's outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        order = []
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(ch, 0)
+                fail[child] = target if target != child else 0
+                outputs[child] |= outputs[fail[child]]
+
+        # Resolve failure links ahead of time so scanning is one lookup per char
+        transitions = [None] * len(goto)
+        transitions[0] = dict(goto[0])
+        for state in order:
+            table = dict(transitions[fail[state]])
+            table.update(goto[state])
+            transitions[state] = table
+
+        self._transitions = transitions
+        self._outputs = [frozenset(found) for found in outputs]
+
+    def scan(self, text):
+        """Return KeywordHits for every keyword occurring in text."""
+        transitions = self._transitions
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for ch in text.lower():
+            state = transitions[state].get(ch, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return KeywordHits(self, found)
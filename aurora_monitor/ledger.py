@@ -0,0 +1,149 @@
+"""Local ledger of the comments the monitor has posted.
+
+Every successful post is recorded as (target, source item ID, content
+hash), where the target is an issue number or a discussion node ID and
+the source is the Reddit post or comment it references (None for
+batched backfill comments). A duplicate check is then a set lookup, not
+a query against GitHub.
+
+Records are appended to a JSON-lines file and fsynced after each post, so
+a run killed at any point loses at most the line being written, which is
+skipped on load. reconcile() syncs the ledger with the references GitHub
+actually shows, to pick up comments posted elsewhere and forget ones
+deleted by hand; it rewrites the file compacted.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+def body_hash(body):
+    """Short stable hash of a comment body."""
+    return hashlib.sha1(body.encode("utf-8")).hexdigest()[:16]
+
+
+class PostLedger:
+    """Posted comments, keyed by (target, source) and by (target, content hash).
+
+    reconcile_interval is the seconds between reconciles against GitHub
+    (0 reconciles every run, None never does).
+    """
+
+    def __init__(self, path, reconcile_interval=None, clock=time.time):
+        self.path = path
+        self.reconcile_interval = reconcile_interval
+        self._clock = clock
+        self._lock = threading.Lock()  # Posting queue workers record concurrently
+        self.sources = {}  # (target, source) -> content hash or None
+        self.hashes = set()  # (target, content hash)
+        self.reconciled_at = None
+        self.hits = 0
+        self._torn = False  # Last line was cut short; the next append starts a new one
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            text = f.read()
+        self._torn = bool(text) and not text.endswith("\n")
+        for line in text.splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                print(f"Warning: Skipping unreadable post ledger line in {self.path}")
+
+    def _apply(self, record):
+        if "reconciled_at" in record:
+            self.reconciled_at = record["reconciled_at"]
+            return
+        if record["source"] is not None:
+            self.sources[(record["target"], record["source"])] = record.get("hash")
+        if record.get("hash"):
+            self.hashes.add((record["target"], record["hash"]))
+
+    def _append(self, record):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a") as f:
+            if self._torn:
+                f.write("\n")
+                self._torn = False
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def has(self, target, source):
+        """Whether a comment on target referencing source was posted."""
+        found = (target, source) in self.sources
+        self.hits += found
+        return found
+
+    def has_body(self, target, body):
+        """Whether this exact body was posted on target."""
+        found = (target, body_hash(body)) in self.hashes
+        self.hits += found
+        return found
+
+    def record(self, target, source, body):
+        """Record a successful post, durably, before returning."""
+        record = {"target": target, "source": source, "hash": body_hash(body),
+                  "posted_at": self._clock()}
+        with self._lock:
+            self._apply(record)
+            self._append(record)
+
+    def issues(self):
+        """Issue numbers with recorded source references."""
+        return {target for target, _ in self.sources if isinstance(target, int)}
+
+    def reconcile_due(self):
+        if self.reconcile_interval is None:
+            return False
+        return (self.reconciled_at is None
+                or self._clock() - self.reconciled_at >= self.reconcile_interval)
+
+    def reconcile(self, references):
+        """Sync source references with github_api.IssueReferences.
+
+        For each issue references could load, references GitHub shows are
+        added and recorded ones it no longer shows (deleted comments) are
+        dropped, so they may be posted again. Returns (added, dropped).
+        """
+        added = dropped = 0
+        with self._lock:
+            for issue, ids in references.ids.items():
+                for key in [k for k in self.sources if k[0] == issue and k[1] not in ids]:
+                    self.hashes.discard((issue, self.sources.pop(key)))
+                    dropped += 1
+                for source in ids:
+                    if (issue, source) not in self.sources:
+                        self.sources[(issue, source)] = None
+                        added += 1
+            self.reconciled_at = self._clock()
+            self._rewrite()
+        return added, dropped
+
+    def _rewrite(self):
+        """Write the current entries as a compacted file, atomically."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        source_hashes = set()
+        with open(tmp_path, "w") as f:
+            for (target, source), digest in self.sources.items():
+                f.write(json.dumps({"target": target, "source": source, "hash": digest}) + "\n")
+                if digest:
+                    source_hashes.add((target, digest))
+            for target, digest in self.hashes - source_hashes:
+                f.write(json.dumps({"target": target, "source": None, "hash": digest}) + "\n")
+            f.write(json.dumps({"reconciled_at": self.reconciled_at}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._torn = False
+
+    def stats(self):
+        """Return counters for the run summary."""
+        return {"ledger_references": len(self.sources), "ledger_hits": self.hits}
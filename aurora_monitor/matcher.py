@@ -1,51 +1,141 @@
 """Shared keyword + fuzzy matching engine for community source monitors."""
 
 import re
+from collections import namedtuple
+
+import numpy as np
+from rapidfuzz import fuzz as rapid_fuzz
+from rapidfuzz import process as rapid_process
 from thefuzz import fuzz
 
+from aurora_monitor.index import MinHashIndex, TokenIndex, process
+from aurora_monitor.keywords import KeywordAutomaton
+from aurora_monitor.records import MatchResult
+from aurora_monitor.score_cache import config_hash, content_hash
+
+
+# Issue fields derived once per run when Matcher.issues is assigned.
+PreparedIssue = namedtuple(
+    "PreparedIssue", ["issue", "text", "processed", "tokens", "length_factor", "digest"]
+)
+
+# Post fields derived once per post, shared by every issue comparison.
+PreparedPost = namedtuple(
+    "PreparedPost",
+    ["text", "processed", "tokens", "length_factor", "keyword_bonus", "author_bonus",
+     "digest"],
+)
+
 
 class Matcher:
     """Match community content against open unverified GitHub issues."""
 
-    def __init__(self, config):
+    # Scoring backends by config name. "thefuzz" scores one post-issue pair
+    # at a time behind the candidate index; "rapidfuzz" scores a whole batch
+    # of posts against every issue as one multi-core score matrix, without
+    # the index, and finds the best match a full scan would.
+    SCORING_BACKENDS = {
+        "thefuzz": "_score_posts_pairwise",
+        "rapidfuzz": "_score_posts_matrix",
+    }
+
+    # Matching config keys that change how pairs are scored, not their scores
+    OPERATIONAL_KEYS = (
+        "scoring_backend", "batch_size", "workers", "candidate_index", "score_cache",
+    )
+
+    def __init__(self, config, keyword_automaton=None):
         self.config = config["matching"]
         self.thresholds = self.config["thresholds"]
         self.known_authors = self.config.get("known_authors", {})
         self.multi_match_penalty = self.config.get("multi_match_penalty", 10)
         self.keywords = self.config.get("keywords", {})
+        self.keyword_automaton = keyword_automaton or KeywordAutomaton(config)
+        self.index_config = self.config.get("candidate_index", {})
+        self.min_text_length = self.config.get("min_text_length", 50)
+        self.max_issue_length = self.config.get("max_issue_length", 500)
+        self.long_issue_exponent = self.config.get("long_issue_exponent", 0.15)
+        self.scoring_backend = self.config.get("scoring_backend", "thefuzz")
+        if self.scoring_backend not in self.SCORING_BACKENDS:
+            raise ValueError(
+                f"Unknown scoring_backend {self.scoring_backend!r} "
+                f"(expected one of {', '.join(self.SCORING_BACKENDS)})"
+            )
+        self.batch_size = self.config.get("batch_size", 1000)
+        self.workers = self.config.get("workers", -1)
+        self.config_hash = config_hash(self.config, ignore=self.OPERATIONAL_KEYS)
+        self.score_cache = None  # Optional ScoreCache, set by the caller
+        self.fuzzy_calls = 0  # Pairs scored by _score_prepared()
+        self.fuzzy_calls_avoided = 0  # Pairs skipped by _score_bound()
         self.issues = []
 
-    def score_match(self, post, issue):
-        """Score how well a post or comment matches an issue. Returns 0-100+."""
-        if "body" in post and "selftext" not in post:
-            post_text = post.get("body", "").lower()
-        else:
-            post_text = f"{post.get('title', '')} {post.get('selftext', '')}".lower()
-        issue_text = f"{issue['title']} {issue.get('body', '')}".lower()
+    @property
+    def issues(self):
+        """Open unverified issues that posts are matched against."""
+        return self._issues
 
-        # Fuzzy match score (0-100)
-        fuzzy_score = fuzz.token_set_ratio(post_text, issue_text)
+    @issues.setter
+    def issues(self, issues):
+        self._issues = list(issues)
+        self._corpus = tuple(self._prepare_issue(issue) for issue in self._issues)
+        self._positions = {id(issue): i for i, issue in enumerate(self._issues)}
+        self._index = None
+        if self.index_config.get("enabled", True):
+            self._index = self._build_index([prepared.tokens for prepared in self._corpus])
 
-        # Penalize short text — token_set_ratio produces false positives when
-        # the post has few tokens (a single matching word → 100% ratio).
-        min_text_length = self.config.get("min_text_length", 50)
-        post_text_length = len(post_text.strip())
-        if post_text_length < min_text_length:
-            length_ratio = post_text_length / min_text_length
-            fuzzy_score = fuzzy_score * length_ratio
+    def _build_index(self, issue_tokens):
+        """Build the configured candidate index over prepared issue tokens."""
+        method = self.index_config.get("method", "tokens")
+        max_df = self.index_config.get("max_document_frequency", 0.5)
+        min_token_length = self.index_config.get("min_token_length", 3)
+        if method == "tokens":
+            return TokenIndex(
+                issue_tokens,
+                min_shared_tokens=self.index_config.get("min_shared_tokens", 1),
+                max_document_frequency=max_df,
+                min_token_length=min_token_length,
+            )
+        if method == "minhash":
+            minhash_config = self.index_config.get("minhash", {})
+            return MinHashIndex(
+                issue_tokens,
+                num_perm=minhash_config.get("num_perm", 128),
+                bands=minhash_config.get("bands", 128),
+                max_document_frequency=max_df,
+                min_token_length=min_token_length,
+            )
+        raise ValueError(f"Unknown candidate_index method {method!r} (expected tokens or minhash)")
+
+    def _prepare_issue(self, issue):
+        """Precompute the issue text, tokens and long-issue penalty factor."""
+        body = issue.get("body") or ""  # gh and the API give null for empty bodies
+        text = f"{issue['title']} {body}".lower()
+        processed = process(text)
 
         # Penalize long issue bodies — token_set_ratio produces false positives
         # when the issue has many tokens (large token pool overlaps with any
-        # Aurora-related post). Symmetric with short-text penalty above. (#1298)
-        max_issue_length = self.config.get("max_issue_length", 500)
-        long_issue_exponent = self.config.get("long_issue_exponent", 0.15)
-        issue_text_length = len(issue_text.strip())
-        if issue_text_length > max_issue_length and long_issue_exponent > 0:
-            length_ratio = (max_issue_length / issue_text_length) ** long_issue_exponent
-            fuzzy_score = fuzzy_score * length_ratio
+        # Aurora-related post). Symmetric with short-text penalty below. (#1298)
+        length_factor = 1.0
+        issue_text_length = len(text.strip())
+        if issue_text_length > self.max_issue_length and self.long_issue_exponent > 0:
+            length_factor = (self.max_issue_length / issue_text_length) ** self.long_issue_exponent
 
-        # Keyword counting bonus
-        keyword_bonus = self._keyword_bonus(post_text)
+        return PreparedIssue(
+            issue, text, processed, frozenset(processed.split()), length_factor,
+            content_hash(issue["title"], body),
+        )
+
+    def _prepare_post(self, post):
+        """Precompute the post text, tokens, short-text factor and bonuses."""
+        text = _post_text(post)
+        processed = process(text)
+
+        # Penalize short text — token_set_ratio produces false positives when
+        # the post has few tokens (a single matching word → 100% ratio).
+        length_factor = 1.0
+        post_text_length = len(text.strip())
+        if post_text_length < self.min_text_length:
+            length_factor = post_text_length / self.min_text_length
 
         # Known author bonus
         author_bonus = 0
@@ -53,21 +143,41 @@ class Matcher:
         if author in self.known_authors:
             author_bonus = self.known_authors[author].get("bonus", 0)
 
+        return PreparedPost(
+            text, processed, frozenset(processed.split()), length_factor,
+            self._keyword_bonus(text), author_bonus, content_hash(text, author),
+        )
+
+    def score_match(self, post, issue):
+        """Score how well a post or comment matches an issue. Returns 0-100+."""
+        return self._score_prepared(self._prepare_post(post), self._prepare_issue(issue))
+
+    def _score_prepared(self, post, issue):
+        """Score a PreparedPost against a PreparedIssue. Returns 0-100."""
+        self.fuzzy_calls += 1
+        # Fuzzy match score (0-100); both sides are already processed
+        fuzzy_score = fuzz.token_set_ratio(post.processed, issue.processed, full_process=False)
+        fuzzy_score = fuzzy_score * post.length_factor * issue.length_factor
+
         # Weighted score: fuzzy is primary, keywords and author are additive
-        score = fuzzy_score + (keyword_bonus * 0.5) + author_bonus
+        score = fuzzy_score + (post.keyword_bonus * 0.5) + post.author_bonus
 
         return min(score, 100)  # Cap at 100 for routing purposes
 
+    def _score_bound(self, post, issue):
+        """Upper bound on _score_prepared() computed without the fuzzy ratio.
+
+        Uses the best possible ratio of 100 in the same arithmetic order, so
+        the bound is never below the real score.
+        """
+        score = 100 * post.length_factor * issue.length_factor
+        score = score + (post.keyword_bonus * 0.5) + post.author_bonus
+        return min(score, 100)
+
     def _keyword_bonus(self, text):
         """Count keyword matches across priority tiers."""
-        bonus = 0
-        for kw in self.keywords.get("high", []):
-            if kw.lower() in text:
-                bonus += 6
-        for kw in self.keywords.get("medium", []):
-            if kw.lower() in text:
-                bonus += 3
-        return bonus
+        hits = self.keyword_automaton.scan(text)
+        return len(hits.tier("high")) * 6 + len(hits.tier("medium")) * 3
 
     def _detect_cross_references(self, post):
         """Detect links to Aurora Forums or YouTube in post or comment text."""
@@ -96,6 +206,102 @@ class Matcher:
             return "triage"
         return "ignore"
 
+    def _cached_score(self, post, issue):
+        """Score a prepared pair, served from score_cache when one is set."""
+        if self.score_cache is None:
+            return self._score_prepared(post, issue)
+        score = self.score_cache.get(post.digest, issue.digest)
+        if score is None:
+            score = self._score_prepared(post, issue)
+            self.score_cache.put(post.digest, issue.digest, score)
+        return score
+
+    def _score_issues(self, post, corpus, floor=None):
+        """Score a PreparedPost against prepared issues.
+
+        Returns (issue, score) pairs at or above thresholds.low. Pairs whose
+        score bound is below thresholds.low (or below floor, if given), or
+        cannot beat the best score so far, are skipped without a fuzzy call:
+        find_matches() only reports the top issue, and on a tie the earlier
+        issue wins. The first pair returned is therefore always the best
+        match a full scan would find.
+        """
+        low = self.thresholds["low"] if floor is None else max(self.thresholds["low"], floor)
+        issue_scores = []
+        best = None
+        for prepared in corpus:
+            bound = self._score_bound(post, prepared)
+            if bound < low or (best is not None and bound <= best):
+                self.fuzzy_calls_avoided += 1
+                continue
+            score = self._cached_score(post, prepared)
+            if score >= low:
+                issue_scores.append((prepared.issue, score))
+                if best is None or score > best:
+                    best = score
+        return issue_scores
+
+    def _candidate_issues(self, post):
+        """Return the prepared issues worth fuzzy-scoring against a PreparedPost.
+
+        With the candidate index enabled, only issues sharing discriminative
+        tokens with the post are returned, in their original order.
+        """
+        if self._index is None:
+            return self._corpus
+        return [self._corpus[i] for i in self._index.candidates(post.tokens)]
+
+    def _score_posts_pairwise(self, posts):
+        """Yield (issue, score) pairs at or above thresholds.low per PreparedPost.
+
+        Only index candidates are scored. The index drops tokens found in
+        more than max_document_frequency of the issues, so a post made only
+        of common vocabulary has no candidates; it is scored against every
+        issue instead. An issue that shares nothing but common vocabulary
+        with a post that does have candidates is not scored, which is where
+        the index loses matches (see benchmark --recall).
+        """
+        for prepared in posts:
+            candidates = self._candidate_issues(prepared) or self._corpus
+            yield self._score_issues(prepared, candidates)
+
+    def _score_posts_matrix(self, posts):
+        """Yield (issue, score) pairs at or above thresholds.low per PreparedPost.
+
+        Scores each batch of posts against every issue with a single
+        rapidfuzz cdist call, then applies _score_prepared() as array
+        operations in the same order: thefuzz's integer rounding, the
+        short-text and long-issue factors, then the keyword and author
+        bonuses.
+        """
+        if not self._corpus:
+            for _ in posts:
+                yield []
+            return
+
+        issue_texts = [prepared.processed for prepared in self._corpus]
+        issue_factors = np.array([prepared.length_factor for prepared in self._corpus])
+        for start in range(0, len(posts), self.batch_size):
+            batch = posts[start:start + self.batch_size]
+            ratios = rapid_process.cdist(
+                [prepared.processed for prepared in batch], issue_texts,
+                scorer=rapid_fuzz.token_set_ratio, processor=None,
+                dtype=np.float64, workers=self.workers,
+            )
+            post_factors = np.array([prepared.length_factor for prepared in batch])
+            keyword_bonuses = np.array([prepared.keyword_bonus for prepared in batch])
+            author_bonuses = np.array([prepared.author_bonus for prepared in batch])
+
+            scores = np.rint(ratios) * post_factors[:, None] * issue_factors
+            scores = scores + (keyword_bonuses * 0.5)[:, None] + author_bonuses[:, None]
+            scores = np.minimum(scores, 100)
+
+            for row in scores:
+                yield [
+                    (self._corpus[i].issue, float(row[i]))
+                    for i in np.flatnonzero(row >= self.thresholds["low"])
+                ]
+
     def find_matches(self, posts):
         """Find matches for a list of posts/comments against all loaded issues.
 
@@ -103,28 +309,23 @@ class Matcher:
         the best matching issue (if any), score, routing, cross-references,
         and for comments: content_type="comment" and parent_post_id.
         """
+        prepared_posts = [self._prepare_post(post) for post in posts]
+        score_posts = getattr(self, self.SCORING_BACKENDS[self.scoring_backend])
+
         results = []
-        for post in posts:
+        for post, issue_scores in zip(posts, score_posts(prepared_posts)):
             is_comment = "body" in post and "selftext" not in post
             content_type = "comment" if is_comment else "post"
             parent_post_id = None
             if is_comment:
-                # parent_id is like "t3_abc123" for top-level comments
-                raw_parent = post.get("parent_id", "")
+                # link_id is the post ("t3_abc123"); parent_id is only the
+                # post for top-level comments, a comment ("t1_...") for replies
+                raw_parent = post.get("link_id") or post.get("parent_id", "")
                 if raw_parent.startswith("t3_"):
                     parent_post_id = raw_parent[3:]
-                elif raw_parent.startswith("t1_"):
-                    parent_post_id = raw_parent[3:]
 
             cross_refs = self._detect_cross_references(post)
 
-            # Score against all issues
-            issue_scores = []
-            for issue in self.issues:
-                score = self.score_match(post, issue)
-                if score >= self.thresholds["low"]:
-                    issue_scores.append((issue, score))
-
             # Sort by score descending
             issue_scores.sort(key=lambda x: x[1], reverse=True)
 
@@ -142,47 +343,52 @@ class Matcher:
             if issue_scores:
                 best_issue, best_score = issue_scores[0]
                 routing = self._route(best_score)
-                result = {
-                    "post_id": post["id"],
-                    "subreddit": post.get("subreddit", ""),
-                    "author": post.get("author", ""),
-                    "title": post.get("title", ""),
-                    "permalink": post.get("permalink", ""),
-                    "created_utc": post.get("created_utc"),
-                    "score": best_score,
-                    "routing": routing,
-                    "issue": best_issue["number"] if routing == "auto_comment" else None,
-                    "issue_title": best_issue["title"] if routing == "auto_comment" else None,
-                    "quote": _extract_quote(quote_text),
-                    "cross_references": cross_refs if cross_refs else None,
-                    "content_type": content_type,
-                    "parent_post_id": parent_post_id,
-                }
+                result = MatchResult(
+                    post_id=post["id"],
+                    subreddit=post.get("subreddit", ""),
+                    author=post.get("author", ""),
+                    title=post.get("title", ""),
+                    permalink=post.get("permalink", ""),
+                    created_utc=post.get("created_utc"),
+                    score=best_score,
+                    routing=routing,
+                    issue=best_issue["number"] if routing == "auto_comment" else None,
+                    issue_title=best_issue["title"] if routing == "auto_comment" else None,
+                    quote=_extract_quote(quote_text),
+                    cross_references=cross_refs if cross_refs else None,
+                    content_type=content_type,
+                    parent_post_id=parent_post_id,
+                )
                 results.append(result)
             else:
                 # No issue match — check for relevance via keywords/cross-refs
                 routing = "triage" if cross_refs else "ignore"
-                result = {
-                    "post_id": post["id"],
-                    "subreddit": post.get("subreddit", ""),
-                    "author": post.get("author", ""),
-                    "title": post.get("title", ""),
-                    "permalink": post.get("permalink", ""),
-                    "created_utc": post.get("created_utc"),
-                    "score": 0,
-                    "routing": routing,
-                    "issue": None,
-                    "issue_title": None,
-                    "quote": _extract_quote(quote_text),
-                    "cross_references": cross_refs if cross_refs else None,
-                    "content_type": content_type,
-                    "parent_post_id": parent_post_id,
-                }
+                result = MatchResult(
+                    post_id=post["id"],
+                    subreddit=post.get("subreddit", ""),
+                    author=post.get("author", ""),
+                    title=post.get("title", ""),
+                    permalink=post.get("permalink", ""),
+                    created_utc=post.get("created_utc"),
+                    score=0,
+                    routing=routing,
+                    quote=_extract_quote(quote_text),
+                    cross_references=cross_refs if cross_refs else None,
+                    content_type=content_type,
+                    parent_post_id=parent_post_id,
+                )
                 results.append(result)
 
         return results
 
 
+def _post_text(post):
+    """Build the lowercased text scored for a post or comment."""
+    if "body" in post and "selftext" not in post:
+        return post.get("body", "").lower()
+    return f"{post.get('title', '')} {post.get('selftext', '')}".lower()
+
+
 def _extract_quote(text, max_length=200):
     """Extract a representative quote from post text.
 
@@ -8,18 +8,19 @@ matches against existing unverified issues.
 import re
 from datetime import datetime, timezone
 
+from aurora_monitor.keywords import EVIDENCE_TIER, KeywordAutomaton
+
 
 class NewContentDetector:
     """Detect new content opportunities from unmatched community posts."""
 
-    def __init__(self, config):
+    def __init__(self, config, keyword_automaton=None):
         self.nc_config = config["new_content"]
         self.matching_config = config.get("matching", {})
         self.known_authors = self.matching_config.get("known_authors", {})
-        self.aurora_terms = self.matching_config.get("keywords", {}).get("aurora_terms", [])
-        self.evidence_keywords = self.nc_config.get("evidence_keywords", [])
         self.chapter_keywords = self.nc_config.get("chapter_keywords", {})
         self.min_score = self.nc_config.get("min_score", 40)
+        self.keyword_automaton = keyword_automaton or KeywordAutomaton(config)
 
     def _get_text(self, post):
         """Extract searchable text from a post."""
@@ -34,14 +35,15 @@ class NewContentDetector:
         Returns dict with 'score' (0-100) and 'signals' list.
         """
         text = self._get_text(post).lower()
+        return self._score_hits(post, text, self.keyword_automaton.scan(text))
+
+    def _score_hits(self, post, text, hits):
+        """Score a post given its lowercased text and KeywordHits."""
         score = 0
         signals = []
 
         # Evidence keywords: +10 each, max 30
-        evidence_hits = []
-        for kw in self.evidence_keywords:
-            if kw.lower() in text:
-                evidence_hits.append(kw)
+        evidence_hits = hits.tier(EVIDENCE_TIER)
         evidence_bonus = min(len(evidence_hits) * 10, 30)
         if evidence_bonus > 0:
             score += evidence_bonus
@@ -57,7 +59,7 @@ class NewContentDetector:
         # Keyword density (Aurora keywords / word count)
         words = text.split()
         word_count = len(words) if words else 1
-        aurora_hits = sum(1 for term in self.aurora_terms if term.lower() in text)
+        aurora_hits = len(hits.tier("aurora_terms"))
         density = aurora_hits / word_count
         if density > 0.03:
             score += 10
@@ -96,7 +98,7 @@ class NewContentDetector:
             signals.append("question format (-5)")
 
         # Chapter mapping bonus: +10 for >=1 chapter, +5 more for >=2
-        chapters = self.map_to_chapters(post)
+        chapters = self._chapters_from_hits(hits)
         if len(chapters) >= 2:
             score += 15
             signals.append(f"multi-chapter ({len(chapters)} chapters)")
@@ -116,6 +118,10 @@ class NewContentDetector:
         Returns [(chapter_num, chapter_name, confidence)] sorted by confidence desc.
         """
         text = self._get_text(post).lower()
+        return self._chapters_from_hits(self.keyword_automaton.scan(text))
+
+    def _chapters_from_hits(self, hits):
+        """Map KeywordHits to [(chapter_num, chapter_name, confidence)]."""
         results = []
 
         for chapter_num, chapter_info in self.chapter_keywords.items():
@@ -123,9 +129,9 @@ class NewContentDetector:
             name = chapter_info["name"]
             keywords = chapter_info["keywords"]
 
-            hits = sum(1 for kw in keywords if kw.lower() in text)
-            if hits >= 2:
-                confidence = min(hits / len(keywords), 1.0)
+            chapter_hits = hits.chapter(chapter_num)
+            if chapter_hits >= 2:
+                confidence = min(chapter_hits / len(keywords), 1.0)
                 results.append((chapter_num, name, round(confidence, 2)))
 
         results.sort(key=lambda x: x[2], reverse=True)
@@ -144,44 +150,56 @@ class NewContentDetector:
         if not match_results and not posts_by_id:
             return []
 
-        # Filter to unmatched posts (routing="ignore" or triage with no issue)
-        unmatched_ids = set()
-        for result in match_results:
-            routing = result.get("routing", "ignore")
-            if routing == "ignore":
-                unmatched_ids.add(result["post_id"])
-            elif routing == "triage" and not result.get("issue"):
-                unmatched_ids.add(result["post_id"])
+        unmatched_ids = {
+            result["post_id"] for result in match_results if self.is_unmatched(result)
+        }
 
         opportunities = []
         for post_id in unmatched_ids:
             post = posts_by_id.get(post_id)
             if not post:
                 continue
-
-            scoring = self.score_new_content(post)
-            chapters = self.map_to_chapters(post)
-
-            # Extract quote
-            text = self._get_text(post)
-            quote = text[:200] + "..." if len(text) > 200 else text
-
-            opportunities.append({
-                "post_id": post_id,
-                "score": scoring["score"],
-                "signals": scoring["signals"],
-                "chapters": chapters,
-                "title": post.get("title", ""),
-                "author": post.get("author", ""),
-                "permalink": post.get("permalink", ""),
-                "subreddit": post.get("subreddit", ""),
-                "created_utc": post.get("created_utc"),
-                "quote": quote,
-            })
+            opportunities.append(self.assess_post(post))
 
         opportunities.sort(key=lambda x: x["score"], reverse=True)
         return opportunities
 
+    @staticmethod
+    def is_unmatched(result):
+        """Whether a match result left its post without an issue.
+
+        True for routing="ignore", and for triage with no issue.
+        """
+        routing = result.get("routing", "ignore")
+        if routing == "ignore":
+            return True
+        return routing == "triage" and not result.get("issue")
+
+    def assess_post(self, post):
+        """Build the new content opportunity dict for one post."""
+        # One keyword scan serves both scoring and chapter mapping
+        text = self._get_text(post)
+        lowered = text.lower()
+        hits = self.keyword_automaton.scan(lowered)
+        scoring = self._score_hits(post, lowered, hits)
+        chapters = self._chapters_from_hits(hits)
+
+        # Extract quote
+        quote = text[:200] + "..." if len(text) > 200 else text
+
+        return {
+            "post_id": post["id"],
+            "score": scoring["score"],
+            "signals": scoring["signals"],
+            "chapters": chapters,
+            "title": post.get("title", ""),
+            "author": post.get("author", ""),
+            "permalink": post.get("permalink", ""),
+            "subreddit": post.get("subreddit", ""),
+            "created_utc": post.get("created_utc"),
+            "quote": quote,
+        }
+
     def format_issue_title(self, opportunity):
         """Format a GitHub issue title for a new content opportunity.
 
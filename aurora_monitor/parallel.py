@@ -0,0 +1,127 @@
+"""Process-pool parallel matching for backfill mode.
+
+Each post's score against the loaded issues is independent of every other
+post, so a large backfill batch can be split across processes. The matching
+config and the issue list are shipped to each worker once, when the pool
+starts; afterwards only post chunks, their match results and the chunk's
+counters and new score cache entries cross the process boundary.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from aurora_monitor.matcher import Matcher
+from aurora_monitor.score_cache import ScoreCache
+
+
+# Per-process Matcher, built once by _init_worker
+_worker_matcher = None
+
+
+class _WorkerScoreCache(ScoreCache):
+    """In-memory copy of the parent's ScoreCache that remembers new entries."""
+
+    def __init__(self, config_hash, entries, max_entries):
+        super().__init__(None, config_hash, max_entries=max_entries)
+        self.entries.update(entries)
+        self.stored = []
+
+    def put(self, post_hash, issue_hash, score):
+        super().put(post_hash, issue_hash, score)
+        self.stored.append((post_hash, issue_hash, score))
+
+
+def _init_worker(config, issues, cache_entries=None, cache_max_entries=None):
+    """Build the worker's Matcher from the shipped config, issues and cached scores."""
+    global _worker_matcher
+    _worker_matcher = Matcher(config)
+    _worker_matcher.issues = issues
+    if cache_entries is not None:
+        _worker_matcher.score_cache = _WorkerScoreCache(
+            _worker_matcher.config_hash, cache_entries, cache_max_entries,
+        )
+
+
+def _match_chunk(posts):
+    """Match one chunk of posts in a worker process.
+
+    Returns (results, counters, new score cache entries) for the chunk.
+    """
+    matcher = _worker_matcher
+    cache = matcher.score_cache
+    matcher.fuzzy_calls = matcher.fuzzy_calls_avoided = 0
+    if cache is not None:
+        cache.hits = cache.misses = 0
+        cache.stored = []
+    results = matcher.find_matches(posts)
+    counters = {
+        "fuzzy_calls": matcher.fuzzy_calls,
+        "fuzzy_calls_avoided": matcher.fuzzy_calls_avoided,
+    }
+    if cache is None:
+        return results, counters, []
+    counters.update(score_cache_hits=cache.hits, score_cache_misses=cache.misses)
+    return results, counters, cache.stored
+
+
+class MatcherPool:
+    """Run Matcher.find_matches across a pool of worker processes.
+
+    Use as a context manager. find_matches() has the same contract as
+    Matcher.find_matches(): one result per input item, in input order,
+    regardless of which worker scored which chunk.
+
+    With a score_cache, each worker starts from a copy of its entries; the
+    scores workers compute are stored back into it, and their hits and
+    misses are added to its counters. Fuzzy calls made and pruned are counted
+    in fuzzy_calls and fuzzy_calls_avoided.
+    """
+
+    def __init__(self, config, issues, workers=None, chunks_per_worker=4, score_cache=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.score_cache = score_cache
+        self.fuzzy_calls = 0
+        self.fuzzy_calls_avoided = 0
+        # Each worker is already one of N processes; keep the rapidfuzz
+        # backend from also spawning a thread per core inside every worker.
+        worker_config = {**config, "matching": {**config["matching"], "workers": 1}}
+        initargs = (worker_config, list(issues))
+        if score_cache is not None:
+            initargs += (dict(score_cache.entries), score_cache.max_entries)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=initargs,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+    def find_matches(self, posts):
+        """Split posts into chunks, match them in parallel, merge in input order."""
+        if not posts:
+            return []
+        chunk_size = math.ceil(len(posts) / (self.workers * self.chunks_per_worker))
+        chunks = [posts[i:i + chunk_size] for i in range(0, len(posts), chunk_size)]
+
+        results = []
+        # Executor.map yields chunk results in submission order
+        for chunk_results, counters, stored in self._executor.map(_match_chunk, chunks):
+            results.extend(chunk_results)
+            self.fuzzy_calls += counters["fuzzy_calls"]
+            self.fuzzy_calls_avoided += counters["fuzzy_calls_avoided"]
+            if self.score_cache is not None:
+                self.score_cache.hits += counters["score_cache_hits"]
+                self.score_cache.misses += counters["score_cache_misses"]
+                for post_hash, issue_hash, score in stored:
+                    self.score_cache.put(post_hash, issue_hash, score)
+        return results
@@ -0,0 +1,124 @@
+"""Streaming stages between the source fetcher and routing.
+
+A run is a chain of generators: fetched pages -> posts -> unseen items ->
+(item, match) pairs -> routing tallies -> the mode's sink loop. Each stage
+pulls from the one before it as items are needed, so memory is bounded by
+the match batch and the fetcher's page buffer rather than by backfill
+depth. Posts are normalized and flair-filtered by the fetcher's page
+parser before they enter the chain.
+
+Only the aggregates the run's outputs need are kept: the auto_comment and
+triage matches for the digest, and a bounded ranking of new content
+opportunities.
+"""
+
+import heapq
+import itertools
+
+from aurora_monitor.state import advance_watermark, is_seen
+
+
+def page_items(pages, state, counts=None):
+    """Flatten (subreddit, posts) pages into posts.
+
+    Advances each subreddit's watermark as its pages arrive, and adds the
+    posts per subreddit to counts if given.
+    """
+    for subreddit, posts in pages:
+        advance_watermark(state, subreddit, posts)
+        if counts is not None:
+            counts[subreddit] = counts.get(subreddit, 0) + len(posts)
+        yield from posts
+
+
+def counted(items, stats, key):
+    """Pass items through, counting them in stats[key]."""
+    for item in items:
+        stats[key] += 1
+        yield item
+
+
+def unseen(items, state, kind, stats=None):
+    """Drop items already in state or already passed this run.
+
+    Dropped items are counted in stats["skipped"] if stats is given.
+    """
+    passed = set()
+    for item in items:
+        if item["id"] in passed or is_seen(state, item["id"], kind=kind):
+            if stats is not None:
+                stats["skipped"] += 1
+            continue
+        passed.add(item["id"])
+        yield item
+
+
+def batched(items, size):
+    """Group items into lists of up to size."""
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def match_items(items, find_matches, batch_size):
+    """Match items batch_size at a time. Yields (item, match) in item order.
+
+    find_matches is Matcher.find_matches or MatcherPool.find_matches: one
+    result per item, in order.
+    """
+    for batch in batched(items, batch_size):
+        yield from zip(batch, find_matches(batch))
+
+
+def tally(pairs, stats):
+    """Count each match's routing and cross-references in stats; pass pairs through."""
+    for item, match in pairs:
+        if match["routing"] == "auto_comment":
+            stats["matches"] += 1
+        elif match["routing"] == "triage":
+            stats["triage_items"] += 1
+        else:
+            stats["skipped"] += 1
+        if match.get("cross_references"):
+            stats["cross_references"] += len(match["cross_references"])
+        yield item, match
+
+
+class TopOpportunities:
+    """Bounded ranking of new content opportunities, built as posts stream past.
+
+    Replaces holding every post for NewContentDetector.assess_unmatched():
+    each offered post is assessed at once and only the limit best-scoring
+    qualified opportunities (score >= detector.min_score) are kept.
+    """
+
+    def __init__(self, detector, limit):
+        self.detector = detector
+        self.limit = max(1, limit)
+        self.offered = 0
+        self.qualified = 0
+        self._heap = []
+        self._order = itertools.count()
+
+    def offer(self, post, match):
+        """Assess post if its match left it without an issue."""
+        self.offered += 1
+        if not self.detector.is_unmatched(match):
+            return
+        opportunity = self.detector.assess_post(post)
+        if opportunity["score"] < self.detector.min_score:
+            return
+        self.qualified += 1
+        # Earlier posts win ties, as the min-heap evicts the later one first
+        entry = (opportunity["score"], -next(self._order), opportunity)
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heappushpop(self._heap, entry)
+
+    def ranked(self):
+        """Kept opportunities, best score first."""
+        return [entry[2] for entry in sorted(self._heap, reverse=True)]
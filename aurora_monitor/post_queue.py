@@ -0,0 +1,171 @@
+"""Persisted queue of GitHub writes, posted concurrently under rate limits.
+
+A backfill posts hundreds of issue and discussion comments. They are
+queued to a JSON file before any is sent, and the ID of each write that
+finishes is appended to a log next to it, so a run killed part way leaves
+the rest on disk and the next run posts only those.
+
+Writes to one target (an issue or a discussion) go out one at a time in
+queue order, so paginated comments keep their order; up to workers
+targets are written at once. All writes share one TokenBucket paced under
+GitHub's content-creation limit. A rate-limit response pauses the bucket
+for its Retry-After (or backoff seconds, doubling on repeats) and the
+write is retried.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from aurora_monitor import github_api
+from aurora_monitor.github_client import GitHubError
+from aurora_monitor.sources.ratelimit import TokenBucket
+
+
+QUEUE_VERSION = 1
+
+# Write kind -> github_api function taking (target, body, repo=)
+WRITERS = {
+    "issue_comment": github_api.write_issue_comment,
+    "discussion_comment": github_api.write_discussion_comment,
+}
+
+
+class PostQueue:
+    """Queued writes in path, with finished write IDs logged to path.done.
+
+    Writes that fail for other reasons than rate limiting are reported and
+    dropped, as before; writes still rate limited after max_retries stay
+    queued for the next run. With a PostLedger, writes it has already
+    recorded are skipped and each one posted is recorded, so a write
+    posted just before a run was killed is not posted again on resume.
+    """
+
+    def __init__(self, path, repo=github_api.REPO, workers=3, requests_per_minute=60,
+                 max_retries=5, backoff=60, sleep=time.sleep, ledger=None):
+        self.path = path
+        self.ledger = ledger
+        self.done_path = f"{path}.done"
+        self.repo = repo
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.entries = []  # {"id", "kind", "target", "body"}
+        self.done = set()
+        self.posted = 0
+        self.failed = 0
+        self.skipped = 0  # Already in the ledger
+        self.rate_limited = 0
+        self.bucket = TokenBucket(requests_per_minute)
+        self._sleep = sleep
+        self._lock = threading.Lock()  # TokenBucket and the done log are shared by workers
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            if os.path.exists(self.done_path):
+                os.remove(self.done_path)  # Log of a queue that is gone
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            print(f"Warning: Ignoring unreadable post queue {self.path}")
+            return
+        if data.get("version") != QUEUE_VERSION:
+            return
+        self.entries = data["entries"]
+        if os.path.exists(self.done_path):
+            with open(self.done_path) as f:
+                self.done = {int(line) for line in f if line.strip()}
+
+    def add(self, kind, target, body):
+        """Queue a write; kind is a WRITERS key."""
+        if kind not in WRITERS:
+            raise ValueError(f"Unknown write kind: {kind}")
+        self.entries.append({"id": len(self.entries), "kind": kind,
+                             "target": target, "body": body})
+
+    def pending(self):
+        return [entry for entry in self.entries if entry["id"] not in self.done]
+
+    def save(self):
+        """Write the queued entries atomically, creating directories as needed."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": QUEUE_VERSION, "entries": self.entries}, f)
+        os.replace(tmp_path, self.path)
+
+    def run(self):
+        """Post every pending write. Removes the queue files once all are done."""
+        lanes = {}
+        for entry in self.pending():
+            lanes.setdefault((entry["kind"], entry["target"]), []).append(entry)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(self._run_lane, lanes.values()))
+        if not self.pending():
+            for path in (self.path, self.done_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        return self.stats()
+
+    def _run_lane(self, entries):
+        for entry in entries:
+            if not self._write(entry):
+                return  # Later writes to the target wait, to keep their order
+
+    def _write(self, entry):
+        """Post one write. Returns False if it is still rate limited and stays queued."""
+        writer = WRITERS[entry["kind"]]
+        if self.ledger is not None and self.ledger.has_body(entry["target"], entry["body"]):
+            self._finish(entry, skipped=True)
+            return True
+        for attempt in range(self.max_retries + 1):
+            with self._lock:
+                wait = self.bucket.reserve()
+            if wait > 0:
+                self._sleep(wait)
+            try:
+                writer(entry["target"], entry["body"], repo=self.repo)
+            except GitHubError as e:
+                if not e.rate_limited:
+                    print(f"  Error posting {entry['kind']} to {entry['target']}: {e}")
+                    self._finish(entry, failed=True)
+                    return True
+                delay = e.retry_after if e.retry_after is not None else self.backoff * 2 ** attempt
+                with self._lock:
+                    self.rate_limited += 1
+                    self.bucket.pause(delay)
+                print(f"  Rate limited posting to {entry['target']}; retrying in {delay:.0f}s")
+                continue
+            if self.ledger is not None:
+                self.ledger.record(entry["target"], None, entry["body"])
+            self._finish(entry)
+            return True
+        print(f"  Still rate limited; left {entry['kind']} to {entry['target']} queued")
+        return False
+
+    def _finish(self, entry, failed=False, skipped=False):
+        with self._lock:
+            if failed:
+                self.failed += 1
+            elif skipped:
+                self.skipped += 1
+            else:
+                self.posted += 1
+            self.done.add(entry["id"])
+            with open(self.done_path, "a") as f:
+                f.write(f"{entry['id']}\n")
+
+    def stats(self):
+        """Return write counts for the run summary."""
+        return {
+            "posts_written": self.posted,
+            "posts_failed": self.failed,
+            "posts_already_posted": self.skipped,
+            "posts_rate_limited": self.rate_limited,
+            "posts_queued": len(self.pending()),
+        }
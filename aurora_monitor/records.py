@@ -0,0 +1,121 @@
+"""Compact record types for posts, comments and match results.
+
+A deep backfill holds hundreds of thousands of normalized items, and a
+dict per item (a hash table sized for its 7-15 keys) dominated resident
+memory. These slotted dataclasses store the same fields as fixed
+attributes, and intern the short strings that repeat across items
+(subreddit, author, routing), so each value is held once.
+
+Every record is a Mapping over its fields that also allows item
+assignment to an existing field, so code written against the normalized
+dicts (item["id"], item.get("body"), "selftext" in item,
+{**item}) keeps working unchanged. Use dict(record) where a real dict is
+needed, e.g. for JSON.
+"""
+
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record(Mapping):
+    """Dict-style access to a slotted dataclass's fields.
+
+    Subclasses are dataclasses with slots=True, so __slots__ lists their
+    fields in order. Names in INTERNED are interned on construction.
+    """
+
+    __slots__ = ()
+    INTERNED = ()
+
+    def __post_init__(self):
+        for name in self.INTERNED:
+            setattr(self, name, _intern(getattr(self, name)))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a normalized dict, ignoring unknown keys."""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(f"{type(self).__name__} has no field {key!r}")
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class Post(Record):
+    """A normalized Reddit post."""
+
+    INTERNED = ("subreddit", "author", "link_flair_text")
+
+    id: str
+    subreddit: str = ""
+    author: str = "[deleted]"
+    title: str = ""
+    selftext: str = ""
+    permalink: str = ""
+    created_utc: float = None
+    link_flair_text: str = None
+    url: str = ""
+    num_comments: int = 0
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class Comment(Record):
+    """A normalized Reddit comment."""
+
+    INTERNED = ("subreddit", "author")
+
+    id: str
+    subreddit: str = ""
+    author: str = "[deleted]"
+    body: str = ""
+    permalink: str = ""
+    created_utc: float = None
+    parent_id: str = ""
+    link_id: str = ""  # "t3_<post id>" of the post the comment is on
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class MatchResult(Record):
+    """Matcher.find_matches() result for one post or comment."""
+
+    INTERNED = ("subreddit", "author", "routing", "content_type")
+
+    post_id: str
+    subreddit: str = ""
+    author: str = ""
+    title: str = ""
+    permalink: str = ""
+    created_utc: float = None
+    score: float = 0
+    routing: str = "ignore"
+    issue: int = None
+    issue_title: str = None
+    quote: str = ""
+    cross_references: list = None
+    content_type: str = "post"
+    parent_post_id: str = None
+    parent_title: str = None  # Set by the caller for comment matches
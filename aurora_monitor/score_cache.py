@@ -0,0 +1,99 @@
+"""Persistent cache of post-issue match scores.
+
+Backfills and re-runs score the same posts against the same issues over and
+over. Scores are cached on disk keyed by a hash of the post content, a hash
+of the issue title and body, and a hash of the matching config, so any
+change to thresholds, keywords or penalties in config.yaml invalidates the
+whole cache automatically.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+
+CACHE_VERSION = 1
+
+
+def content_hash(*parts):
+    """Return a short stable hash of the given text parts."""
+    digest = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return digest[:16]
+
+
+def config_hash(matching_config, ignore=()):
+    """Hash the matching config, skipping keys that don't affect scores."""
+    relevant = {k: v for k, v in matching_config.items() if k not in ignore}
+    return content_hash(json.dumps(relevant, sort_keys=True, default=str))
+
+
+class ScoreCache:
+    """Size-bounded LRU cache of scores, persisted as a JSON file.
+
+    Entries are kept in least-recently-used order; once max_entries is
+    exceeded the oldest entries are evicted. A cache file written under a
+    different config hash is discarded on load. With path None the cache
+    is in memory only.
+    """
+
+    def __init__(self, path, config_hash, max_entries=200000):
+        self.path = path
+        self.config_hash = config_hash
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+        self._load()
+
+    def _load(self):
+        if self.path is None or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            print(f"Warning: Ignoring unreadable score cache {self.path}")
+            return
+        if data.get("version") != CACHE_VERSION or data.get("config_hash") != self.config_hash:
+            return  # Matching config changed — start fresh
+        self.entries = OrderedDict(data.get("entries", {}))
+        self._evict()
+
+    def get(self, post_hash, issue_hash):
+        """Return the cached score for a pair, or None on a miss."""
+        key = f"{post_hash}:{issue_hash}"
+        score = self.entries.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, post_hash, issue_hash, score):
+        """Store a pair's score, evicting the least recently used if full."""
+        key = f"{post_hash}:{issue_hash}"
+        self.entries[key] = score
+        self.entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def save(self):
+        """Write the cache atomically, creating directories as needed."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "version": CACHE_VERSION,
+                "config_hash": self.config_hash,
+                "entries": self.entries,
+            }, f)
+        os.replace(tmp_path, self.path)
+
+    def stats(self):
+        """Return hit/miss counters for the run summary."""
+        return {"score_cache_hits": self.hits, "score_cache_misses": self.misses}
@@ -0,0 +1,50 @@
+"""JSON decoding of source API responses.
+
+Reddit objects carry ~100 fields each, of which the fetcher reads about
+ten. Decoding a 5,000-comment thread with json.loads() builds the whole
+tree, every unused field included, before any of it can be dropped. With
+prune=True each object is cut down to the fields the parsers read as soon
+as the decoder finishes it, so the full tree never exists: peak memory is
+the response body plus the pruned tree, and skipping the unused dicts
+also makes decoding faster than a plain json.loads().
+
+Bounded responses (listing pages) are decoded with orjson when it is
+installed, which is faster still but cannot prune.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Every key RedditFetcher's listing, comment and morechildren parsers read
+REDDIT_FIELDS = frozenset({
+    # Envelopes
+    "kind", "data", "children", "after", "json", "things", "replies",
+    # Posts
+    "id", "subreddit", "author", "title", "selftext", "permalink",
+    "created_utc", "link_flair_text", "url", "num_comments",
+    # Comments and "more" stubs
+    "body", "parent_id", "link_id", "count",
+})
+
+DECODER = "orjson" if orjson is not None else "json"
+
+
+def _keep_fields(pairs):
+    return {key: value for key, value in pairs if key in REDDIT_FIELDS}
+
+
+def loads(body, prune=False):
+    """Decode a JSON response body (bytes or str).
+
+    prune=True keeps only REDDIT_FIELDS in every object, at every depth.
+    """
+    if prune:
+        return json.loads(body, object_pairs_hook=_keep_fields)
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
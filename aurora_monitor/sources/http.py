@@ -0,0 +1,132 @@
+"""Pooled HTTP session with per-request timing for source fetchers.
+
+A single requests.Session keeps connections to the source alive between
+requests, negotiates gzip, and retries connection errors and transient 5xx
+responses through urllib3. Rate-limit responses (429) are left to the
+fetcher, which honours Retry-After itself.
+
+Connections are instrumented so each request can report where its time
+went: TCP connect, TLS handshake, time to first byte, and body transfer.
+Connect and TLS are zero when a pooled connection is reused.
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+
+# Connect timings of the current thread's last request; urllib3 opens
+# connections on the thread that sends the request.
+_local = threading.local()
+
+
+def _record_connect(tcp_seconds, tls_seconds):
+    _local.connect = (tcp_seconds, tls_seconds)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """HTTPConnection that records its TCP connect time."""
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _record_connect(time.perf_counter() - start, 0.0)
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """HTTPSConnection that records TCP connect and TLS handshake times."""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        self._tcp_seconds = time.perf_counter() - start
+        return sock
+
+    def connect(self):
+        self._tcp_seconds = 0.0
+        start = time.perf_counter()
+        super().connect()
+        total = time.perf_counter() - start
+        _record_connect(self._tcp_seconds, total - self._tcp_seconds)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools use the timed connection classes."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+def build_session(user_agent, pool_size=4, retries=3, backoff_factor=0.5):
+    """Build a keep-alive session with gzip negotiation and retry adapters.
+
+    pool_size should be at least the number of concurrent requests so no
+    connection is discarded after use.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+        # Otherwise urllib3 retries any 429 carrying Retry-After (Reddit's
+        # always do) and sleeps inside the adapter, hidden from the fetcher
+        respect_retry_after_header=False,
+    )
+    adapter = TimedHTTPAdapter(pool_connections=2, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": user_agent,
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def timed_get(session, url, timeout=None, headers=None):
+    """GET url through session. Returns (response, timing dict in ms).
+
+    The timing dict has connect_ms, tls_ms, ttfb_ms, body_ms and total_ms,
+    plus reused (True when no new connection was opened).
+    """
+    _local.connect = None
+    start = time.perf_counter()
+    response = session.get(url, timeout=timeout, headers=headers)
+    total = time.perf_counter() - start
+
+    connect = getattr(_local, "connect", None)
+    tcp_seconds, tls_seconds = connect or (0.0, 0.0)
+    # response.elapsed runs from sending the request to parsing the headers,
+    # including any connection set-up; the body is read after that
+    headers_seconds = response.elapsed.total_seconds()
+    timing = {
+        "connect_ms": round(tcp_seconds * 1000, 1),
+        "tls_ms": round(tls_seconds * 1000, 1),
+        "ttfb_ms": round(max(0.0, headers_seconds - tcp_seconds - tls_seconds) * 1000, 1),
+        "body_ms": round(max(0.0, total - headers_seconds) * 1000, 1),
+        "total_ms": round(total * 1000, 1),
+        "reused": connect is None,
+    }
+    return response, timing
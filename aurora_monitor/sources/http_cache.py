@@ -0,0 +1,100 @@
+"""On-disk cache of source API responses with conditional revalidation.
+
+Re-running backfill or dry-run while tuning thresholds would otherwise
+refetch identical listing and comment JSON every time. Responses are
+stored one file per URL. A fresh entry (younger than its endpoint's TTL)
+is served without a request. A stale entry is revalidated with its ETag
+or Last-Modified, so an unchanged response costs a 304 and no body.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+
+class OfflineCacheMiss(Exception):
+    """Raised in offline mode when a URL has no cached response."""
+
+
+class ResponseCache:
+    """Directory of cached JSON responses keyed by URL.
+
+    ttls maps endpoint type to seconds; endpoint_type(url) picks the type.
+    """
+
+    def __init__(self, directory, ttls=None, clock=time.time):
+        self.directory = directory
+        self.ttls = ttls or {}
+        self._clock = clock
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @staticmethod
+    def endpoint_type(url):
+        """Classify a Reddit URL as a comments or listing endpoint."""
+        if "/comments/" in url or "/api/morechildren" in url:
+            return "comments"
+        return "listing"
+
+    def _path(self, url):
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def get(self, url):
+        """Return the cached entry for url, or None."""
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            print(f"Warning: Ignoring unreadable cached response {path}")
+            return None
+        return entry if entry.get("url") == url else None
+
+    def is_fresh(self, entry):
+        """Whether an entry is within its endpoint type's TTL."""
+        ttl = self.ttls.get(self.endpoint_type(entry["url"]), 0)
+        return self._clock() - entry["fetched_at"] < ttl
+
+    def validators(self, entry):
+        """Conditional request headers for revalidating an entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url, data, etag=None, last_modified=None):
+        """Store a response body and its validators, atomically."""
+        self._write({
+            "url": url,
+            "fetched_at": self._clock(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "data": data,
+        })
+
+    def refresh(self, entry):
+        """Mark an entry fresh again after a 304 Not Modified."""
+        self._write({**entry, "fetched_at": self._clock()})
+
+    def _write(self, entry):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(entry["url"])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def stats(self):
+        """Return hit/revalidation/miss counters for the run summary."""
+        return {
+            "http_cache_hits": self.hits,
+            "http_cache_revalidated": self.revalidated,
+            "http_cache_misses": self.misses,
+        }
@@ -0,0 +1,98 @@
+"""Request rate limiting shared by concurrent source fetchers."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket enforcing a per-minute request budget across coroutines.
+
+    Tokens refill continuously at requests_per_minute / 60 per second, up to
+    burst. acquire() reserves a token immediately and sleeps until it is
+    due, so concurrent callers queue in call order without a lock and the
+    long-run request rate never exceeds the budget, however many requests
+    are in flight.
+
+    pause() holds every later reservation until a deadline. Overlapping
+    pauses keep the latest deadline rather than adding up, tokens do not
+    refill until it passes, and set_rate() leaves it in place.
+    """
+
+    def __init__(self, requests_per_minute, burst=1, clock=time.monotonic):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.rate = requests_per_minute / 60.0
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = None
+        self.waited = 0.0  # Total seconds callers were held back
+        self.throttled = 0.0  # Part of waited spent in pause()s rather than pacing
+
+    @property
+    def requests_per_minute(self):
+        return self.rate * 60.0
+
+    def set_rate(self, requests_per_minute):
+        """Change the refill rate; tokens earned so far and any pause are kept."""
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self._refill()
+        self.rate = requests_per_minute / 60.0
+
+    def pause(self, seconds):
+        """Hold back every request reserved from now on for at least seconds."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+        until = self._updated + seconds
+        if self._paused_until is None or until > self._paused_until:
+            self._paused_until = until
+
+    def _pause_left(self):
+        if self._paused_until is None:
+            return 0.0
+        return max(0.0, self._paused_until - self._updated)
+
+    def _refill(self):
+        now = self._clock()
+        start = self._updated
+        if self._paused_until is not None:
+            start = max(start, min(self._paused_until, now))  # No refill while paused
+        self._tokens = min(self.burst, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+    def reserve(self):
+        """Take one token and return the seconds until it may be used.
+
+        That is the rest of any pause plus the wait for the token, which
+        only starts to refill once the pause ends.
+        """
+        self._refill()
+        self._tokens -= 1
+        return self._pause_left() + max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self):
+        """Wait until a request may be sent under the budget."""
+        wait = self.reserve()
+        if wait > 0:
+            self.waited += wait
+            self.throttled += min(wait, self._pause_left())
+            await asyncio.sleep(wait)
+
+
+def pace_from_headers(headers, max_requests_per_minute):
+    """Read Reddit's rate-limit headers into a pacing decision.
+
+    Returns ("pause", seconds) when the budget is spent, ("rate", rpm) to
+    spread the remaining budget evenly over the rest of the window (capped
+    at max_requests_per_minute), or None when the headers are absent.
+    """
+    try:
+        remaining = float(headers["X-Ratelimit-Remaining"])
+        reset = float(headers["X-Ratelimit-Reset"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if remaining < 1:
+        return ("pause", max(reset, 0.0))
+    return ("rate", min(remaining / max(reset, 1.0) * 60.0, max_requests_per_minute))
@@ -1,13 +1,22 @@
 """Reddit JSON API fetcher for r/aurora4x and r/aurora."""
 
+import asyncio
+import queue
+import threading
 import time
-import requests
+
+from aurora_monitor.records import Comment, Post
+from aurora_monitor.sources import decode
+from aurora_monitor.sources.http import build_session, timed_get
+from aurora_monitor.sources.http_cache import OfflineCacheMiss, ResponseCache
+from aurora_monitor.sources.ratelimit import TokenBucket, pace_from_headers
 
 
 class RedditFetcher:
     """Fetch posts and comments from Reddit subreddits via JSON API."""
 
     BASE_URL = "https://www.reddit.com"
+    MORECHILDREN_BATCH = 100  # most comment IDs /api/morechildren accepts
 
     def __init__(self, config):
         reddit_cfg = config["reddit"]
@@ -16,17 +25,122 @@ class RedditFetcher:
         self.rate_limit_delay = reddit_cfg.get("rate_limit_delay", 1.0)
         self.max_retries = reddit_cfg.get("max_retries", 3)
         self.backfill_max_pages = reddit_cfg.get("backfill_max_pages", 10)
+        self.expand_comments = reddit_cfg.get("expand_comments", True)
+        self.max_expand_requests = reddit_cfg.get("max_expand_requests", 20)
         self.skip_flairs = set(
             f.lower() for f in reddit_cfg.get("skip_flairs", [])
         )
+        self.timeout = reddit_cfg.get("timeout", 30)
+        self.debug_http = reddit_cfg.get("debug_http", False)
+        self.http_timings = []
+        self.decode_seconds = 0.0  # JSON decoding, kept apart from network time
+        self.response_cache = None  # Optional ResponseCache, set by the caller
+        self.offline = reddit_cfg.get("offline", False)  # Serve only from response_cache
+        # One keep-alive connection per concurrent request
+        self.session = build_session(
+            self.user_agent,
+            pool_size=reddit_cfg.get("max_in_flight", 4),
+            retries=self.max_retries,
+        )
+
+    def _send(self, url, headers=None):
+        """Send one GET over the pooled session and record its timing."""
+        response, timing = timed_get(self.session, url, timeout=self.timeout, headers=headers)
+        self.http_timings.append(timing)
+        if self.debug_http:
+            print(
+                f"  [HTTP] {response.status_code} {url} "
+                f"connect={timing['connect_ms']}ms tls={timing['tls_ms']}ms "
+                f"ttfb={timing['ttfb_ms']}ms body={timing['body_ms']}ms"
+                f"{' (reused)' if timing['reused'] else ''}"
+            )
+        return response
+
+    def timing_summary(self):
+        """Summarize request timings (and response cache use) for the run summary."""
+        summary = {"http_requests": len(self.http_timings)}
+        if self.http_timings:
+            count = len(self.http_timings)
+            summary.update({
+                "http_new_connections": sum(1 for t in self.http_timings if not t["reused"]),
+                "http_mean_ttfb_ms": round(sum(t["ttfb_ms"] for t in self.http_timings) / count, 1),
+                "http_mean_total_ms": round(sum(t["total_ms"] for t in self.http_timings) / count, 1),
+                "http_network_ms": round(sum(t["total_ms"] for t in self.http_timings), 1),
+                "json_decode_ms": round(self.decode_seconds * 1000, 1),
+                "json_decoder": decode.DECODER,
+            })
+        if self.response_cache is not None:
+            summary.update(self.response_cache.stats())
+        return summary
+
+    def _lookup(self, url):
+        """Check the response cache before a request.
+
+        Returns (data, entry): data to serve without a request (fresh, or
+        any cached entry when offline), else None and the stale entry to
+        revalidate, if there is one.
+        """
+        cache = self.response_cache
+        entry = cache.get(url) if cache is not None else None
+        if self.offline:
+            if entry is None:
+                if cache is not None:
+                    cache.misses += 1
+                raise OfflineCacheMiss(f"No cached response for {url}")
+            cache.hits += 1
+            return entry["data"], entry
+        if entry is not None and cache.is_fresh(entry):
+            cache.hits += 1
+            return entry["data"], entry
+        return None, entry
+
+    def _validators(self, entry):
+        """Conditional headers for revalidating a stale cache entry."""
+        if entry is None:
+            return None
+        return self.response_cache.validators(entry)
+
+    def _accept(self, url, response, entry):
+        """Turn a 200 or 304 response into JSON data, updating the cache."""
+        cache = self.response_cache
+        if response.status_code == 304:
+            cache.revalidated += 1
+            cache.refresh(entry)
+            return entry["data"]
+        data = self._decode(url, response.content)
+        if cache is not None:
+            cache.misses += 1
+            cache.put(url, data, etag=response.headers.get("ETag"),
+                      last_modified=response.headers.get("Last-Modified"))
+        return data
+
+    def _decode(self, url, body):
+        """Decode a response body, pruned to the parsed fields for comment trees.
+
+        Listing pages are bounded at 100 posts; comment trees are not, so
+        only they pay for pruning (see sources.decode).
+        """
+        start = time.perf_counter()
+        data = decode.loads(body, prune=ResponseCache.endpoint_type(url) == "comments")
+        elapsed = time.perf_counter() - start
+        self.decode_seconds += elapsed
+        if self.debug_http:
+            print(f"  [JSON] {len(body)} bytes decoded in {elapsed * 1000:.1f}ms {url}")
+        return data
 
     def _get(self, url):
-        """Make a rate-limited GET request with retry on 429."""
-        headers = {"User-Agent": self.user_agent}
+        """Make a rate-limited GET request with retry on 429.
+
+        Served from response_cache when it holds a fresh entry; a stale
+        entry is revalidated with a conditional request.
+        """
+        data, entry = self._lookup(url)
+        if data is not None:
+            return data
         for attempt in range(self.max_retries):
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                return response.json()
+            response = self._send(url, self._validators(entry))
+            if response.status_code == 200 or (response.status_code == 304 and entry):
+                return self._accept(url, response, entry)
             if response.status_code == 429:
                 wait = float(response.headers.get("Retry-After", 2 ** (attempt + 1)))
                 print(f"  Rate limited (429), waiting {wait:.0f}s...")
@@ -41,11 +155,22 @@ class RedditFetcher:
         Returns (posts, after_token) where posts is a list of normalized dicts
         and after_token is the pagination cursor for the next page.
         """
+        url = self._listing_url(subreddit, after)
+        posts, after_token = self._parse_listing(self._get(url), subreddit)
+
+        if self.rate_limit_delay > 0:
+            time.sleep(self.rate_limit_delay)
+
+        return posts, after_token
+
+    def _listing_url(self, subreddit, after=None):
         url = f"{self.BASE_URL}/r/{subreddit}/new.json?limit=100&raw_json=1"
         if after:
             url += f"&after={after}"
+        return url
 
-        data = self._get(url)
+    def _parse_listing(self, data, subreddit):
+        """Parse a /new listing into (normalized posts, after_token)."""
         listing = data.get("data", {})
         after_token = listing.get("after")
 
@@ -58,10 +183,6 @@ class RedditFetcher:
             if self._should_skip(normalized):
                 continue
             posts.append(normalized)
-
-        if self.rate_limit_delay > 0:
-            time.sleep(self.rate_limit_delay)
-
         return posts, after_token
 
     def fetch_post_comments(self, subreddit, post_id):
@@ -69,24 +190,77 @@ class RedditFetcher:
 
         Returns a list of normalized comment dicts.
         """
-        url = f"{self.BASE_URL}/r/{subreddit}/comments/{post_id}.json?raw_json=1"
-        data = self._get(url)
-
-        comments = []
-        if len(data) < 2:
-            return comments
+        return list(self.iter_post_comments(subreddit, post_id))
 
-        comment_listing = data[1].get("data", {})
-        for child in comment_listing.get("children", []):
-            if child["kind"] != "t1":
-                continue
-            comment = child["data"]
-            comments.append(self._normalize_comment(comment, subreddit))
+    def iter_post_comments(self, subreddit, post_id):
+        """Yield a post's normalized comments, replies included, as they arrive.
 
+        The comments page is walked depth first. With expand_comments on,
+        "more" stubs are then expanded through /api/morechildren in batches
+        of MORECHILDREN_BATCH IDs, and "continue this thread" stubs through
+        the parent comment's own page, until none remain or
+        max_expand_requests is spent. A failed expansion loses only its
+        branch.
+        """
+        walk = CommentTreeWalk(subreddit, post_id)
+        data = self._get(self._comments_url(subreddit, post_id))
         if self.rate_limit_delay > 0:
             time.sleep(self.rate_limit_delay)
+        yield from walk.walk(self._comment_children(data))
 
-        return comments
+        requests_left = self.max_expand_requests if self.expand_comments else 0
+        while walk.pending() and requests_left > 0:
+            for kind, url in self._expansion_urls(walk, subreddit, post_id, requests_left):
+                requests_left -= 1
+                try:
+                    data = self._get(url)
+                except Exception as e:
+                    print(f"  Warning: Comment expansion failed for {post_id} ({e})")
+                    continue
+                if self.rate_limit_delay > 0:
+                    time.sleep(self.rate_limit_delay)
+                yield from walk.walk(self._expansion_children(kind, data))
+        self._warn_unexpanded(walk, post_id)
+
+    def _comments_url(self, subreddit, post_id):
+        return f"{self.BASE_URL}/r/{subreddit}/comments/{post_id}.json?raw_json=1"
+
+    def _morechildren_url(self, post_id, comment_ids):
+        return (f"{self.BASE_URL}/api/morechildren.json?api_type=json"
+                f"&link_id=t3_{post_id}&children={','.join(comment_ids)}&raw_json=1")
+
+    def _thread_url(self, subreddit, post_id, comment_id):
+        return f"{self.BASE_URL}/r/{subreddit}/comments/{post_id}/_/{comment_id}.json?raw_json=1"
+
+    def _expansion_urls(self, walk, subreddit, post_id, limit):
+        """Take up to limit [(kind, url)] from walk's stubs: morechildren batches, then threads."""
+        urls = []
+        while walk.more_ids and len(urls) < limit:
+            batch = walk.more_ids[:self.MORECHILDREN_BATCH]
+            del walk.more_ids[:self.MORECHILDREN_BATCH]
+            urls.append(("more", self._morechildren_url(post_id, batch)))
+        while walk.thread_ids and len(urls) < limit:
+            urls.append(("thread", self._thread_url(subreddit, post_id, walk.thread_ids.pop(0))))
+        return urls
+
+    @staticmethod
+    def _comment_children(data):
+        """Top-level comment things of a comments page response."""
+        if len(data) < 2:
+            return []
+        return data[1].get("data", {}).get("children", [])
+
+    def _expansion_children(self, kind, data):
+        """Comment things of a morechildren or thread response."""
+        if kind == "more":
+            return data.get("json", {}).get("data", {}).get("things", [])
+        return self._comment_children(data)
+
+    @staticmethod
+    def _warn_unexpanded(walk, post_id):
+        if walk.pending():
+            print(f"  Warning: {len(walk.more_ids)} comments and {len(walk.thread_ids)} threads "
+                  f"of {post_id} left unexpanded (max_expand_requests)")
 
     def backfill(self, subreddit):
         """Paginate through a subreddit's history, up to backfill_max_pages.
@@ -114,29 +288,375 @@ class RedditFetcher:
 
     @staticmethod
     def _normalize_post(post, subreddit):
-        """Normalize a Reddit post dict to our standard format."""
-        return {
-            "id": post["id"],
-            "subreddit": post.get("subreddit", subreddit),
-            "author": post.get("author", "[deleted]"),
-            "title": post.get("title", ""),
-            "selftext": post.get("selftext", ""),
-            "permalink": post.get("permalink", ""),
-            "created_utc": post.get("created_utc"),
-            "link_flair_text": post.get("link_flair_text"),
-            "url": post.get("url", ""),
-            "num_comments": post.get("num_comments", 0),
-        }
+        """Normalize a Reddit post dict to a Post record."""
+        return Post(
+            id=post["id"],
+            subreddit=post.get("subreddit", subreddit),
+            author=post.get("author", "[deleted]"),
+            title=post.get("title", ""),
+            selftext=post.get("selftext", ""),
+            permalink=post.get("permalink", ""),
+            created_utc=post.get("created_utc"),
+            link_flair_text=post.get("link_flair_text"),
+            url=post.get("url", ""),
+            num_comments=post.get("num_comments", 0),
+        )
 
     @staticmethod
-    def _normalize_comment(comment, subreddit):
-        """Normalize a Reddit comment dict to our standard format."""
+    def _normalize_comment(comment, subreddit, post_id=None):
+        """Normalize a Reddit comment dict to a Comment record.
+
+        link_id names the comment's post; it falls back to post_id, the
+        post whose comments were fetched, if Reddit left it out.
+        """
+        link_id = comment.get("link_id") or (f"t3_{post_id}" if post_id else "")
+        return Comment(
+            id=comment["id"],
+            subreddit=subreddit,
+            author=comment.get("author", "[deleted]"),
+            body=comment.get("body", ""),
+            permalink=comment.get("permalink", ""),
+            created_utc=comment.get("created_utc"),
+            parent_id=comment.get("parent_id", ""),
+            link_id=link_id,
+        )
+
+
+class CommentTreeWalk:
+    """Iterative walk over one post's comment tree.
+
+    walk() yields each t1 comment once, in depth-first order, using an
+    explicit stack so reply depth is unbounded. "more" stubs are collected
+    for the caller to expand: their comment IDs for /api/morechildren, or,
+    for a "continue this thread" stub with no IDs, its parent comment.
+    """
+
+    def __init__(self, subreddit, post_id=None):
+        self.subreddit = subreddit
+        self.post_id = post_id
+        self.seen = set()
+        self.more_ids = []
+        self.thread_ids = []
+
+    def walk(self, things):
+        stack = list(reversed(things))
+        while stack:
+            thing = stack.pop()
+            data = thing.get("data", {})
+            if thing.get("kind") == "more":
+                self._collect(data)
+                continue
+            if thing.get("kind") != "t1":
+                continue
+            replies = data.get("replies")
+            if isinstance(replies, dict):
+                stack.extend(reversed(replies.get("data", {}).get("children", [])))
+            # A thread page repeats its parent comment; only its replies are new
+            if data["id"] in self.seen:
+                continue
+            self.seen.add(data["id"])
+            yield RedditFetcher._normalize_comment(data, self.subreddit, self.post_id)
+
+    def _collect(self, data):
+        children = data.get("children") or []
+        if children:
+            self.more_ids.extend(c for c in children if c not in self.seen)
+        elif data.get("parent_id", "").startswith("t1_"):
+            self.thread_ids.append(data["parent_id"][3:])
+
+    def pending(self):
+        return bool(self.more_ids or self.thread_ids)
+
+
+class AsyncRedditFetcher(RedditFetcher):
+    """RedditFetcher that keeps several requests in flight at once.
+
+    Requests run in worker threads under asyncio over the shared pooled
+    session, at most max_in_flight at a time, and a shared TokenBucket holds
+    them to requests_per_minute. The bucket replaces the fixed
+    rate_limit_delay sleep, so a backfill is bound by the request budget
+    rather than by latency plus sleep. The blocking methods inherited from
+    RedditFetcher are unchanged.
+
+    With adaptive_rate_limit on, every response's X-Ratelimit-Remaining and
+    X-Ratelimit-Reset headers re-pace the bucket so the remaining budget is
+    spread evenly over the rest of Reddit's window, and a 429's Retry-After
+    pauses all requests, not just the one that was throttled.
+
+    Setting paced to False sends requests without tokens, rate-limit pauses
+    or Retry-After waits, for replaying recorded traffic.
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        reddit_cfg = config["reddit"]
+        default_rpm = 60 / self.rate_limit_delay if self.rate_limit_delay > 0 else 60
+        self.requests_per_minute = reddit_cfg.get("requests_per_minute", default_rpm)
+        self.max_in_flight = reddit_cfg.get("max_in_flight", 4)
+        self.bucket = TokenBucket(self.requests_per_minute, burst=reddit_cfg.get("burst", 1))
+        self.adaptive_rate_limit = reddit_cfg.get("adaptive_rate_limit", True)
+        self.max_requests_per_minute = reddit_cfg.get("max_requests_per_minute", 100)
+        self.steady_max_pages = reddit_cfg.get("steady_max_pages", 10)
+        self.seen_run_stop = reddit_cfg.get("seen_run_stop", 5)
+        self.paced = True
+        self.throttled_429s = 0
+        self.retry_after_seconds = 0.0
+        self._in_flight = None
+        self._first_request = None
+        self._last_response = None
+
+    def _run(self, coro):
+        """Run a coroutine on a fresh event loop with its own in-flight limit."""
+        async def main():
+            self._in_flight = asyncio.Semaphore(self.max_in_flight)
+            return await coro
+        return asyncio.run(main())
+
+    async def _get_async(self, url):
+        """Rate-limited GET with retry on 429, run in a worker thread.
+
+        Cache hits are served without taking an in-flight slot or a token.
+        """
+        data, entry = self._lookup(url)
+        if data is not None:
+            return data
+        async with self._in_flight:
+            for attempt in range(self.max_retries):
+                if self.paced:
+                    await self.bucket.acquire()
+                if self._first_request is None:
+                    self._first_request = time.monotonic()
+                response = await asyncio.to_thread(self._send, url, self._validators(entry))
+                self._last_response = time.monotonic()
+                self._pace(response)
+                if response.status_code == 200 or (response.status_code == 304 and entry):
+                    return self._accept(url, response, entry)
+                if response.status_code == 429:
+                    wait = float(response.headers.get("Retry-After", 2 ** (attempt + 1)))
+                    print(f"  Rate limited (429), waiting {wait:.0f}s...")
+                    self.throttled_429s += 1
+                    self.retry_after_seconds += wait
+                    if not self.paced:
+                        continue
+                    if self.adaptive_rate_limit:
+                        self.bucket.pause(wait)
+                    else:
+                        await asyncio.sleep(wait)
+                    continue
+                response.raise_for_status()
+        raise Exception(f"Max retries ({self.max_retries}) exceeded for {url}")
+
+    def _pace(self, response):
+        """Re-pace the bucket from a response's rate-limit headers."""
+        if not (self.adaptive_rate_limit and self.paced):
+            return
+        decision = pace_from_headers(response.headers, self.max_requests_per_minute)
+        if decision is None:
+            return
+        action, value = decision
+        if action == "pause":
+            print(f"  Rate limit budget spent, pausing {value:.0f}s until reset...")
+            self.bucket.pause(value)
+        else:
+            self.bucket.set_rate(value)
+
+    def rate_summary(self):
+        """Report achieved request rate and time spent throttled and pacing.
+
+        throttled_seconds is time held back by 429 Retry-After waits and
+        spent-budget pauses; pacing_wait_seconds is the normal spacing of
+        requests under requests_per_minute.
+        """
+        requests_sent = len(self.http_timings)
+        elapsed = 0.0
+        if self._first_request is not None and self._last_response is not None:
+            elapsed = self._last_response - self._first_request
+        throttled = self.bucket.throttled
+        if not self.adaptive_rate_limit:
+            throttled += self.retry_after_seconds
         return {
-            "id": comment["id"],
-            "subreddit": subreddit,
-            "author": comment.get("author", "[deleted]"),
-            "body": comment.get("body", ""),
-            "permalink": comment.get("permalink", ""),
-            "created_utc": comment.get("created_utc"),
-            "parent_id": comment.get("parent_id", ""),
+            "requests_per_minute": round(requests_sent / elapsed * 60, 1) if elapsed > 0 else None,
+            "throttled_seconds": round(throttled, 1),
+            "pacing_wait_seconds": round(self.bucket.waited - self.bucket.throttled, 1),
+            "rate_limited_429s": self.throttled_429s,
         }
+
+    async def fetch_new_posts_async(self, subreddit, after=None):
+        """Async fetch_new_posts(). Returns (posts, after_token)."""
+        data = await self._get_async(self._listing_url(subreddit, after))
+        return self._parse_listing(data, subreddit)
+
+    async def fetch_post_comments_async(self, subreddit, post_id):
+        """Async fetch_post_comments(). Returns normalized comments.
+
+        Each round of stub expansions is fetched concurrently.
+        """
+        walk = CommentTreeWalk(subreddit, post_id)
+        data = await self._get_async(self._comments_url(subreddit, post_id))
+        comments = list(walk.walk(self._comment_children(data)))
+
+        requests_left = self.max_expand_requests if self.expand_comments else 0
+        while walk.pending() and requests_left > 0:
+            urls = self._expansion_urls(walk, subreddit, post_id, requests_left)
+            requests_left -= len(urls)
+            results = await asyncio.gather(
+                *(self._get_async(url) for _, url in urls), return_exceptions=True
+            )
+            for (kind, _), data in zip(urls, results):
+                if isinstance(data, Exception):
+                    print(f"  Warning: Comment expansion failed for {post_id} ({data})")
+                    continue
+                comments.extend(walk.walk(self._expansion_children(kind, data)))
+        self._warn_unexpanded(walk, post_id)
+        return comments
+
+    async def backfill_async(self, subreddit):
+        """Async backfill(). Pages of one subreddit are fetched in order."""
+        all_posts = []
+        async for posts in self._backfill_pages_async(subreddit):
+            all_posts.extend(posts)
+        return all_posts
+
+    async def _backfill_pages_async(self, subreddit):
+        """Yield each backfill page's posts, stopping at the first failed page."""
+        after = None
+        for page in range(self.backfill_max_pages):
+            try:
+                posts, after = await self.fetch_new_posts_async(subreddit, after=after)
+            except Exception as e:
+                print(f"  Warning: r/{subreddit} page {page + 1} failed ({e}), stopping pagination")
+                return
+            yield posts
+            if not after:
+                return
+
+    def iter_backfill(self, subreddits, buffer_pages=4):
+        """Backfill several subreddits concurrently, yielding pages as they arrive.
+
+        Yields (subreddit, posts) per listing page. The fetch loop runs on a
+        background thread and blocks once buffer_pages pages are waiting, so
+        a slow consumer holds back fetching instead of buffering the whole
+        backfill. Closing the generator early stops the fetch loop.
+        """
+        pages = queue.Queue(maxsize=buffer_pages)
+        stop = threading.Event()
+        done = object()
+        errors = []
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        async def produce(subreddit):
+            async for posts in self._backfill_pages_async(subreddit):
+                if not await asyncio.to_thread(put, (subreddit, posts)):
+                    return
+
+        async def produce_all():
+            await asyncio.gather(*(produce(sub) for sub in subreddits))
+
+        def run():
+            try:
+                self._run(produce_all())
+            except Exception as e:
+                errors.append(e)
+            finally:
+                put(done)
+
+        thread = threading.Thread(target=run, name="reddit-backfill", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            stop.set()
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    async def fetch_until_seen_async(self, subreddit, is_seen, watermark=None):
+        """Page through /new until reaching posts a previous run already covered.
+
+        Stops at the first post older than the watermark (the newest
+        created_utc a previous run processed), or once seen_run_stop
+        consecutive posts are already seen, or when the listing ends.
+        Every post newer than the stop point is returned, so nothing
+        between runs is skipped however busy the subreddit was. Hitting
+        steady_max_pages first prints a warning, since older new posts may
+        remain unfetched.
+
+        Returns (posts, pages_fetched).
+        """
+        all_posts = []
+        after = None
+        seen_run = 0
+        for page in range(1, self.steady_max_pages + 1):
+            posts, after = await self.fetch_new_posts_async(subreddit, after=after)
+            for post in posts:
+                created = post.get("created_utc")
+                if watermark is not None and created is not None and created < watermark:
+                    return all_posts, page
+                seen_run = seen_run + 1 if is_seen(post["id"]) else 0
+                if seen_run >= self.seen_run_stop:
+                    return all_posts, page
+                all_posts.append(post)
+            if not after:
+                return all_posts, page
+        print(f"  Warning: r/{subreddit} still had unseen posts after "
+              f"{self.steady_max_pages} pages; older posts may be missed")
+        return all_posts, self.steady_max_pages
+
+    def fetch_until_seen_many(self, subreddits, is_seen, watermarks):
+        """Run fetch_until_seen_async for several subreddits concurrently.
+
+        watermarks maps subreddit to its created_utc high-water mark (or
+        is missing it). Returns {subreddit: (posts, pages_fetched)}.
+        """
+        async def fetch_all():
+            return await asyncio.gather(*(
+                self.fetch_until_seen_async(sub, is_seen, watermarks.get(sub))
+                for sub in subreddits
+            ))
+        return dict(zip(subreddits, self._run(fetch_all())))
+
+    def fetch_new_posts_many(self, subreddits):
+        """Fetch the newest page of several subreddits concurrently.
+
+        Returns {subreddit: posts} in subreddit order.
+        """
+        async def fetch_all():
+            return await asyncio.gather(
+                *(self.fetch_new_posts_async(sub) for sub in subreddits)
+            )
+        results = self._run(fetch_all())
+        return {sub: posts for sub, (posts, _) in zip(subreddits, results)}
+
+    def backfill_many(self, subreddits):
+        """Backfill several subreddits concurrently.
+
+        Returns {subreddit: posts} in subreddit order.
+        """
+        async def backfill_all():
+            return await asyncio.gather(*(self.backfill_async(sub) for sub in subreddits))
+        return dict(zip(subreddits, self._run(backfill_all())))
+
+    def fetch_comments_many(self, targets):
+        """Fetch comments for (subreddit, post_id) pairs concurrently.
+
+        Returns one entry per target, in target order: the list of
+        normalized comments, or the exception that fetch raised.
+        """
+        async def fetch_all():
+            return await asyncio.gather(
+                *(self.fetch_post_comments_async(sub, post_id) for sub, post_id in targets),
+                return_exceptions=True,
+            )
+        return self._run(fetch_all())
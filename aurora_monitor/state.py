@@ -1,25 +1,39 @@
 """State management for community source monitors.
 
-Handles load/save/dedup of seen post and comment IDs.
+Handles load/save/dedup of seen post and comment IDs, the snapshot of the
+unverified issue set each run matched against, and the local corpus of
+seen items that lets new issues be matched against old posts.
 State is persisted as JSON files in the aurora_monitor/state/ directory.
 """
 
+import heapq
 import json
 import os
 
+from aurora_monitor.score_cache import content_hash
+
 
 DEFAULT_STATE = {
     "backfill_complete": False,
     "seen_posts": {},
     "seen_comments": {},
     "last_run": None,
+    "issue_hashes": {},
+    "watermarks": {},
 }
 
+# Fields of a normalized post or comment needed to re-match it later
+CORPUS_FIELDS = (
+    "id", "subreddit", "author", "title", "selftext", "body",
+    "permalink", "created_utc", "parent_id", "link_id",
+)
+
 
 def load_state(path):
     """Load state from a JSON file. Returns default state if file doesn't exist."""
     if not os.path.exists(path):
-        return {**DEFAULT_STATE, "seen_posts": {}, "seen_comments": {}}
+        return {**DEFAULT_STATE, "seen_posts": {}, "seen_comments": {}, "issue_hashes": {},
+                "watermarks": {}}
     with open(path) as f:
         return json.load(f)
 
@@ -41,3 +55,92 @@ def mark_seen(state, item_id, kind="post", timestamp=None):
     """Mark a post or comment ID as processed."""
     key = "seen_posts" if kind == "post" else "seen_comments"
     state[key][item_id] = timestamp
+
+
+def get_watermark(state, subreddit):
+    """Return the newest created_utc processed for a subreddit, or None."""
+    return state.get("watermarks", {}).get(subreddit)
+
+
+def advance_watermark(state, subreddit, posts):
+    """Raise a subreddit's watermark to the newest created_utc among posts."""
+    times = [p["created_utc"] for p in posts if p.get("created_utc") is not None]
+    current = get_watermark(state, subreddit)
+    if current is not None:
+        times.append(current)
+    if times:
+        state.setdefault("watermarks", {})[subreddit] = max(times)
+
+
+def issue_hashes(issues):
+    """Map issue number (as a string) to a hash of its title and body."""
+    return {
+        str(issue["number"]): content_hash(issue["title"], issue.get("body") or "")
+        for issue in issues
+    }
+
+
+def changed_issues(state, issues):
+    """Return issues that are new or edited since the last recorded snapshot."""
+    previous = state.get("issue_hashes", {})
+    current = issue_hashes(issues)
+    return [
+        issue for issue in issues
+        if previous.get(str(issue["number"])) != current[str(issue["number"])]
+    ]
+
+
+def record_issue_snapshot(state, issues):
+    """Record the issue set this run matched every seen item against."""
+    state["issue_hashes"] = issue_hashes(issues)
+
+
+def load_corpus(path):
+    """Load the seen-item corpus. Returns an empty corpus if the file doesn't exist."""
+    if not os.path.exists(path):
+        return {"posts": {}, "comments": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_corpus(path, corpus, max_items=None):
+    """Save the corpus, keeping only the newest max_items items of each kind."""
+    if max_items is not None:
+        for key in ("posts", "comments"):
+            items = corpus[key]
+            if len(items) > max_items:
+                newest = sorted(
+                    items.values(), key=lambda i: i.get("created_utc") or 0, reverse=True
+                )[:max_items]
+                corpus[key] = {item["id"]: item for item in newest}
+                corpus.get("_oldest", {}).pop(key, None)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"posts": corpus["posts"], "comments": corpus["comments"]}, f)
+
+
+def record_item(corpus, item, kind="post", max_items=None):
+    """Store the matching-relevant fields of a seen post or comment.
+
+    With max_items, the oldest item of the kind by created_utc is evicted
+    once there are more, so the corpus never grows past the cap during a
+    run. A heap of (created_utc, id) per kind, built on first use, is kept
+    in corpus["_oldest"]; it is not saved.
+    """
+    key = "posts" if kind == "post" else "comments"
+    items = corpus[key]
+    is_new = item["id"] not in items
+    items[item["id"]] = {
+        field: item[field] for field in CORPUS_FIELDS if field in item
+    }
+    if max_items is None:
+        return
+    heaps = corpus.setdefault("_oldest", {})
+    if key not in heaps:
+        heaps[key] = [(i.get("created_utc") or 0, i["id"]) for i in items.values()]
+        heapq.heapify(heaps[key])
+    elif is_new:
+        heapq.heappush(heaps[key], (item.get("created_utc") or 0, item["id"]))
+    while len(items) > max_items:
+        _, oldest = heapq.heappop(heaps[key])
+        items.pop(oldest, None)
@@ -0,0 +1,81 @@
+"""Fixtures shared across the aurora_monitor tests."""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced clock, for code that takes a clock callable."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers each request from server.routes[(method, path)], else server.default.
+
+    A route is a (status, payload) pair or (status, payload, headers), or a
+    callable taking the recorded request and returning one. Payloads that
+    are not bytes are sent as JSON. Bodies are gzipped when the client asks,
+    over keep-alive HTTP/1.1.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length)) if length else None
+        request = {
+            "method": self.command, "path": url.path,
+            "query": {k: v[0] for k, v in parse_qs(url.query).items()},
+            "body": body, "headers": dict(self.headers),
+            "client_port": self.client_address[1],
+        }
+        self.server.requests.append(request)
+        route = self.server.routes.get((self.command, url.path), self.server.default)
+        status, payload, *headers = route(request) if callable(route) else route
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+
+        self.send_response(status)
+        for key, value in (headers[0] if headers else {}).items():
+            self.send_header(key, value)
+        if data and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """A local threaded HTTP server; requests are recorded in http_server.requests."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.routes = {}
+    server.default = (404, {"message": "Not Found"})
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
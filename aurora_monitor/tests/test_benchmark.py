@@ -0,0 +1,160 @@
+"""Tests for the matching benchmark harness."""
+
+import json
+import os
+import random
+
+import pytest
+import yaml
+
+from aurora_monitor import benchmark
+from aurora_monitor.benchmark import (
+    bench_size, load_vocabulary, measure_recall, measure_record_memory, run_benchmark,
+    synthetic_issues, synthetic_items,
+    _percentile,
+)
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config.yaml")
+
+
+@pytest.fixture
+def config():
+    with open(CONFIG_PATH) as f:
+        return yaml.safe_load(f)
+
+
+@pytest.fixture
+def vocabulary():
+    return load_vocabulary()
+
+
+class TestSyntheticCorpus:
+    """Test synthetic post, comment and issue generation."""
+
+    def test_vocabulary_from_fixtures(self, vocabulary):
+        """Words and authors come from the fixture files."""
+        words, authors = vocabulary
+        assert "launcher" in words
+        assert "SteveWalmsley" in authors
+
+    def test_same_seed_same_corpus(self, vocabulary):
+        """A fixed seed reproduces the same corpus."""
+        words, authors = vocabulary
+        first = synthetic_items(50, words, authors, random.Random(7))
+        second = synthetic_items(50, words, authors, random.Random(7))
+        assert first == second
+
+    def test_items_mix_posts_and_comments(self, vocabulary):
+        """Items include both posts and comments in normalized shape."""
+        words, authors = vocabulary
+        items = synthetic_items(200, words, authors, random.Random(0))
+        comments = [i for i in items if "body" in i]
+        posts = [i for i in items if "selftext" in i]
+        assert comments and posts
+        assert len(comments) + len(posts) == 200
+        assert all(c["link_id"].startswith("t3_") for c in comments)
+
+    def test_issues_are_numbered(self, vocabulary):
+        """Issues get unique numbers and Verify: titles."""
+        words, _ = vocabulary
+        issues = synthetic_issues(20, words, random.Random(0))
+        assert [i["number"] for i in issues] == list(range(1, 21))
+        assert all(i["title"].startswith("Verify: [") for i in issues)
+
+
+class TestReport:
+    """Test benchmark report contents."""
+
+    def test_percentile_nearest_rank(self):
+        """Percentiles use the nearest-rank method."""
+        values = list(range(1, 101))
+        assert _percentile(values, 50) == 50
+        assert _percentile(values, 99) == 99
+        assert _percentile([3.0], 99) == 3.0
+
+    def test_bench_size_fields(self, config):
+        """A size run reports throughput, latency and peak RSS."""
+        result = bench_size(config, 20, 5, latency_sample=5)
+        assert result["pairs"] == 100
+        assert result["find_matches"]["pairs_per_sec"] > 0
+        assert result["find_matches"]["latency_sample"] == 5
+        for section in ("find_matches", "score_new_content", "map_to_chapters"):
+            assert result[section]["p50_ms"] <= result[section]["p99_ms"]
+        assert result["peak_rss_mb"] > 0
+
+    def test_report_is_json_serializable(self, config, monkeypatch):
+        """The full report round-trips through JSON."""
+        monkeypatch.setitem(benchmark.SIZES, "tiny", (10, 3))
+        report = run_benchmark(config, ["tiny"], latency_sample=2)
+        assert json.loads(json.dumps(report))["results"]["tiny"]["posts"] == 10
+        assert report["scoring_backend"] == "thefuzz"
+
+
+class TestRecallCheck:
+    """Test the offline candidate index recall check."""
+
+    @pytest.fixture
+    def fixture_corpus(self):
+        fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+        with open(os.path.join(fixtures, "github_issues.json")) as f:
+            issues = json.load(f)
+        posts = []
+        for name in ("reddit_posts.json", "new_content_posts.json"):
+            with open(os.path.join(fixtures, name)) as f:
+                posts.extend(json.load(f))
+        return issues, posts
+
+    def test_full_scan_has_perfect_recall(self, config, fixture_corpus):
+        """With the index disabled every issue is a candidate."""
+        issues, posts = fixture_corpus
+        config["matching"]["candidate_index"]["enabled"] = False
+        result = measure_recall(config, issues, posts)
+        assert result["method"] == "disabled"
+        assert result["recall"] == 1.0
+        assert result["mean_candidate_fraction"] == 1.0
+        assert result["result_agreement"] == 1.0
+        assert result["fuzzy_calls"] == result["full_scan_fuzzy_calls"]
+
+    @pytest.mark.parametrize("method", ["tokens", "minhash"])
+    def test_index_methods_on_fixtures(self, config, fixture_corpus, method):
+        """Both index methods route the fixtures like a full scan with fewer fuzzy calls."""
+        issues, posts = fixture_corpus
+        config["matching"]["candidate_index"]["method"] = method
+        result = measure_recall(config, issues, posts)
+        assert result["method"] == method
+        assert result["auto_comment_posts"] > 0
+        assert result["mean_candidate_fraction"] < 1.0
+        assert result["routing_agreement"] == 1.0
+        assert result["fuzzy_calls"] < result["full_scan_fuzzy_calls"]
+
+    def test_token_index_recall_on_fixtures(self, config, fixture_corpus):
+        """The token index retrieves every auto_comment match in the fixtures."""
+        issues, posts = fixture_corpus
+        result = measure_recall(config, issues, posts)
+        assert result["recall"] == 1.0
+        assert result["fuzzy_calls"] < 0.6 * result["full_scan_fuzzy_calls"]
+
+    def test_minhash_recall_on_synthetic_corpus(self, config, vocabulary):
+        """With the default one row per band MinHash keeps auto_comment matches."""
+        words, authors = vocabulary
+        rng = random.Random(0)
+        issues = synthetic_issues(50, words, rng)
+        items = synthetic_items(200, words, authors, rng)
+        config["matching"]["candidate_index"]["method"] = "minhash"
+        result = measure_recall(config, issues, items)
+        assert result["recall"] >= 0.99
+        assert result["routing_agreement"] >= 0.99
+        assert result["fuzzy_calls"] < result["full_scan_fuzzy_calls"]
+
+
+class TestRecordMemory:
+    """Test the dict vs record memory comparison."""
+
+    def test_records_smaller_than_dicts(self, vocabulary):
+        words, authors = vocabulary
+        items = synthetic_items(2000, words, authors, random.Random(0))
+        result = measure_record_memory(items)
+        assert result["items"] == 2000
+        for kind in ("posts_and_comments", "match_results"):
+            assert 0 < result[kind]["record_mb"] < result[kind]["dict_mb"]
+            assert result[kind]["saved_pct"] > 0
@@ -0,0 +1,188 @@
+"""Tests for HTTP and gh record/replay cassettes."""
+
+import gzip
+import json
+import subprocess
+import time
+
+import pytest
+
+from aurora_monitor import __main__ as monitor
+from aurora_monitor import github_api
+from aurora_monitor.cassette import Cassette, CassetteMiss
+from aurora_monitor.sources.http import build_session, timed_get
+from aurora_monitor.sources.reddit import AsyncRedditFetcher, RedditFetcher
+
+
+@pytest.fixture
+def server(http_server):
+    """Serves a numbered Reddit listing on every GET."""
+    def listing(request):
+        n = len(http_server.requests)
+        return 200, {"kind": "Listing", "data": {"after": None, "children": [
+            {"kind": "t3", "data": {"id": f"p{n}", "title": "Hull space"}},
+        ]}}, {"X-Ratelimit-Remaining": "99"}
+
+    http_server.default = listing
+    return http_server
+
+
+@pytest.fixture
+def fetcher_config():
+    return {"reddit": {"subreddits": ["aurora4x"], "user_agent": "test",
+                       "rate_limit_delay": 0, "max_retries": 1}}
+
+
+def _record_listing(server, path, config, count=1):
+    """Fetch the stub's listing count times through a recording fetcher."""
+    cassette = Cassette(path, "record")
+    fetcher = RedditFetcher(config)
+    fetcher.BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    cassette.install(fetcher.session)
+    results = [fetcher.fetch_new_posts("aurora4x")[0] for _ in range(count)]
+    cassette.save()
+    return results
+
+
+class TestHttpCassette:
+    """Test recording and replaying fetcher traffic."""
+
+    def test_replay_matches_recording_offline(self, server, fetcher_config, tmp_path):
+        """A replayed run sees the recorded responses without the server."""
+        path = str(tmp_path / "run.cassette.gz")
+        recorded = _record_listing(server, path, fetcher_config)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+        cassette = Cassette.load(path, latency=0)
+        fetcher = RedditFetcher(fetcher_config)
+        fetcher.BASE_URL = base_url
+        cassette.install(fetcher.session)
+        posts, _ = fetcher.fetch_new_posts("aurora4x")
+        assert posts == recorded[0]
+        assert cassette.stats() == {"cassette_replayed": 1}
+
+    def test_cassette_is_gzip_json(self, server, fetcher_config, tmp_path):
+        path = str(tmp_path / "run.cassette.gz")
+        _record_listing(server, path, fetcher_config)
+        with gzip.open(path, "rt") as f:
+            data = json.load(f)
+        [exchange] = data["http"]
+        assert exchange["status"] == 200
+        assert "Content-Encoding" not in exchange["headers"]
+        assert exchange["headers"]["X-Ratelimit-Remaining"] == "99"
+
+    def test_repeats_replayed_in_order_then_last_reused(self, server, fetcher_config,
+                                                        tmp_path):
+        """Repeated requests get their recorded responses in order."""
+        path = str(tmp_path / "run.cassette.gz")
+        _record_listing(server, path, fetcher_config, count=2)
+        session = build_session("test")
+        Cassette.load(path, latency=0).install(session)
+        url = f"http://127.0.0.1:{server.server_address[1]}/r/aurora4x/new.json?limit=100&raw_json=1"
+        ids = [timed_get(session, url)[0].json()["data"]["children"][0]["data"]["id"]
+               for _ in range(3)]
+        assert ids == ["p1", "p2", "p2"]
+
+    def test_latency(self, server, fetcher_config, tmp_path):
+        """Each replayed exchange takes the configured latency."""
+        path = str(tmp_path / "run.cassette.gz")
+        _record_listing(server, path, fetcher_config)
+        session = build_session("test")
+        Cassette.load(path, latency=0.2).install(session)
+        url = f"http://127.0.0.1:{server.server_address[1]}/r/aurora4x/new.json?limit=100&raw_json=1"
+        start = time.perf_counter()
+        timed_get(session, url)
+        assert time.perf_counter() - start >= 0.2
+
+    def test_unrecorded_request_misses(self, server, fetcher_config, tmp_path):
+        path = str(tmp_path / "run.cassette.gz")
+        _record_listing(server, path, fetcher_config)
+        session = build_session("test")
+        Cassette.load(path, latency=0).install(session)
+        with pytest.raises(CassetteMiss):
+            session.get("http://127.0.0.1:1/elsewhere")
+
+    def test_replay_not_rate_limited(self, http_server, tmp_path):
+        """A replayed backfill takes the cassette's latency, not Reddit's request budget."""
+        pages = 5
+
+        def listing(request):
+            n = len(http_server.requests)
+            after = f"t3_p{n}" if n < pages else None
+            return 200, {"kind": "Listing", "data": {"after": after, "children": [
+                {"kind": "t3", "data": {"id": f"p{n}", "title": "Hull space"}},
+            ]}}, {"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": "60"}
+
+        http_server.default = listing
+        reddit = {"subreddits": ["aurora4x"], "user_agent": "test", "max_retries": 1,
+                  "backfill_max_pages": pages, "requests_per_minute": 6000,
+                  "adaptive_rate_limit": False}
+        path = str(tmp_path / "run.cassette.gz")
+        cassette = Cassette(path, "record")
+        fetcher = AsyncRedditFetcher({"reddit": reddit})
+        fetcher.BASE_URL = f"http://127.0.0.1:{http_server.server_address[1]}"
+        cassette.install(fetcher.session)
+        recorded = fetcher.backfill_many(["aurora4x"])
+        cassette.save()
+
+        # Paced, this would take 4 x 2.5s of spacing plus a 60s spent-budget pause
+        reddit.update(requests_per_minute=24, adaptive_rate_limit=True, rate_limit_delay=2.5)
+        latency = 0.05
+        cassette = Cassette.load(path, latency=latency)
+        fetcher = monitor.open_fetcher({"reddit": reddit}, cassette)
+        fetcher.BASE_URL = f"http://127.0.0.1:{http_server.server_address[1]}"
+        start = time.perf_counter()
+        replayed = fetcher.backfill_many(["aurora4x"])
+        elapsed = time.perf_counter() - start
+        assert replayed == recorded
+        assert cassette.stats() == {"cassette_replayed": pages}
+        assert latency * pages <= elapsed < latency * pages + 1
+        assert fetcher.rate_summary()["throttled_seconds"] == 0
+
+    def test_other_version_rejected(self, tmp_path):
+        path = str(tmp_path / "old.cassette.gz")
+        with gzip.open(path, "wt") as f:
+            json.dump({"version": 1, "commands": [], "http": []}, f)
+        with pytest.raises(ValueError):
+            Cassette.load(path)
+
+
+class TestCommandCassette:
+    """Test recording and replaying gh invocations."""
+
+    @pytest.fixture(autouse=True)
+    def reset_github_cassette(self):
+        yield
+        github_api.cassette = None
+
+    def test_gh_record_and_replay(self, tmp_path, monkeypatch):
+        """gh output is recorded once and replayed without running gh."""
+        calls = []
+
+        def fake_run(cmd):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, '[{"number": 7, "title": "t"}]', "")
+
+        monkeypatch.setattr(github_api, "_run", fake_run)
+        path = str(tmp_path / "gh.cassette.gz")
+        github_api.cassette = Cassette(path, "record")
+        recorded = github_api.search_issues("hull", ["content-opportunity"])
+        github_api.cassette.save()
+
+        github_api.cassette = Cassette.load(path, latency=0)
+        assert github_api.search_issues("hull", ["content-opportunity"]) == recorded
+        assert recorded == [{"number": 7, "title": "t"}]
+        assert len(calls) == 1
+
+    def test_unrecorded_command_misses(self, tmp_path):
+        path = str(tmp_path / "gh.cassette.gz")
+        Cassette(path, "record").save()
+        github_api.cassette = Cassette.load(path, latency=0)
+        with pytest.raises(CassetteMiss):
+            github_api.search_issues("hull", [])
+
+    def test_unknown_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            Cassette(str(tmp_path / "x.gz"), "rewind")
@@ -0,0 +1,99 @@
+"""Tests for source response decoding."""
+
+import json
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aurora_monitor.sources import decode
+from aurora_monitor.sources.reddit import RedditFetcher
+
+
+def _comment(comment_id, replies=""):
+    return {"kind": "t1", "data": {
+        "id": comment_id, "author": "u", "body": f"body {comment_id}",
+        "permalink": f"/c/{comment_id}", "created_utc": 1708000000.0,
+        "parent_id": "t3_abc123", "replies": replies,
+        # Fields the parsers never read
+        "ups": 5, "gildings": {"gid_1": 0}, "all_awardings": [{"name": "x"}],
+        "author_flair_richtext": [], "body_html": "<p>body</p>",
+    }}
+
+
+def _thread():
+    nested = {"kind": "Listing", "data": {"after": None, "children": [
+        _comment("c2"),
+        {"kind": "more", "data": {"count": 3, "children": ["c3", "c4"],
+                                  "parent_id": "t1_c1", "depth": 1}},
+    ]}}
+    return [
+        {"kind": "Listing", "data": {"children": [
+            {"kind": "t3", "data": {"id": "abc123", "title": "Hull", "selftext": "",
+                                    "score": 10, "thumbnail": "self"}}]}},
+        {"kind": "Listing", "data": {"after": None, "children": [_comment("c1", nested)]}},
+    ]
+
+
+class TestLoads:
+    """Test decode.loads()."""
+
+    def test_prune_drops_unread_fields_at_every_depth(self):
+        data = decode.loads(json.dumps(_thread()).encode("utf-8"), prune=True)
+        c1 = data[1]["data"]["children"][0]["data"]
+        assert set(c1) == {"id", "author", "body", "permalink", "created_utc",
+                           "parent_id", "replies"}
+        more = c1["replies"]["data"]["children"][1]
+        assert more == {"kind": "more", "data": {"count": 3, "children": ["c3", "c4"],
+                                                 "parent_id": "t1_c1"}}
+        assert "score" not in data[0]["data"]["children"][0]["data"]
+
+    def test_unpruned_is_json_loads(self):
+        body = json.dumps(_thread())
+        assert decode.loads(body) == json.loads(body)
+
+    def test_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(decode, "orjson", None)
+        body = json.dumps(_thread()).encode("utf-8")
+        assert decode.loads(body) == json.loads(body)
+
+
+class TestFetcherDecoding:
+    """Test that the fetcher parses pruned responses like full ones."""
+
+    @pytest.fixture
+    def fetcher(self):
+        return RedditFetcher({"reddit": {"subreddits": ["aurora4x"], "user_agent": "test",
+                                         "rate_limit_delay": 0, "expand_comments": False}})
+
+    @staticmethod
+    def _response(payload):
+        response = MagicMock(status_code=200, elapsed=timedelta(0), headers={})
+        response.content = json.dumps(payload).encode("utf-8")
+        return response
+
+    @patch("requests.Session.get")
+    def test_comments_parse_unchanged(self, mock_get, fetcher, monkeypatch):
+        """Pruned comment trees normalize to the same comments."""
+        mock_get.return_value = self._response(_thread())
+        pruned = fetcher.fetch_post_comments("aurora4x", "abc123")
+        monkeypatch.setattr(decode, "REDDIT_FIELDS", _AllFields())
+        full = fetcher.fetch_post_comments("aurora4x", "abc123")
+        assert [dict(c) for c in pruned] == [dict(c) for c in full]
+        assert [c["id"] for c in pruned] == ["c1", "c2"]
+
+    @patch("requests.Session.get")
+    def test_decode_time_reported(self, mock_get, fetcher):
+        mock_get.return_value = self._response(_thread())
+        fetcher.fetch_post_comments("aurora4x", "abc123")
+        summary = fetcher.timing_summary()
+        assert summary["json_decode_ms"] >= 0
+        assert summary["json_decoder"] == decode.DECODER
+        assert fetcher.decode_seconds > 0
+
+
+class _AllFields:
+    """Stands in for REDDIT_FIELDS to disable pruning."""
+
+    def __contains__(self, key):
+        return True
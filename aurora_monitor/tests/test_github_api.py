@@ -224,3 +224,156 @@ class TestSearchIssues:
 
         results = github_api.search_issues("test", ["content-opportunity"])
         assert results == []
+
+
+def _graphql_response(issues):
+    """gh api graphql output for {number: (bodies, next_cursor)}."""
+    response = MagicMock()
+    response.returncode = 0
+    response.stdout = json.dumps({"data": {"repository": {
+        f"i{number}": {"comments": {
+            "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+            "nodes": [{"body": body} for body in bodies],
+        }}
+        for number, (bodies, cursor) in issues.items()
+    }}})
+    return response
+
+
+POST_BODY = "**Source:** [r/aurora4x — u/a](https://www.reddit.com/r/aurora4x/comments/abc123/hull_space/)"
+COMMENT_BODY = "[u/b](https://www.reddit.com/r/aurora4x/comments/abc123/hull_space/def456/)"
+
+
+class TestIssueReferences:
+    """Test the batched comment dedup pre-flight."""
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_urls_reference_their_last_id(self, mock_run):
+        """A post URL references the post; a comment URL only the comment."""
+        mock_run.return_value = _graphql_response({1: ([POST_BODY], None),
+                                                   2: ([COMMENT_BODY], None)})
+        references = github_api.fetch_issue_references([1, 2])
+        assert mock_run.call_count == 1
+        assert references.has(1, "abc123")
+        assert not references.has(2, "abc123")
+        assert references.has(2, "def456")
+        assert not references.has(1, "def456")
+        assert mock_run.call_count == 1
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_short_links_and_fullnames_referenced(self, mock_run):
+        """redd.it links, URLs without a subreddit and t1_/t3_ fullnames are references."""
+        mock_run.return_value = _graphql_response({1: ([
+            "Seen at https://redd.it/abc123 and https://reddit.com/comments/ghi789/x/",
+            "Also t1_def456 (t3_jkl012). Not a plain word like hangar1.",
+        ], None)})
+        references = github_api.fetch_issue_references([1])
+        assert references.ids[1] == {"abc123", "ghi789", "def456", "jkl012"}
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_issues_batched_per_query(self, mock_run, monkeypatch):
+        monkeypatch.setattr(github_api, "ISSUES_PER_QUERY", 2)
+        mock_run.side_effect = [_graphql_response({1: ([], None), 2: ([], None)}),
+                                _graphql_response({3: ([], None)})]
+        references = github_api.fetch_issue_references([3, 1, 2, 1])
+        assert mock_run.call_count == 2
+        assert set(references.ids) == {1, 2, 3}
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_long_threads_paged(self, mock_run):
+        """Issues with more comments are fetched again from their cursor."""
+        mock_run.side_effect = [_graphql_response({1: (["x"], "CUR1")}),
+                                _graphql_response({1: ([POST_BODY], None)})]
+        references = github_api.fetch_issue_references([1])
+        query = mock_run.call_args_list[1][0][0][-1]
+        assert 'after: "CUR1"' in query
+        assert references.has(1, "abc123")
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_failed_issues_fall_back_to_full_check(self, mock_run):
+        """Issues the pre-flight could not load are checked with gh api."""
+        failure = MagicMock(returncode=1, stderr="rate limited")
+        check = MagicMock(returncode=0, stdout="1\n")
+        mock_run.side_effect = [_graphql_response({1: (["x"], "CUR1")}), failure, check]
+        references = github_api.fetch_issue_references([1])
+        assert references.has(1, "abc123")
+        assert mock_run.call_args_list[2][0][0][1:3] == [
+            "api", f"repos/{github_api.REPO}/issues/1/comments"]
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_posted_references_recorded(self, mock_run):
+        mock_run.return_value = _graphql_response({1: ([], None)})
+        references = github_api.fetch_issue_references([1])
+        assert not references.has(1, "abc123")
+        references.add(1, "abc123")
+        assert references.has(1, "abc123")
+
+
+def _repo_id_response():
+    response = MagicMock(returncode=0)
+    response.stdout = json.dumps({"data": {"repository": {"id": "R_kgDORAJjeQ"}}})
+    return response
+
+
+def _discussion_response(node_id):
+    response = MagicMock(returncode=0)
+    response.stdout = json.dumps({"data": {"createDiscussion": {"discussion": {
+        "id": node_id, "url": f"https://github.com/x/y/discussions/{node_id}"}}}})
+    return response
+
+
+class TestNodeIdCache:
+    """Test memoized repository and category node IDs."""
+
+    @pytest.fixture(autouse=True)
+    def reset_node_ids(self):
+        yield
+        github_api.node_ids = None
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_repository_id_looked_up_once(self, mock_run):
+        """A second discussion skips the repository lookup."""
+        github_api.node_ids = github_api.NodeIdCache()
+        mock_run.side_effect = [_repo_id_response(), _discussion_response("D_1"),
+                                _discussion_response("D_2")]
+        assert github_api.post_discussion("T", "B", "CAT") == (True, "D_1")
+        assert github_api.post_discussion("T", "B", "CAT") == (True, "D_2")
+        assert mock_run.call_count == 3
+        assert github_api.node_ids.stats() == {"node_id_hits": 1, "node_id_lookups": 1}
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_failed_lookup_not_cached(self, mock_run):
+        github_api.node_ids = github_api.NodeIdCache()
+        mock_run.side_effect = [MagicMock(returncode=1, stderr="boom"), _repo_id_response()]
+        with pytest.raises(github_api.GitHubError):
+            github_api.repository_id()
+        assert github_api.repository_id() == "R_kgDORAJjeQ"
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_disk_cache_reused_within_ttl(self, mock_run, tmp_path, clock):
+        path = str(tmp_path / "state" / "node_ids.json")
+        mock_run.return_value = _repo_id_response()
+        github_api.node_ids = github_api.NodeIdCache(path, ttl=60, clock=clock)
+        github_api.repository_id()
+        github_api.node_ids.save()
+
+        github_api.node_ids = github_api.NodeIdCache(path, ttl=60, clock=clock)
+        assert github_api.repository_id() == "R_kgDORAJjeQ"
+        assert mock_run.call_count == 1
+
+        clock.now += 61
+        github_api.node_ids = github_api.NodeIdCache(path, ttl=60, clock=clock)
+        github_api.repository_id()
+        assert mock_run.call_count == 2
+
+    @patch("aurora_monitor.github_api.subprocess.run")
+    def test_discussion_category_by_slug(self, mock_run):
+        found = MagicMock(returncode=0, stdout=json.dumps(
+            {"data": {"repository": {"discussionCategory": {"id": "DIC_1"}}}}))
+        missing = MagicMock(returncode=0, stdout=json.dumps(
+            {"data": {"repository": {"discussionCategory": None}}}))
+        mock_run.side_effect = [found, missing]
+        assert github_api.discussion_category_id("monitor-digests") == "DIC_1"
+        assert 'discussionCategory(slug: "monitor-digests")' in mock_run.call_args[0][0][-1]
+        with pytest.raises(github_api.GitHubError):
+            github_api.discussion_category_id("nope")
@@ -0,0 +1,214 @@
+"""Tests for the in-process GitHub client, against a local stand-in server."""
+
+import subprocess
+
+import pytest
+
+from aurora_monitor import github_api
+from aurora_monitor.cassette import Cassette, CassetteMiss
+from aurora_monitor.github_client import GitHubClient, GitHubError
+
+
+@pytest.fixture
+def client(http_server):
+    return GitHubClient("test-token", api_url=f"http://127.0.0.1:{http_server.server_address[1]}")
+
+
+@pytest.fixture
+def use_client(client):
+    github_api.client = client
+    yield client
+    github_api.client = None
+
+
+REPO_PATH = f"/repos/{github_api.REPO}"
+
+
+class TestGitHubClient:
+    """Test the REST and GraphQL transport."""
+
+    def test_token_auth_and_pooled_connection(self, http_server, client):
+        """Every request carries the token and reuses one connection."""
+        http_server.routes[("GET", "/rate_limit")] = (200, {"ok": True})
+        for _ in range(3):
+            assert client.rest("GET", "rate_limit") == {"ok": True}
+        assert {r["headers"]["Authorization"] for r in http_server.requests} == {"Bearer test-token"}
+        assert len({r["client_port"] for r in http_server.requests}) == 1
+        assert client.stats() == {"github_api_requests": 3}
+
+    def test_http_error_raises(self, http_server, client):
+        with pytest.raises(GitHubError) as excinfo:
+            client.rest("GET", "repos/x/y")
+        assert excinfo.value.status == 404
+        assert "Not Found" in str(excinfo.value)
+
+    def test_graphql_errors_raise(self, http_server, client):
+        http_server.routes[("POST", "/graphql")] = (200, {"data": None,
+                                                     "errors": [{"message": "bad field"}]})
+        with pytest.raises(GitHubError, match="bad field"):
+            client.graphql("query { nope }")
+
+    def test_paginate(self, http_server, client):
+        """Pages are requested until a short one, then cut to limit."""
+        def comments(request):
+            page = int(request["query"]["page"])
+            return 200, [{"id": n} for n in range(100 if page == 1 else 30)]
+
+        http_server.routes[("GET", "/items")] = comments
+        assert len(client.paginate("items")) == 130
+        assert len(client.paginate("items", limit=50)) == 50
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        assert GitHubClient.from_env() is None
+        monkeypatch.setenv("GH_TOKEN", "abc")
+        client = GitHubClient.from_env()
+        assert client.session.headers["Authorization"] == "Bearer abc"
+
+
+class TestGitHubApiOverClient:
+    """Test the github_api functions with github_api.client set."""
+
+    def test_post_issue_comment(self, http_server, use_client):
+        http_server.routes[("POST", f"{REPO_PATH}/issues/7/comments")] = (201, {"id": 1})
+        body = "x" * (github_api.MAX_COMMENT_LENGTH + 10)
+        assert github_api.post_issue_comment(7, body) is True
+        [request] = http_server.requests
+        assert len(request["body"]["body"]) <= github_api.MAX_COMMENT_LENGTH
+
+    def test_post_issue_comment_failure(self, http_server, use_client, capsys):
+        assert github_api.post_issue_comment(7, "body") is False
+        assert "Error commenting on issue #7" in capsys.readouterr().out
+
+    def test_dry_run_makes_no_request(self, http_server, use_client):
+        assert github_api.post_issue_comment(7, "body", dry_run=True) is True
+        assert github_api.create_issue("t", "b", [], dry_run=True) == (True, None)
+        assert http_server.requests == []
+
+    def test_create_issue(self, http_server, use_client):
+        http_server.routes[("POST", f"{REPO_PATH}/issues")] = (201, {"number": 42})
+        assert github_api.create_issue("Title", "Body", ["a", "b"]) == (True, 42)
+        assert http_server.requests[0]["body"]["labels"] == ["a", "b"]
+
+    def test_list_issues_skips_pull_requests(self, http_server, use_client):
+        http_server.routes[("GET", f"{REPO_PATH}/issues")] = (200, [
+            {"number": 1, "title": "Issue", "body": None},
+            {"number": 2, "title": "PR", "body": "", "pull_request": {}},
+        ])
+        assert github_api.list_issues(["unverified"]) == [
+            {"number": 1, "title": "Issue", "body": ""}]
+        assert http_server.requests[0]["query"]["labels"] == "unverified"
+
+    def test_search_issues(self, http_server, use_client):
+        http_server.routes[("GET", "/search/issues")] = (200, {"items": [
+            {"number": 5, "title": "New content: hulls", "state": "open"}]})
+        assert github_api.search_issues("hulls", ["content-opportunity"]) == [
+            {"number": 5, "title": "New content: hulls"}]
+        q = http_server.requests[0]["query"]["q"]
+        assert f"repo:{github_api.REPO}" in q and 'label:"content-opportunity"' in q
+
+    def test_post_discussion(self, http_server, use_client):
+        """The repository ID and the mutation are both GraphQL calls."""
+        def graphql(request):
+            if "createDiscussion" in request["body"]["query"]:
+                return 200, {"data": {"createDiscussion": {"discussion": {
+                    "id": "D_1", "url": "https://github.com/x/y/discussions/1"}}}}
+            return 200, {"data": {"repository": {"id": "R_1"}}}
+
+        http_server.routes[("POST", "/graphql")] = graphql
+        assert github_api.post_discussion("T", "B", "CAT") == (True, "D_1")
+        assert 'repositoryId: "R_1"' in http_server.requests[1]["body"]["query"]
+
+    def test_issue_references(self, http_server, use_client):
+        http_server.routes[("POST", "/graphql")] = (200, {"data": {"repository": {"i3": {
+            "comments": {"pageInfo": {"hasNextPage": False, "endCursor": None},
+                         "nodes": [{"body": "https://www.reddit.com/r/a/comments/abc123/t/"}]},
+        }}}})
+        references = github_api.fetch_issue_references([3])
+        assert references.has(3, "abc123")
+
+
+class TestClientCassette:
+    """Test recording and replaying client traffic."""
+
+    def test_replay_without_server(self, http_server, client, tmp_path):
+        http_server.routes[("POST", f"{REPO_PATH}/issues")] = (201, {"number": 42})
+        path = str(tmp_path / "gh.cassette.gz")
+        cassette = Cassette(path, "record")
+        cassette.install(client.session)
+        github_api.client = client
+        try:
+            assert github_api.create_issue("T", "B", []) == (True, 42)
+            cassette.save()
+            http_server.shutdown()
+
+            replay = GitHubClient("replay", api_url=client.api_url)
+            Cassette.load(path, latency=0).install(replay.session)
+            github_api.client = replay
+            assert github_api.create_issue("T", "B", []) == (True, 42)
+        finally:
+            github_api.client = None
+
+
+    def test_graphql_posts_replayed_by_body(self, http_server, client, tmp_path):
+        """POSTs to one URL are matched by body, so replay order does not matter."""
+        http_server.routes[("POST", "/graphql")] = lambda request: (
+            200, {"data": {"echo": request["body"]["query"]}})
+        path = str(tmp_path / "gh.cassette.gz")
+        cassette = Cassette(path, "record")
+        cassette.install(client.session)
+        assert client.graphql("query { a }") == {"echo": "query { a }"}
+        assert client.graphql("query { b }") == {"echo": "query { b }"}
+        cassette.save()
+
+        replay = GitHubClient("replay", api_url=client.api_url)
+        Cassette.load(path, latency=0).install(replay.session)
+        assert replay.graphql("query { b }") == {"echo": "query { b }"}
+        assert replay.graphql("query { a }") == {"echo": "query { a }"}
+        with pytest.raises(CassetteMiss):
+            replay.graphql("query { c }")
+
+class TestRateLimitErrors:
+    """Test rate limit detection on error responses."""
+
+    def test_secondary_rate_limit_retry_after(self, http_server, client):
+        http_server.routes[("POST", "/repos/x/y/issues/1/comments")] = (
+            403, {"message": "You have exceeded a secondary rate limit."}, {"Retry-After": "42"})
+        with pytest.raises(GitHubError) as excinfo:
+            client.rest("POST", "repos/x/y/issues/1/comments", body={"body": "b"})
+        assert excinfo.value.rate_limited
+        assert excinfo.value.retry_after == 42
+
+    def test_permission_error_not_rate_limited(self, http_server, client):
+        http_server.routes[("GET", "/repos/x/y")] = (403, {"message": "Resource not accessible"})
+        with pytest.raises(GitHubError) as excinfo:
+            client.rest("GET", "repos/x/y")
+        assert not excinfo.value.rate_limited
+
+    def test_graphql_rate_limited_error(self, http_server, client):
+        """A RATE_LIMITED GraphQL error on a 200 response is a rate limit."""
+        http_server.routes[("POST", "/graphql")] = (
+            200, {"data": None, "errors": [{"type": "RATE_LIMITED",
+                                            "message": "API rate limit exceeded"}]},
+            {"Retry-After": "30"})
+        with pytest.raises(GitHubError) as excinfo:
+            client.graphql("mutation { addComment }")
+        assert excinfo.value.rate_limited
+        assert excinfo.value.retry_after == 30
+
+    def test_graphql_other_error_not_rate_limited(self, http_server, client):
+        http_server.routes[("POST", "/graphql")] = (
+            200, {"data": None, "errors": [{"type": "NOT_FOUND", "message": "gone"}]},
+            {"Retry-After": "30"})
+        with pytest.raises(GitHubError) as excinfo:
+            client.graphql("query { nope }")
+        assert not excinfo.value.rate_limited
+        assert excinfo.value.retry_after is None
+
+    def test_gh_rate_limit_detected(self, monkeypatch):
+        monkeypatch.setattr(github_api, "_run", lambda cmd: subprocess.CompletedProcess(
+            cmd, 1, "", "HTTP 403: You have exceeded a secondary rate limit"))
+        with pytest.raises(GitHubError) as excinfo:
+            github_api.write_issue_comment(1, "body")
+        assert excinfo.value.rate_limited
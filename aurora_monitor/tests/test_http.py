@@ -0,0 +1,199 @@
+"""Tests for the pooled HTTP session, against a local stub server."""
+
+import pytest
+
+from aurora_monitor.sources.http import build_session, timed_get
+from aurora_monitor.sources.http_cache import OfflineCacheMiss, ResponseCache
+from aurora_monitor.sources.reddit import AsyncRedditFetcher, RedditFetcher
+
+
+@pytest.fixture
+def stub_server(http_server):
+    """Serves http_server.payload on every GET, with optional 503s and ETags."""
+    http_server.failures_left = 0
+    http_server.rate_limited_left = 0
+    http_server.etag = None
+    http_server.payload = {"kind": "Listing", "data": {"after": None, "children": []}}
+
+    def respond(request):
+        headers = {"ETag": http_server.etag} if http_server.etag else {}
+        if request["path"].startswith("/flaky") and http_server.failures_left > 0:
+            http_server.failures_left -= 1
+            return 503, b"unavailable", headers
+        if http_server.rate_limited_left > 0:
+            http_server.rate_limited_left -= 1
+            return 429, b"slow down", {**headers, "Retry-After": "0"}
+        if http_server.etag and request["headers"].get("If-None-Match") == http_server.etag:
+            return 304, b"", headers
+        return 200, http_server.payload, headers
+
+    http_server.default = respond
+    return http_server
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+class TestSession:
+    """Test keep-alive, gzip and retries."""
+
+    def test_connection_reused(self, stub_server):
+        """Consecutive requests share one keep-alive connection."""
+        session = build_session("test-agent")
+        _, first = timed_get(session, _url(stub_server, "/a"))
+        _, second = timed_get(session, _url(stub_server, "/b"))
+        assert first["reused"] is False
+        assert second["reused"] is True
+        assert second["connect_ms"] == 0
+        ports = {r["client_port"] for r in stub_server.requests}
+        assert len(ports) == 1
+
+    def test_gzip_negotiated(self, stub_server):
+        """The session asks for gzip and transparently decodes it."""
+        session = build_session("test-agent")
+        response, _ = timed_get(session, _url(stub_server, "/a"))
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.json() == stub_server.payload
+        assert "gzip" in stub_server.requests[0]["headers"]["Accept-Encoding"]
+        assert stub_server.requests[0]["headers"]["User-Agent"] == "test-agent"
+
+    def test_transient_5xx_retried(self, stub_server):
+        """503 responses are retried by the adapter."""
+        stub_server.failures_left = 2
+        session = build_session("test-agent", retries=3, backoff_factor=0)
+        response, _ = timed_get(session, _url(stub_server, "/flaky"))
+        assert response.status_code == 200
+        assert len(stub_server.requests) == 3
+
+    def test_retries_exhausted_returns_last_response(self, stub_server):
+        """After the last retry the 5xx response is returned, not raised."""
+        stub_server.failures_left = 5
+        session = build_session("test-agent", retries=1, backoff_factor=0)
+        response, _ = timed_get(session, _url(stub_server, "/flaky"))
+        assert response.status_code == 503
+
+    def test_429_left_to_caller(self, stub_server):
+        """A 429 with Retry-After is returned, not retried inside the adapter."""
+        stub_server.rate_limited_left = 1
+        session = build_session("test-agent", retries=3, backoff_factor=0)
+        response, _ = timed_get(session, _url(stub_server, "/a"))
+        assert response.status_code == 429
+        assert len(stub_server.requests) == 1
+
+    def test_timing_breakdown(self, stub_server):
+        """Timings cover connect, TLS, TTFB and body and add up to the total."""
+        session = build_session("test-agent")
+        _, timing = timed_get(session, _url(stub_server, "/a"))
+        assert set(timing) == {"connect_ms", "tls_ms", "ttfb_ms", "body_ms", "total_ms", "reused"}
+        assert timing["tls_ms"] == 0  # plain HTTP
+        parts = timing["connect_ms"] + timing["tls_ms"] + timing["ttfb_ms"] + timing["body_ms"]
+        assert parts <= timing["total_ms"] + 0.5
+
+
+class TestFetcherSession:
+    """Test RedditFetcher over the pooled session."""
+
+    @pytest.fixture
+    def fetcher(self, stub_server):
+        fetcher = RedditFetcher({"reddit": {
+            "subreddits": ["aurora4x"],
+            "user_agent": "test-agent",
+            "rate_limit_delay": 0,
+            "debug_http": True,
+        }})
+        fetcher.BASE_URL = _url(stub_server, "")
+        return fetcher
+
+    def test_backfill_pages_share_connection(self, stub_server, fetcher, capsys):
+        """Backfill pages reuse one connection and log their timings."""
+        stub_server.payload = {"kind": "Listing", "data": {"after": "t3_next", "children": []}}
+        fetcher.backfill_max_pages = 3
+        fetcher.backfill("aurora4x")
+        assert len(stub_server.requests) == 3
+        assert len({r["client_port"] for r in stub_server.requests}) == 1
+        summary = fetcher.timing_summary()
+        assert summary["http_requests"] == 3
+        assert summary["http_new_connections"] == 1
+        assert capsys.readouterr().out.count("[HTTP] 200") == 3
+
+    def test_429_counted_by_async_fetcher(self, stub_server):
+        """Each 429 reaches the fetcher, which retries it and counts it."""
+        stub_server.rate_limited_left = 2
+        fetcher = AsyncRedditFetcher({"reddit": {
+            "subreddits": ["aurora4x"],
+            "user_agent": "test-agent",
+            "requests_per_minute": 60000,
+        }})
+        fetcher.BASE_URL = _url(stub_server, "")
+        fetcher.fetch_new_posts_many(["aurora4x"])
+        assert len(stub_server.requests) == 3
+        assert len(fetcher.http_timings) == 3
+        assert fetcher.rate_summary()["rate_limited_429s"] == 2
+
+
+class TestFetcherResponseCache:
+    """Test RedditFetcher with the on-disk response cache."""
+
+    @pytest.fixture
+    def make_fetcher(self, stub_server, tmp_path):
+        def make(ttl=300, offline=False, fetcher_cls=RedditFetcher):
+            fetcher = fetcher_cls({"reddit": {
+                "subreddits": ["aurora4x"],
+                "user_agent": "test-agent",
+                "rate_limit_delay": 0,
+                "requests_per_minute": 60000,
+                "offline": offline,
+            }})
+            fetcher.BASE_URL = _url(stub_server, "")
+            fetcher.response_cache = ResponseCache(
+                str(tmp_path / "http_cache"), ttls={"listing": ttl, "comments": ttl}
+            )
+            return fetcher
+        return make
+
+    def test_fresh_entry_served_without_request(self, stub_server, make_fetcher):
+        """A second fetch within the TTL makes no request."""
+        make_fetcher().fetch_new_posts("aurora4x")
+        fetcher = make_fetcher()
+        fetcher.fetch_new_posts("aurora4x")
+        assert len(stub_server.requests) == 1
+        assert fetcher.response_cache.stats()["http_cache_hits"] == 1
+
+    def test_stale_entry_revalidated_with_etag(self, stub_server, make_fetcher):
+        """A stale entry is revalidated and a 304 serves the cached body."""
+        stub_server.etag = '"v1"'
+        make_fetcher(ttl=0).fetch_new_posts("aurora4x")
+        fetcher = make_fetcher(ttl=0)
+        posts, after = fetcher.fetch_new_posts("aurora4x")
+        assert stub_server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+        assert (posts, after) == ([], None)
+        assert fetcher.response_cache.stats()["http_cache_revalidated"] == 1
+
+    def test_changed_response_replaces_entry(self, stub_server, make_fetcher):
+        """A 200 on revalidation stores the new body."""
+        stub_server.etag = '"v1"'
+        make_fetcher(ttl=0).fetch_new_posts("aurora4x")
+        stub_server.etag = '"v2"'
+        stub_server.payload = {"kind": "Listing", "data": {"after": "t3_x", "children": []}}
+        _, after = make_fetcher(ttl=0).fetch_new_posts("aurora4x")
+        assert after == "t3_x"
+
+    def test_offline_serves_stale_cache(self, stub_server, make_fetcher):
+        """Offline mode serves any cached entry without a request."""
+        make_fetcher().fetch_new_posts("aurora4x")
+        make_fetcher(ttl=0, offline=True).fetch_new_posts("aurora4x")
+        assert len(stub_server.requests) == 1
+
+    def test_offline_miss_raises(self, stub_server, make_fetcher):
+        """Offline mode never touches the network for uncached URLs."""
+        with pytest.raises(OfflineCacheMiss):
+            make_fetcher(offline=True).fetch_post_comments("aurora4x", "abc123")
+        assert stub_server.requests == []
+
+    def test_async_fetcher_uses_cache(self, stub_server, make_fetcher):
+        """Concurrent fetches are served from the same cache."""
+        make_fetcher().fetch_new_posts("aurora4x")
+        fetcher = make_fetcher(fetcher_cls=AsyncRedditFetcher)
+        fetcher.fetch_new_posts_many(["aurora4x"])
+        assert len(stub_server.requests) == 1
@@ -0,0 +1,72 @@
+"""Tests for the on-disk HTTP response cache."""
+
+import pytest
+
+from aurora_monitor.sources.http_cache import ResponseCache
+
+
+LISTING_URL = "https://www.reddit.com/r/aurora4x/new.json?limit=100&raw_json=1"
+COMMENTS_URL = "https://www.reddit.com/r/aurora4x/comments/abc123.json?raw_json=1"
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ResponseCache(str(tmp_path / "http_cache"),
+                         ttls={"listing": 300, "comments": 3600}, clock=clock)
+
+
+class TestResponseCache:
+    """Test storage, freshness and validators."""
+
+    def test_miss_returns_none(self, cache):
+        """An uncached URL has no entry."""
+        assert cache.get(LISTING_URL) is None
+
+    def test_put_and_get(self, cache):
+        """A stored response round-trips with its validators."""
+        cache.put(LISTING_URL, {"data": {"children": []}}, etag='"abc"',
+                  last_modified="Wed, 01 Jan 2026 00:00:00 GMT")
+        entry = cache.get(LISTING_URL)
+        assert entry["data"] == {"data": {"children": []}}
+        assert cache.validators(entry) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2026 00:00:00 GMT",
+        }
+
+    def test_no_validators_without_headers(self, cache):
+        """Entries stored without ETag or Last-Modified send no conditionals."""
+        cache.put(LISTING_URL, {})
+        assert cache.validators(cache.get(LISTING_URL)) == {}
+
+    def test_ttl_per_endpoint_type(self, cache, clock):
+        """Listings and comments expire on their own TTLs."""
+        cache.put(LISTING_URL, {})
+        cache.put(COMMENTS_URL, [])
+        clock.now += 600
+        assert not cache.is_fresh(cache.get(LISTING_URL))
+        assert cache.is_fresh(cache.get(COMMENTS_URL))
+
+    def test_refresh_restarts_ttl(self, cache, clock):
+        """A 304 refresh makes a stale entry fresh again."""
+        cache.put(LISTING_URL, {"kept": True}, etag='"abc"')
+        clock.now += 600
+        cache.refresh(cache.get(LISTING_URL))
+        entry = cache.get(LISTING_URL)
+        assert cache.is_fresh(entry)
+        assert entry["data"] == {"kept": True}
+
+    def test_endpoint_type(self):
+        """URLs are classified by path."""
+        assert ResponseCache.endpoint_type(LISTING_URL) == "listing"
+        assert ResponseCache.endpoint_type(COMMENTS_URL) == "comments"
+        assert ResponseCache.endpoint_type(
+            "https://www.reddit.com/api/morechildren.json?link_id=t3_abc&children=x"
+        ) == "comments"
+
+    def test_unreadable_entry_ignored(self, cache, capsys):
+        """A corrupt cache file counts as a miss."""
+        cache.put(LISTING_URL, {})
+        with open(cache._path(LISTING_URL), "w") as f:
+            f.write("{not json")
+        assert cache.get(LISTING_URL) is None
+        assert "Warning" in capsys.readouterr().out
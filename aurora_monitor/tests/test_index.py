@@ -0,0 +1,114 @@
+"""Tests for the candidate retrieval index module."""
+
+import pytest
+
+from aurora_monitor.index import MinHashIndex, TokenIndex, tokenize
+
+
+class TestTokenize:
+    """Test token extraction."""
+
+    def test_matches_fuzzy_processing(self):
+        """Tokens are lowercased with punctuation stripped, like thefuzz."""
+        assert tokenize("Box-Launcher reload: 10x!") == {"box", "launcher", "reload", "10x"}
+
+    def test_empty_text(self):
+        """Empty text yields no tokens."""
+        assert tokenize("") == set()
+
+
+class TestTokenIndex:
+    """Test inverted index candidate selection."""
+
+    ISSUES = [
+        tokenize("Verify box launcher reload at ordnance transfer points"),
+        tokenize("Verify fuel consumption scales with travel speed"),
+        tokenize("Verify fortification and THM interaction formula"),
+        tokenize("Verify shipyard tooling retool cost"),
+    ]
+
+    def test_shared_token_selects_issue(self):
+        """Issues sharing a discriminative token are candidates."""
+        index = TokenIndex(self.ISSUES)
+        assert index.candidates(tokenize("My box launcher design")) == [0]
+
+    def test_no_shared_tokens_no_candidates(self):
+        """Unrelated posts produce no candidates."""
+        index = TokenIndex(self.ISSUES)
+        assert index.candidates(tokenize("Screenshot of my empire")) == []
+
+    def test_common_tokens_are_not_discriminative(self):
+        """Tokens present in most issues do not select candidates."""
+        index = TokenIndex(self.ISSUES, max_document_frequency=0.5)
+        assert "verify" not in index.postings
+        assert index.candidates(tokenize("Can someone verify this?")) == []
+
+    def test_stopwords_and_short_tokens_ignored(self):
+        """Stopwords and very short tokens never enter the index."""
+        index = TokenIndex(self.ISSUES)
+        assert "with" not in index.postings
+        assert "at" not in index.postings
+
+    def test_min_shared_tokens(self):
+        """A higher min_shared_tokens requires more overlap."""
+        index = TokenIndex(self.ISSUES, min_shared_tokens=2)
+        assert index.candidates(tokenize("box design")) == []
+        assert index.candidates(tokenize("box launcher design")) == [0]
+
+    def test_candidates_in_issue_order(self):
+        """Candidate positions are sorted so score ties break as a full scan would."""
+        index = TokenIndex(self.ISSUES)
+        post = tokenize("shipyard fortification fuel launcher")
+        assert index.candidates(post) == [0, 1, 2, 3]
+
+    def test_single_issue_keeps_its_tokens(self):
+        """A one-issue index still indexes that issue's tokens."""
+        index = TokenIndex([tokenize("box launcher reload")])
+        assert index.candidates(tokenize("launcher")) == [0]
+
+
+class TestMinHashIndex:
+    """Test MinHash LSH candidate selection."""
+
+    ISSUES = TestTokenIndex.ISSUES
+
+    def test_identical_token_set_always_candidate(self):
+        """An issue's own tokens collide with it in every band."""
+        index = MinHashIndex(self.ISSUES)
+        for position, tokens in enumerate(self.ISSUES):
+            assert position in index.candidates(tokens)
+
+    def test_unrelated_post_no_candidates(self):
+        """Posts with no usable tokens in common select nothing."""
+        index = MinHashIndex(self.ISSUES)
+        assert index.candidates(tokenize("Screenshot of my empire")) == []
+
+    def test_similar_post_selects_issue(self):
+        """A post sharing most of an issue's tokens selects it."""
+        index = MinHashIndex(self.ISSUES)
+        post = tokenize("Box launcher reload at ordnance transfer points?")
+        assert index.candidates(post) == [0]
+
+    def test_signature_deterministic(self):
+        """Signatures depend only on the tokens and seed, not the process."""
+        first = MinHashIndex(self.ISSUES).signature(self.ISSUES[0])
+        second = MinHashIndex(self.ISSUES).signature(self.ISSUES[0])
+        assert (first == second).all()
+
+    def test_common_tokens_ignored(self):
+        """Tokens in most issues are left out of signatures."""
+        index = MinHashIndex(self.ISSUES, max_document_frequency=0.5)
+        assert "verify" in index.common_tokens
+        assert index.signature(tokenize("verify")) is None
+
+    def test_more_bands_more_candidates(self):
+        """Fewer rows per band never selects fewer candidates for a post."""
+        post = tokenize("box launcher fuel consumption shipyard tooling")
+        strict = MinHashIndex(self.ISSUES, num_perm=256, bands=16)
+        loose = MinHashIndex(self.ISSUES, num_perm=256, bands=256)
+        assert set(strict.candidates(post)) <= set(loose.candidates(post))
+
+    def test_bands_must_divide_num_perm(self):
+        """A band layout that does not tile the signature is rejected."""
+        with pytest.raises(ValueError):
+            MinHashIndex(self.ISSUES, num_perm=100, bands=64)
@@ -0,0 +1,104 @@
+"""Tests for the shared keyword automaton module."""
+
+import json
+import os
+
+import pytest
+import yaml
+
+from aurora_monitor.keywords import EVIDENCE_TIER, KeywordAutomaton
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config.yaml")
+
+
+@pytest.fixture
+def config():
+    return {
+        "matching": {
+            "keywords": {
+                "high": ["fire control", "beam fire control", "jump point"],
+                "medium": ["shipyard", "magazine"],
+                "aurora_terms": ["aurora", "PDC", "CIWS"],
+            },
+        },
+        "new_content": {
+            "evidence_keywords": ["tested", "i tested", "formula"],
+            "chapter_keywords": {
+                10: {"name": "Navigation", "keywords": ["jump point", "survey", "transit"]},
+                12: {"name": "Combat", "keywords": ["fire control", "beam", "CIWS"]},
+            },
+        },
+    }
+
+
+@pytest.fixture
+def automaton(config):
+    return KeywordAutomaton(config)
+
+
+class TestKeywordHits:
+    """Test keyword hit resolution to tiers and chapters."""
+
+    def test_tier_hits_in_config_order(self, automaton):
+        """Tier hits are returned as configured, in config order."""
+        hits = automaton.scan("the jump point beam fire control")
+        assert hits.tier("high") == ["fire control", "beam fire control", "jump point"]
+
+    def test_overlapping_keywords_all_found(self, automaton):
+        """Keywords nested inside longer keywords are still counted."""
+        hits = automaton.scan("i tested it")
+        assert hits.tier(EVIDENCE_TIER) == ["tested", "i tested"]
+
+    def test_case_insensitive(self, automaton):
+        """Mixed-case config keywords match lowercased text."""
+        hits = automaton.scan("pdc and ciws")
+        assert hits.tier("aurora_terms") == ["PDC", "CIWS"]
+
+    def test_substring_semantics(self, automaton):
+        """Keywords match inside longer words, like the `in` checks they replace."""
+        hits = automaton.scan("auroral shipyards")
+        assert hits.tier("aurora_terms") == ["aurora"]
+        assert hits.tier("medium") == ["shipyard"]
+
+    def test_chapter_hit_counts(self, automaton):
+        """Chapter hit counts come from the same scan."""
+        hits = automaton.scan("beam fire control and ciws near a jump point")
+        assert hits.chapter(12) == 3
+        assert hits.chapter(10) == 1
+
+    def test_unknown_tier_and_chapter(self, automaton):
+        """Unknown tiers and chapters report no hits."""
+        hits = automaton.scan("fire control")
+        assert hits.tier("nonexistent") == []
+        assert hits.chapter(99) == 0
+
+    def test_empty_text(self, automaton):
+        """Empty text yields no hits."""
+        hits = automaton.scan("")
+        assert hits.found == set()
+
+
+class TestMatchesSubstringScan:
+    """The automaton must agree with per-keyword substring checks."""
+
+    def test_fixture_posts_against_repo_config(self):
+        """Every keyword list in config.yaml matches `kw.lower() in text` on fixtures."""
+        with open(CONFIG_PATH) as f:
+            config = yaml.safe_load(f)
+        automaton = KeywordAutomaton(config)
+        posts = []
+        for name in ("reddit_posts.json", "new_content_posts.json"):
+            with open(os.path.join(FIXTURES_DIR, name)) as f:
+                posts.extend(json.load(f))
+
+        for post in posts:
+            text = f"{post.get('title', '')} {post.get('selftext', '')}".lower()
+            hits = automaton.scan(text)
+            for tier, keywords in config["matching"]["keywords"].items():
+                assert hits.tier(tier) == [kw for kw in keywords if kw.lower() in text]
+            evidence = config["new_content"]["evidence_keywords"]
+            assert hits.tier(EVIDENCE_TIER) == [kw for kw in evidence if kw.lower() in text]
+            for num, info in config["new_content"]["chapter_keywords"].items():
+                expected = sum(1 for kw in info["keywords"] if kw.lower() in text)
+                assert hits.chapter(int(num)) == expected
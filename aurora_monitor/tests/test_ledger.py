@@ -0,0 +1,81 @@
+"""Tests for the local ledger of posted comments."""
+
+import pytest
+
+from aurora_monitor.github_api import IssueReferences
+from aurora_monitor.ledger import PostLedger
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "state" / "ledger.jsonl")
+
+
+def _references(ids):
+    references = IssueReferences()
+    references.ids = {issue: set(sources) for issue, sources in ids.items()}
+    return references
+
+
+class TestPostLedger:
+    """Test recording, lookups and reconciling."""
+
+    def test_records_survive_reload(self, path):
+        ledger = PostLedger(path)
+        ledger.record(1288, "abc123", "comment body")
+        ledger.record("D_1", None, "triage page 1")
+
+        reloaded = PostLedger(path)
+        assert reloaded.has(1288, "abc123")
+        assert not reloaded.has(1288, "def456")
+        assert not reloaded.has(1289, "abc123")
+        assert reloaded.has_body("D_1", "triage page 1")
+        assert not reloaded.has_body("D_1", "triage page 2")
+        assert reloaded.stats() == {"ledger_references": 1, "ledger_hits": 2}
+
+    def test_torn_last_line_skipped(self, path, capsys):
+        """A line cut short by a killed run is skipped and the next append is intact."""
+        PostLedger(path).record(1, "a", "x")
+        with open(path, "a") as f:
+            f.write('{"target": 1, "sour')
+        ledger = PostLedger(path)
+        assert ledger.has(1, "a")
+        assert "unreadable" in capsys.readouterr().out
+        ledger.record(1, "b", "y")
+        assert PostLedger(path).has(1, "b")
+
+    def test_reconcile_due(self, path, clock):
+        assert not PostLedger(path).reconcile_due()
+        ledger = PostLedger(path, reconcile_interval=60, clock=clock)
+        assert ledger.reconcile_due()
+        ledger.reconcile(_references({}))
+        assert not PostLedger(path, reconcile_interval=60, clock=clock).reconcile_due()
+        clock.now += 60
+        assert PostLedger(path, reconcile_interval=60, clock=clock).reconcile_due()
+        assert PostLedger(path, reconcile_interval=0, clock=clock).reconcile_due()
+
+    def test_reconcile_adds_and_forgets(self, path):
+        """References GitHub shows are added; recorded ones it lost are dropped."""
+        ledger = PostLedger(path, reconcile_interval=0)
+        ledger.record(1, "kept", "k")
+        ledger.record(1, "deleted", "d")
+        ledger.record(2, "unloaded", "u")
+        ledger.record("D_1", None, "page")
+        assert ledger.reconcile(_references({1: {"kept", "elsewhere"}})) == (1, 1)
+
+        reloaded = PostLedger(path)
+        assert reloaded.has(1, "kept")
+        assert reloaded.has(1, "elsewhere")
+        assert not reloaded.has(1, "deleted")
+        assert reloaded.has(2, "unloaded")  # Its issue was not loaded, so it stands
+        assert reloaded.has_body("D_1", "page")
+        assert reloaded.issues() == {1, 2}
+
+    def test_reconcile_compacts(self, path):
+        ledger = PostLedger(path, reconcile_interval=0)
+        for n in range(5):
+            ledger.record(1, f"r{n}", f"body {n}")
+        ledger.reconcile(_references({1: {"r0"}}))
+        with open(path) as f:
+            lines = f.readlines()
+        assert len(lines) == 2  # r0 and the reconcile marker
@@ -0,0 +1,215 @@
+"""Tests for the monitor entry point's posting and re-matching steps."""
+
+import json
+import os
+
+import pytest
+import yaml
+
+from aurora_monitor import __main__ as monitor
+from aurora_monitor import github_api
+from aurora_monitor.github_api import IssueReferences
+from aurora_monitor.ledger import PostLedger
+from aurora_monitor.state import (
+    DEFAULT_STATE, load_corpus, load_state, record_issue_snapshot, record_item, save_corpus,
+    save_state,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config.yaml")
+
+
+class FakeGitHub:
+    """Stands in for the github_api calls post_match_comments makes."""
+
+    def __init__(self):
+        self.references = {}  # issue -> referenced Reddit IDs the pre-flight loads
+        self.existing = set()  # (issue, reddit_id) found by check_existing_comment
+        self.fetched = []
+        self.checked = []
+        self.posted = []
+
+    def fetch_issue_references(self, issue_numbers, repo=None):
+        self.fetched.append(set(issue_numbers))
+        references = IssueReferences(repo)
+        references.ids = {issue: set(ids) for issue, ids in self.references.items()
+                          if issue in issue_numbers}
+        return references
+
+    def check_existing_comment(self, issue_number, reddit_id, repo=None):
+        self.checked.append((issue_number, reddit_id))
+        return (issue_number, reddit_id) in self.existing
+
+    def post_issue_comment(self, issue_number, body, repo=None, dry_run=False):
+        self.posted.append((issue_number, body))
+        return True
+
+
+@pytest.fixture
+def github(monkeypatch):
+    fake = FakeGitHub()
+    for name in ("fetch_issue_references", "check_existing_comment", "post_issue_comment"):
+        monkeypatch.setattr(github_api, name, getattr(fake, name))
+    return fake
+
+
+@pytest.fixture
+def ledger_path(tmp_path):
+    return str(tmp_path / "state" / "ledger.jsonl")
+
+
+def _match(issue, reddit_id):
+    return (reddit_id, {
+        "issue": issue, "score": 85, "subreddit": "aurora4x", "author": "Tester",
+        "title": "Box launcher reload", "quote": "Reloads only in a hangar",
+        "permalink": f"/r/aurora4x/comments/{reddit_id}/box_launchers/",
+        "created_utc": 1708000000,
+    })
+
+
+class TestPostMatchComments:
+    """Test duplicate checks before commenting matches on issues."""
+
+    def test_ledger_hit_not_posted(self, github, ledger_path):
+        """A reference already in the ledger is skipped without asking GitHub."""
+        ledger = PostLedger(ledger_path)
+        ledger.record(1230, "abc123", "earlier comment")
+        posted = monitor.post_match_comments([_match(1230, "abc123")], "o/r", ledger)
+        assert posted == 0
+        assert github.posted == github.fetched == github.checked == []
+
+    def test_reconcile_due_syncs_before_posting(self, github, ledger_path):
+        """A due reconcile loads the pending and ledger issues, then skips what GitHub shows."""
+        ledger = PostLedger(ledger_path, reconcile_interval=0)
+        ledger.record(1288, "old111", "earlier comment")
+        github.references = {1230: {"abc123"}, 1231: set(), 1288: {"old111"}}
+        pending = [_match(1230, "abc123"), _match(1231, "def456")]
+        posted = monitor.post_match_comments(pending, "o/r", ledger)
+        assert github.fetched == [{1230, 1231, 1288}]
+        assert posted == 1
+        assert [issue for issue, _ in github.posted] == [1231]
+        assert github.checked == []
+        assert ledger.has(1230, "abc123")
+        assert ledger.reconciled_at is not None
+
+    def test_unloaded_issue_checked_directly(self, github, ledger_path):
+        """Issues the pre-flight could not load fall back to check_existing_comment."""
+        ledger = PostLedger(ledger_path, reconcile_interval=0)
+        github.existing = {(1230, "abc123")}
+        pending = [_match(1230, "abc123"), _match(1231, "def456")]
+        posted = monitor.post_match_comments(pending, "o/r", ledger)
+        assert github.checked == [(1230, "abc123"), (1231, "def456")]
+        assert posted == 1
+        assert [issue for issue, _ in github.posted] == [1231]
+
+    def test_repeat_in_same_run_posted_once(self, github, ledger_path):
+        """The same match twice in one run is posted once and recorded."""
+        ledger = PostLedger(ledger_path)
+        pending = [_match(1230, "abc123"), _match(1230, "abc123")]
+        assert monitor.post_match_comments(pending, "o/r", ledger) == 1
+        assert len(github.posted) == 1
+        assert PostLedger(ledger_path).has(1230, "abc123")
+
+    def test_nothing_pending(self, github, ledger_path):
+        ledger = PostLedger(ledger_path, reconcile_interval=0)
+        assert monitor.post_match_comments([], "o/r", ledger) == 0
+        assert github.fetched == []
+
+
+@pytest.fixture
+def config(ledger_path):
+    with open(CONFIG_PATH) as f:
+        config = yaml.safe_load(f)
+    config["github"]["ledger"] = {"path": ledger_path, "reconcile_days": None}
+    return config
+
+
+@pytest.fixture
+def issues():
+    with open(os.path.join(FIXTURES_DIR, "github_issues.json")) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def corpus():
+    """A stored corpus holding the box launcher post, which matches issue 1230."""
+    with open(os.path.join(FIXTURES_DIR, "reddit_posts.json")) as f:
+        post = json.load(f)[0]
+    corpus = {"posts": {}, "comments": {}}
+    record_item(corpus, post)
+    return corpus
+
+
+def _state(issues):
+    state = json.loads(json.dumps(DEFAULT_STATE))
+    record_issue_snapshot(state, issues)
+    return state
+
+
+class TestRematch:
+    """Test re-matching the stored corpus against new or edited issues."""
+
+    def test_stored_item_matched_against_new_issue(self, config, issues, corpus):
+        """Only issues missing from the snapshot are matched against the corpus."""
+        box_launcher = next(i for i in issues if i["number"] == 1230)
+        # An unchanged copy listed first would win the tie if it were scored
+        unchanged_copy = {**box_launcher, "number": 9999}
+        state = _state([unchanged_copy] + [i for i in issues if i["number"] != 1230])
+
+        rematches = monitor.rematch_changed_issues(
+            config, state, corpus, [unchanged_copy] + issues)
+        assert [(reddit_id, match["issue"]) for reddit_id, match in rematches] == [
+            ("post_high_match", 1230)]
+
+    def test_edited_issue_rematched(self, config, issues, corpus):
+        state = _state(issues)
+        edited = [{**i, "body": i["body"] + " Edited."} if i["number"] == 1230 else i
+                  for i in issues]
+        rematches = monitor.rematch_changed_issues(config, state, corpus, edited)
+        assert [match["issue"] for _, match in rematches] == [1230]
+
+    def test_nothing_changed(self, config, issues, corpus):
+        assert monitor.rematch_changed_issues(config, _state(issues), corpus, issues) == []
+
+
+class TestRunRematch:
+    """Test the rematch mode's posting and snapshot persistence."""
+
+    @pytest.fixture
+    def paths(self, tmp_path, monkeypatch, issues, corpus):
+        state_path = str(tmp_path / "state" / "reddit.json")
+        corpus_path = str(tmp_path / "state" / "reddit_corpus.json")
+        save_state(state_path, _state([i for i in issues if i["number"] != 1230]))
+        save_corpus(corpus_path, corpus)
+        monkeypatch.setattr(monitor, "STATE_PATH", state_path)
+        monkeypatch.setattr(monitor, "CORPUS_PATH", corpus_path)
+        monkeypatch.setattr(monitor, "load_unverified_issues", lambda repo: issues)
+        return state_path, corpus_path
+
+    def test_dry_run_posts_and_saves_nothing(self, github, config, paths, issues):
+        state_path, _ = paths
+        before = load_state(state_path)
+        monitor.run_rematch(config, dry_run=True)
+        assert github.posted == []
+        assert load_state(state_path) == before
+
+    def test_run_posts_and_saves_snapshot(self, github, config, paths, issues):
+        state_path, corpus_path = paths
+        monitor.run_rematch(config)
+        assert [issue for issue, _ in github.posted] == [1230]
+        assert load_state(state_path)["issue_hashes"] == _state(issues)["issue_hashes"]
+        assert load_corpus(corpus_path)["posts"].keys() == {"post_high_match"}
+
+        github.posted.clear()
+        monitor.run_rematch(config)  # Snapshot is current; nothing to re-match
+        assert github.posted == []
+
+    def test_failed_issue_fetch_keeps_snapshot(self, github, config, paths, monkeypatch):
+        """An empty issue list from a failed fetch neither re-matches nor overwrites the snapshot."""
+        state_path, _ = paths
+        before = load_state(state_path)
+        monkeypatch.setattr(monitor, "load_unverified_issues", lambda repo: [])
+        monitor.run_rematch(config)
+        assert github.posted == []
+        assert load_state(state_path) == before
+        assert before["issue_hashes"]
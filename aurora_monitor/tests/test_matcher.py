@@ -4,7 +4,10 @@ import json
 import os
 import pytest
 
+from aurora_monitor.index import MinHashIndex
+from aurora_monitor.keywords import KeywordAutomaton
 from aurora_monitor.matcher import Matcher
+from aurora_monitor.score_cache import ScoreCache
 
 FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
 
@@ -243,6 +246,25 @@ class TestCommentMatching:
         assert len(matches) > 0
         assert matches[0]["parent_post_id"] == "def456"
 
+    def test_nested_reply_parent_post_id_is_the_post(self, matcher):
+        """A reply's parent_post_id comes from its link_id, not its parent comment."""
+        reply = {
+            "id": "comment_4",
+            "subreddit": "aurora4x",
+            "author": "Verifier",
+            "body": "Fuel consumption scales with actual travel speed, I checked it too.",
+            "permalink": "/r/aurora4x/comments/def456/fuel/comment_4/",
+            "created_utc": 1708100000,
+            "parent_id": "t1_parentcomment",
+            "link_id": "t3_def456",
+        }
+        [match] = matcher.find_matches([reply])
+        assert match["parent_post_id"] == "def456"
+
+        del reply["link_id"]
+        [match] = matcher.find_matches([reply])
+        assert match["parent_post_id"] is None
+
     def test_find_matches_post_has_content_type_post(self, matcher, posts):
         """find_matches returns content_type='post' for regular posts."""
         matches = matcher.find_matches([posts[0]])
@@ -502,3 +524,308 @@ class TestLongIssuePenalty:
             f"Disabled penalty ({score_disabled}) should score >= "
             f"enabled penalty ({score_enabled})"
         )
+
+
+class TestCandidateIndex:
+    """Test inverted-index candidate pruning in find_matches."""
+
+    @pytest.fixture
+    def all_posts(self, posts):
+        with open(os.path.join(FIXTURES_DIR, "new_content_posts.json")) as f:
+            return posts + json.load(f)
+
+    def _full_scan_matcher(self, config, issues):
+        m = Matcher({
+            "matching": {**config["matching"], "candidate_index": {"enabled": False}},
+        })
+        m.issues = issues
+        return m
+
+    def test_routing_identical_to_full_scan(self, matcher, config, issues, all_posts):
+        """Indexed matching routes every fixture post like a full scan."""
+        full = self._full_scan_matcher(config, issues)
+        for indexed, scanned in zip(matcher.find_matches(all_posts),
+                                    full.find_matches(all_posts)):
+            assert indexed["routing"] == scanned["routing"], indexed["post_id"]
+            assert indexed["issue"] == scanned["issue"], indexed["post_id"]
+
+    def test_unrelated_issues_not_scored(self, matcher, posts):
+        """Only issues sharing vocabulary with the post are fuzzy-scored."""
+        candidates = matcher._candidate_issues(matcher._prepare_post(posts[0]))
+        numbers = [c.issue["number"] for c in candidates]  # box launcher post
+        assert 1230 in numbers
+        assert len(candidates) < len(matcher.issues)
+
+    def test_index_rebuilt_on_assignment(self, matcher, posts):
+        """Assigning issues rebuilds the index."""
+        matcher.issues = [i for i in matcher.issues if i["number"] != 1230]
+        candidates = matcher._candidate_issues(matcher._prepare_post(posts[0]))
+        numbers = [c.issue["number"] for c in candidates]
+        assert 1230 not in numbers
+
+    def test_disabled_index_scans_all_issues(self, config, issues, posts):
+        """With the index disabled every issue is a candidate."""
+        full = self._full_scan_matcher(config, issues)
+        candidates = full._candidate_issues(full._prepare_post(posts[0]))
+        assert [c.issue for c in candidates] == issues
+
+    def test_minhash_index_selected(self, config, issues, posts):
+        """method: minhash builds an LSH index that still finds the box launcher issue."""
+        m = Matcher({"matching": {**config["matching"],
+                                  "candidate_index": {"method": "minhash"}}})
+        m.issues = issues
+        assert isinstance(m._index, MinHashIndex)
+        result = m.find_matches([posts[0]])[0]
+        assert result["issue"] == 1230
+
+    @pytest.mark.parametrize("method", ["tokens", "minhash"])
+    def test_post_without_candidates_scored_against_every_issue(self, config, method):
+        """A post made only of tokens too common to index falls back to a full scan.
+
+        "verify", "manual" and "section" appear in most issues, so either
+        index drops them and the post has no candidates.
+        """
+        issues = [{"number": 1, "title": "box launcher reload", "body": ""}] + [
+            {"number": n, "title": "Verify manual section", "body": ""} for n in (2, 3, 4)
+        ]
+        post = {"id": "p1", "title": "Verify manual section",
+                "selftext": "please verify manual section"}
+        m = Matcher({"matching": {**config["matching"],
+                                  "candidate_index": {"method": method}}})
+        m.issues = issues
+        assert m._candidate_issues(m._prepare_post(post)) == []
+        full = self._full_scan_matcher(config, issues)
+        [indexed] = m.find_matches([post])
+        [scanned] = full.find_matches([post])
+        assert (indexed["routing"], indexed["issue"], indexed["score"]) == (
+            scanned["routing"], scanned["issue"], scanned["score"])
+        assert indexed["issue"] == 2
+
+    def test_non_candidates_not_fuzzy_scored(self, config):
+        """Issues outside the index are not scored when the post has candidates."""
+        issues = [
+            {"number": n, "title": f"Verify: [{n}.1] widget{n} sprocket{n} gizmo{n}",
+             "body": f"gadget{n} flange{n} bracket{n} doohickey{n} contraption{n}"}
+            for n in range(2, 42)
+        ] + [{"number": 1, "title": "Verify: [8.3] box launcher reload time",
+              "body": "Box launchers reload only in a hangar or at a maintenance facility."}]
+        post = {"id": "p1", "title": "Box launcher reload time",
+                "selftext": "My box launchers never reload unless the ship is in a hangar."}
+        m = Matcher({"matching": {**config["matching"],
+                                  "candidate_index": {"method": "tokens"}}})
+        m.issues = issues
+        full = self._full_scan_matcher(config, issues)
+        [indexed] = m.find_matches([post])
+        [scanned] = full.find_matches([post])
+        assert (indexed["issue"], indexed["score"]) == (scanned["issue"], scanned["score"])
+        assert indexed["issue"] == 1
+        assert m.fuzzy_calls == 1
+        assert full.fuzzy_calls == len(issues)
+
+    def test_unknown_index_method_rejected(self, config):
+        """An unknown candidate_index method is a config error."""
+        with pytest.raises(ValueError):
+            Matcher({"matching": {**config["matching"],
+                                  "candidate_index": {"method": "bogus"}}})
+
+
+class TestPreparedCorpus:
+    """Test the per-run precomputed issue corpus."""
+
+    def test_corpus_built_on_assignment(self, matcher, issues):
+        """Assigning issues prepares one immutable entry per issue."""
+        assert isinstance(matcher._corpus, tuple)
+        assert [p.issue for p in matcher._corpus] == issues
+        assert all(isinstance(p.tokens, frozenset) for p in matcher._corpus)
+
+    def test_prepared_scores_match_score_match(self, matcher, posts):
+        """Scoring prepared pairs gives the same result as score_match."""
+        for post in posts:
+            prepared = matcher._prepare_post(post)
+            for entry in matcher._corpus:
+                assert matcher._score_prepared(prepared, entry) == \
+                    matcher.score_match(post, entry.issue)
+
+    def test_null_body_prepared_as_empty(self, config):
+        """A null issue body scores and caches like an empty one."""
+        m = Matcher(config)
+        m.issues = [{"number": 1, "title": "Box launcher reload", "body": None},
+                    {"number": 2, "title": "Box launcher reload", "body": ""}]
+        null_body, empty_body = m._corpus
+        assert null_body.text == empty_body.text == "box launcher reload "
+        assert null_body.digest == empty_body.digest
+
+    def test_long_issue_factor_precomputed(self, config):
+        """The long-issue penalty factor is computed once per issue."""
+        m = Matcher(config)
+        m.issues = [
+            {"number": 1, "title": "Short issue", "body": "Brief body."},
+            {"number": 2, "title": "Long issue", "body": "word " * 400},
+        ]
+        assert m._corpus[0].length_factor == 1.0
+        assert m._corpus[1].length_factor < 1.0
+
+
+class TestMatrixBackend:
+    """Test the rapidfuzz cdist batch scoring backend."""
+
+    @pytest.fixture
+    def all_posts(self, posts):
+        with open(os.path.join(FIXTURES_DIR, "new_content_posts.json")) as f:
+            return posts + json.load(f)
+
+    def _matcher(self, config, issues, **overrides):
+        m = Matcher({"matching": {**config["matching"], **overrides}})
+        m.issues = issues
+        return m
+
+    def test_matches_pairwise_backend(self, config, issues, all_posts):
+        """Batch scoring produces the same results as the pairwise full scan."""
+        pairwise = self._matcher(config, issues, candidate_index={"enabled": False})
+        matrix = self._matcher(config, issues, scoring_backend="rapidfuzz")
+        assert matrix.find_matches(all_posts) == pairwise.find_matches(all_posts)
+
+    @pytest.mark.parametrize("method", ["tokens", "minhash"])
+    def test_routing_matches_indexed_pairwise_backend(self, config, issues, all_posts, method):
+        """Both backends route each fixture post to the same issue.
+
+        The matrix backend scores every issue, the pairwise one only the
+        candidate index's; on the fixtures no auto_comment match is lost.
+        """
+        index = {"enabled": True, "method": method}
+        pairwise = self._matcher(config, issues, candidate_index=index)
+        matrix = self._matcher(config, issues, candidate_index=index,
+                               scoring_backend="rapidfuzz")
+        for a, b in zip(pairwise.find_matches(all_posts), matrix.find_matches(all_posts)):
+            assert (a["routing"], a["issue"]) == (b["routing"], b["issue"]), a["post_id"]
+
+    def test_small_batches_match_single_batch(self, config, issues, all_posts):
+        """Splitting posts across several matrices does not change results."""
+        single = self._matcher(config, issues, scoring_backend="rapidfuzz")
+        batched = self._matcher(config, issues, scoring_backend="rapidfuzz", batch_size=4)
+        assert batched.find_matches(all_posts) == single.find_matches(all_posts)
+
+    def test_no_issues_loaded(self, config, posts):
+        """With no issues every post falls through to ignore or triage."""
+        matrix = self._matcher(config, [], scoring_backend="rapidfuzz")
+        results = matrix.find_matches(posts)
+        assert len(results) == len(posts)
+        assert all(r["issue"] is None for r in results)
+
+    def test_unknown_backend_rejected(self, config):
+        """An unknown scoring_backend fails fast."""
+        with pytest.raises(ValueError):
+            Matcher({"matching": {**config["matching"], "scoring_backend": "bogus"}})
+
+
+class TestSharedKeywordAutomaton:
+    """Test that Matcher uses an injected keyword automaton."""
+
+    def test_injected_automaton_used(self, config):
+        """A shared automaton built elsewhere drives the keyword bonus."""
+        shared = KeywordAutomaton(config)
+        m = Matcher(config, keyword_automaton=shared)
+        assert m.keyword_automaton is shared
+        # box launcher (high, +6) + shipyard (medium, +3)
+        assert m._keyword_bonus("box launcher at the shipyard") == 9
+
+
+class TestScoreCacheIntegration:
+    """Test that find_matches serves unchanged pairs from the score cache."""
+
+    def test_second_run_served_from_cache(self, config, issues, posts, tmp_path):
+        """Re-matching the same posts hits the cache and gives the same results."""
+        m = Matcher(config)
+        m.issues = issues
+        m.score_cache = ScoreCache(str(tmp_path / "cache.json"), m.config_hash)
+        first = m.find_matches(posts)
+        misses, hits = m.score_cache.misses, m.score_cache.hits
+        assert misses > 0
+
+        second = m.find_matches(posts)
+        assert second == first
+        assert m.score_cache.misses == misses
+        assert m.score_cache.hits > hits
+
+    def test_edited_issue_is_rescored(self, config, issues, posts, tmp_path):
+        """Editing an issue's body changes its hash and forces a re-score."""
+        m = Matcher(config)
+        m.issues = issues
+        m.score_cache = ScoreCache(str(tmp_path / "cache.json"), m.config_hash)
+        m.find_matches([posts[0]])
+        misses = m.score_cache.misses
+
+        m.issues = [{**i, "body": i["body"] + " Edited."} for i in issues]
+        m.find_matches([posts[0]])
+        assert m.score_cache.misses > misses
+
+    def test_config_hash_ignores_backend_settings(self, config):
+        """Operational settings do not invalidate cached scores."""
+        tuned = {"matching": {**config["matching"], "workers": 4, "batch_size": 10}}
+        assert Matcher(tuned).config_hash == Matcher(config).config_hash
+
+    def test_config_hash_tracks_thresholds(self, config):
+        """Threshold changes invalidate cached scores."""
+        tuned = {"matching": {**config["matching"],
+                              "thresholds": {"high": 85, "medium": 60, "low": 40}}}
+        assert Matcher(tuned).config_hash != Matcher(config).config_hash
+
+
+class TestScoreBoundPruning:
+    """Test skipping fuzzy calls that cannot change the best match."""
+
+    @pytest.fixture
+    def all_posts(self, posts):
+        with open(os.path.join(FIXTURES_DIR, "new_content_posts.json")) as f:
+            return posts + json.load(f)
+
+    def test_bound_never_below_score(self, matcher, all_posts):
+        """The bound is an upper bound for every fixture pair."""
+        for post in all_posts:
+            prepared = matcher._prepare_post(post)
+            for entry in matcher._corpus:
+                assert matcher._score_bound(prepared, entry) >= \
+                    matcher._score_prepared(prepared, entry)
+
+    def test_best_match_identical_to_brute_force(self, config, issues, all_posts):
+        """Best issue and score equal an unpruned score_match over every issue."""
+        m = Matcher({"matching": {**config["matching"], "candidate_index": {"enabled": False}}})
+        m.issues = issues
+        low = config["matching"]["thresholds"]["low"]
+        for post, result in zip(all_posts, m.find_matches(all_posts)):
+            scores = [(i, m.score_match(post, i)) for i in issues]
+            scores = sorted((s for s in scores if s[1] >= low), key=lambda s: s[1], reverse=True)
+            if not scores:
+                assert result["score"] == 0
+                continue
+            best_issue, best_score = scores[0]
+            assert result["score"] == best_score, post["id"]
+            if result["routing"] == "auto_comment":
+                assert result["issue"] == best_issue["number"], post["id"]
+
+    def test_short_post_skips_every_fuzzy_call(self, matcher):
+        """A post too short to reach thresholds.low is never fuzzy-scored."""
+        post = {"id": "short", "title": "Huh?", "selftext": "", "author": "u1"}
+        matcher.find_matches([post])
+        assert matcher.fuzzy_calls_avoided == len(matcher.issues)
+
+    def test_avoided_counts_only_bound_pruned_candidates(self, matcher, all_posts):
+        """Issues left out by the candidate index are not counted as avoided."""
+        candidates = 0
+        for post in all_posts:
+            prepared = matcher._prepare_post(post)
+            candidates += len(matcher._candidate_issues(prepared) or matcher._corpus)
+        matcher.find_matches(all_posts)
+        assert candidates < len(all_posts) * len(matcher.issues)
+        assert matcher.fuzzy_calls + matcher.fuzzy_calls_avoided == candidates
+
+    def test_capped_best_skips_remaining_issues(self, config, issues):
+        """Once a pair scores 100 no later pair can beat it."""
+        m = Matcher({"matching": {**config["matching"], "candidate_index": {"enabled": False}}})
+        m.issues = [issues[0]] + issues
+        post = {"id": "dup", "title": issues[0]["title"], "selftext": issues[0]["body"],
+                "author": "SteveWalmsley"}
+        result = m.find_matches([post])[0]
+        assert result["score"] == 100
+        assert result["issue"] == issues[0]["number"]
+        assert m.fuzzy_calls_avoided == len(issues)
@@ -0,0 +1,99 @@
+"""Tests for the process-pool parallel matching module."""
+
+import json
+import os
+import pytest
+
+from aurora_monitor.matcher import Matcher
+from aurora_monitor.parallel import MatcherPool
+from aurora_monitor.score_cache import ScoreCache
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture
+def issues():
+    with open(os.path.join(FIXTURES_DIR, "github_issues.json")) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def posts():
+    posts = []
+    for name in ("reddit_posts.json", "new_content_posts.json"):
+        with open(os.path.join(FIXTURES_DIR, name)) as f:
+            posts.extend(json.load(f))
+    return posts
+
+
+@pytest.fixture
+def config():
+    return {
+        "matching": {
+            "thresholds": {"high": 80, "medium": 60, "low": 40},
+            "known_authors": {
+                "SteveWalmsley": {"bonus": 30, "note": "Aurora developer"},
+            },
+            "multi_match_penalty": 10,
+            "keywords": {
+                "high": ["box launcher", "fuel consumption", "fire control"],
+                "medium": ["game mechanics", "shipyard"],
+            },
+        },
+    }
+
+
+class TestMatcherPool:
+    """Test parallel matching against the serial Matcher."""
+
+    def test_matches_serial_results_in_order(self, config, issues, posts):
+        """Pool results equal serial find_matches results, in input order."""
+        serial = Matcher(config)
+        serial.issues = issues
+        with MatcherPool(config, issues, workers=2) as pool:
+            assert pool.find_matches(posts) == serial.find_matches(posts)
+
+    def test_chunking_covers_every_post(self, config, issues, posts):
+        """Many small chunks still yield one result per post."""
+        with MatcherPool(config, issues, workers=2, chunks_per_worker=8) as pool:
+            results = pool.find_matches(posts)
+        assert [r["post_id"] for r in results] == [p["id"] for p in posts]
+
+    def test_empty_batch(self, config, issues):
+        """An empty batch returns no results without touching workers."""
+        with MatcherPool(config, issues, workers=2) as pool:
+            assert pool.find_matches([]) == []
+
+    def test_default_workers_uses_cpu_count(self, config, issues):
+        """workers=0 or None starts one worker per CPU."""
+        with MatcherPool(config, issues, workers=0) as pool:
+            assert pool.workers == (os.cpu_count() or 1)
+
+    def test_fuzzy_call_counters_merged(self, config, issues, posts):
+        """Workers' fuzzy call and pruning counters add up to the serial Matcher's."""
+        serial = Matcher(config)
+        serial.issues = issues
+        serial.find_matches(posts)
+        with MatcherPool(config, issues, workers=2) as pool:
+            pool.find_matches(posts)
+        assert pool.fuzzy_calls_avoided == serial.fuzzy_calls_avoided
+        assert pool.fuzzy_calls == serial.fuzzy_calls
+
+    def test_score_cache_merged(self, config, issues, posts, tmp_path):
+        """Worker scores are stored in the parent cache and serve a later pool."""
+        serial = Matcher(config)
+        serial.issues = issues
+        serial.score_cache = ScoreCache(str(tmp_path / "serial.json"), serial.config_hash)
+        serial.find_matches(posts)
+
+        cache = ScoreCache(str(tmp_path / "cache.json"), serial.config_hash)
+        with MatcherPool(config, issues, workers=2, score_cache=cache) as pool:
+            pool.find_matches(posts)
+        assert serial.score_cache.misses > 0
+        assert dict(cache.entries) == dict(serial.score_cache.entries)
+        assert (cache.hits, cache.misses) == (0, serial.score_cache.misses)
+
+        with MatcherPool(config, issues, workers=2, score_cache=cache) as pool:
+            pool.find_matches(posts)
+        assert cache.misses == serial.score_cache.misses
+        assert cache.hits == serial.score_cache.misses
@@ -0,0 +1,158 @@
+"""Tests for the streaming pipeline stages."""
+
+import json
+import os
+import pytest
+import yaml
+
+from aurora_monitor.new_content import NewContentDetector
+from aurora_monitor.pipeline import (
+    TopOpportunities, batched, counted, match_items, page_items, tally, unseen,
+)
+from aurora_monitor.state import DEFAULT_STATE, get_watermark, mark_seen
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(BASE_DIR, "tests", "fixtures")
+
+
+@pytest.fixture
+def state():
+    return json.loads(json.dumps(DEFAULT_STATE))
+
+
+@pytest.fixture
+def stats():
+    return {"posts_scanned": 0, "matches": 0, "triage_items": 0,
+            "skipped": 0, "cross_references": 0}
+
+
+def _post(post_id, created=1708000000):
+    return {"id": post_id, "title": post_id, "selftext": "", "created_utc": created}
+
+
+class TestStages:
+    """Test the item-at-a-time stages."""
+
+    def test_page_items_flattens_and_advances_watermarks(self, state):
+        """Pages become posts; each subreddit's watermark follows its pages."""
+        pages = [("a", [_post("p1", 100), _post("p2", 90)]), ("b", [_post("p3", 50)]),
+                 ("a", [_post("p4", 80)])]
+        counts = {}
+        posts = page_items(iter(pages), state, counts)
+        assert [p["id"] for p in posts] == ["p1", "p2", "p3", "p4"]
+        assert counts == {"a": 3, "b": 1}
+        assert get_watermark(state, "a") == 100
+        assert get_watermark(state, "b") == 50
+
+    def test_stages_are_lazy(self, state):
+        """A page is not pulled until its posts are needed."""
+        pulled = []
+
+        def pages():
+            for n in range(3):
+                pulled.append(n)
+                yield "a", [_post(f"p{n}")]
+
+        posts = page_items(pages(), state)
+        next(posts)
+        assert pulled == [0]
+
+    def test_counted(self, stats):
+        assert list(counted(iter("abc"), stats, "posts_scanned")) == ["a", "b", "c"]
+        assert stats["posts_scanned"] == 3
+
+    def test_unseen_drops_seen_and_repeats(self, state, stats):
+        """Items in state, or repeated within the run, are skipped."""
+        mark_seen(state, "p1", kind="post")
+        items = [_post("p1"), _post("p2"), _post("p2"), _post("p3")]
+        assert [p["id"] for p in unseen(items, state, "post", stats)] == ["p2", "p3"]
+        assert stats["skipped"] == 2
+
+    def test_unseen_without_stats(self, state):
+        mark_seen(state, "c1", kind="comment")
+        assert list(unseen([{"id": "c1"}], state, "comment")) == []
+
+    def test_batched(self):
+        assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(batched([], 2)) == []
+
+    def test_match_items_batches_in_order(self):
+        """find_matches sees batch_size items at a time; pairs keep item order."""
+        calls = []
+
+        def find_matches(batch):
+            calls.append(len(batch))
+            return [{"post_id": item["id"]} for item in batch]
+
+        pairs = list(match_items((_post(f"p{n}") for n in range(5)), find_matches, 2))
+        assert calls == [2, 2, 1]
+        assert all(item["id"] == match["post_id"] for item, match in pairs)
+
+    def test_tally(self, stats):
+        """Routing and cross-references are counted as pairs pass."""
+        pairs = [
+            ({}, {"routing": "auto_comment", "cross_references": ["forum"]}),
+            ({}, {"routing": "triage", "cross_references": None}),
+            ({}, {"routing": "ignore", "cross_references": ["youtube", "forum"]}),
+        ]
+        assert len(list(tally(iter(pairs), stats))) == 3
+        assert (stats["matches"], stats["triage_items"], stats["skipped"]) == (1, 1, 1)
+        assert stats["cross_references"] == 3
+
+
+class TestTopOpportunities:
+    """Test the bounded new content ranking."""
+
+    @pytest.fixture
+    def detector(self):
+        with open(os.path.join(BASE_DIR, "config.yaml")) as f:
+            return NewContentDetector(yaml.safe_load(f))
+
+    @pytest.fixture
+    def posts(self):
+        with open(os.path.join(FIXTURES_DIR, "new_content_posts.json")) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _unmatched(post):
+        return {"post_id": post["id"], "routing": "triage", "issue": None}
+
+    def test_matches_assess_unmatched(self, detector, posts):
+        """With room for every opportunity the ranking equals assess_unmatched's."""
+        top = TopOpportunities(detector, limit=len(posts))
+        for post in posts:
+            top.offer(post, self._unmatched(post))
+        expected = [
+            o for o in detector.assess_unmatched(
+                [self._unmatched(p) for p in posts], {p["id"]: p for p in posts}
+            )
+            if o["score"] >= detector.min_score
+        ]
+        assert [o["score"] for o in top.ranked()] == [o["score"] for o in expected]
+        assert top.qualified == len(expected)
+
+    def test_keeps_only_limit_best(self, detector, posts):
+        """Only the limit best-scoring opportunities are held."""
+        top = TopOpportunities(detector, limit=1)
+        for post in posts:
+            top.offer(post, self._unmatched(post))
+        best = max(detector.assess_post(p)["score"] for p in posts)
+        ranked = top.ranked()
+        assert len(ranked) == 1
+        assert ranked[0]["score"] == best
+
+    def test_ties_keep_earliest(self, detector, posts):
+        """Among equal scores the first offered post is kept."""
+        top = TopOpportunities(detector, limit=1)
+        post = max(posts, key=lambda p: detector.assess_post(p)["score"])
+        for post_id in ("first", "second"):
+            top.offer({**post, "id": post_id}, self._unmatched(post))
+        assert top.ranked()[0]["post_id"] == "first"
+
+    def test_matched_posts_not_assessed(self, detector, posts):
+        """Posts matched to an issue are not opportunities."""
+        top = TopOpportunities(detector, limit=5)
+        for post in posts:
+            top.offer(post, {"post_id": post["id"], "routing": "auto_comment", "issue": 1})
+        assert top.ranked() == []
+        assert top.offered == len(posts)
@@ -0,0 +1,167 @@
+"""Tests for the persisted GitHub write queue."""
+
+import os
+import threading
+
+import pytest
+
+from aurora_monitor import post_queue
+from aurora_monitor.github_client import GitHubError
+from aurora_monitor.ledger import PostLedger
+from aurora_monitor.post_queue import PostQueue
+
+
+class FakeWriter:
+    """Records writes; fails each body in failures with the given errors, in turn."""
+
+    def __init__(self, failures=None):
+        self.writes = []
+        self.failures = failures or {}
+        self._lock = threading.Lock()
+
+    def __call__(self, target, body, repo=None):
+        with self._lock:
+            errors = self.failures.get(body)
+            if errors:
+                raise errors.pop(0)
+            self.writes.append((target, body))
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    writer = FakeWriter()
+    monkeypatch.setitem(post_queue.WRITERS, "issue_comment", writer)
+    monkeypatch.setitem(post_queue.WRITERS, "discussion_comment", writer)
+    return writer
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def make_queue(tmp_path, sleeps):
+    def make(**kwargs):
+        kwargs.setdefault("requests_per_minute", 60000)
+        return PostQueue(str(tmp_path / "state" / "queue.json"), sleep=sleeps.append, **kwargs)
+    return make
+
+
+class TestPostQueue:
+    """Test queueing, concurrent posting and resuming."""
+
+    def test_posts_everything_and_removes_files(self, writer, make_queue):
+        queue = make_queue(workers=3)
+        for n in range(4):
+            queue.add("issue_comment", 1, f"issue 1 page {n}")
+            queue.add("discussion_comment", "D_1", f"triage page {n}")
+        queue.save()
+        stats = queue.run()
+        assert stats == {"posts_written": 8, "posts_failed": 0, "posts_already_posted": 0,
+                         "posts_rate_limited": 0, "posts_queued": 0}
+        assert not os.path.exists(queue.path)
+        assert not os.path.exists(queue.done_path)
+
+    def test_writes_to_one_target_keep_order(self, writer, make_queue):
+        queue = make_queue(workers=4)
+        for n in range(20):
+            queue.add("issue_comment", n % 3, f"{n % 3}:{n}")
+        queue.save()
+        queue.run()
+        for target in range(3):
+            bodies = [body for t, body in writer.writes if t == target]
+            assert bodies == [f"{target}:{n}" for n in range(20) if n % 3 == target]
+
+    def test_resume_skips_finished_writes(self, writer, make_queue):
+        """A reloaded queue posts only the writes not logged as done."""
+        queue = make_queue()
+        for n in range(3):
+            queue.add("issue_comment", 1, f"page {n}")
+        queue.save()
+        with open(queue.done_path, "w") as f:
+            f.write("0\n")  # The killed run finished the first write
+
+        resumed = make_queue()
+        assert [e["body"] for e in resumed.pending()] == ["page 1", "page 2"]
+        resumed.run()
+        assert writer.writes == [(1, "page 1"), (1, "page 2")]
+
+    def test_rate_limit_pauses_and_retries(self, writer, make_queue, sleeps):
+        """A secondary rate limit holds writes back for its Retry-After."""
+        writer.failures["page 0"] = [GitHubError("secondary rate limit", status=403,
+                                                 rate_limited=True, retry_after=30)]
+        queue = make_queue()
+        queue.add("issue_comment", 1, "page 0")
+        queue.save()
+        stats = queue.run()
+        assert writer.writes == [(1, "page 0")]
+        assert stats["posts_rate_limited"] == 1
+        assert max(sleeps) >= 30
+
+    def test_concurrent_rate_limits_pause_once(self, writer, make_queue, sleeps):
+        """Workers hit by the same secondary rate limit do not stack their pauses."""
+        for target in range(3):
+            writer.failures[f"target {target}"] = [GitHubError(
+                "secondary rate limit", status=403, rate_limited=True, retry_after=30)]
+        queue = make_queue(workers=3)
+        for target in range(3):
+            queue.add("issue_comment", target, f"target {target}")
+        queue.save()
+        stats = queue.run()
+        assert stats["posts_written"] == 3
+        assert max(sleeps) == pytest.approx(30, abs=1)
+
+    def test_backoff_doubles_without_retry_after(self, writer, make_queue, capsys):
+        writer.failures["page 0"] = [GitHubError("rate limit", rate_limited=True)
+                                     for _ in range(2)]
+        queue = make_queue()
+        queue.backoff = 10
+        queue.add("issue_comment", 1, "page 0")
+        queue.save()
+        queue.run()
+        out = capsys.readouterr().out
+        assert "retrying in 10s" in out and "retrying in 20s" in out
+        assert writer.writes == [(1, "page 0")]
+
+    def test_still_rate_limited_stays_queued(self, writer, make_queue):
+        """After max_retries the write and the rest of its target wait for the next run."""
+        writer.failures["page 0"] = [GitHubError("rate limit", rate_limited=True, retry_after=0)
+                                     for _ in range(3)]
+        queue = make_queue(max_retries=2)
+        queue.add("issue_comment", 1, "page 0")
+        queue.add("issue_comment", 1, "page 1")
+        queue.add("issue_comment", 2, "other")
+        queue.save()
+        stats = queue.run()
+        assert writer.writes == [(2, "other")]
+        assert stats["posts_queued"] == 2
+        assert [e["body"] for e in make_queue().pending()] == ["page 0", "page 1"]
+
+    def test_other_errors_dropped(self, writer, make_queue, capsys):
+        writer.failures["bad"] = [GitHubError("HTTP 422: Validation Failed", status=422)]
+        queue = make_queue()
+        queue.add("issue_comment", 1, "bad")
+        queue.add("issue_comment", 1, "good")
+        queue.save()
+        stats = queue.run()
+        assert writer.writes == [(1, "good")]
+        assert stats["posts_failed"] == 1
+        assert "Validation Failed" in capsys.readouterr().out
+
+    def test_unknown_kind(self, make_queue):
+        with pytest.raises(ValueError):
+            make_queue().add("reaction", 1, "+1")
+
+    def test_ledger_skips_posted_and_records_new(self, writer, make_queue, tmp_path):
+        """A write the ledger has seen is not posted again on resume."""
+        ledger = PostLedger(str(tmp_path / "state" / "ledger.jsonl"))
+        ledger.record(1, None, "page 0")  # Posted just before the run was killed
+        queue = make_queue(ledger=ledger)
+        queue.add("issue_comment", 1, "page 0")
+        queue.add("issue_comment", 1, "page 1")
+        queue.save()
+        stats = queue.run()
+        assert writer.writes == [(1, "page 1")]
+        assert stats["posts_already_posted"] == 1
+        assert ledger.has_body(1, "page 1")
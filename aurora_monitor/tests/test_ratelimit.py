@@ -0,0 +1,132 @@
+"""Tests for the token bucket rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from aurora_monitor.sources.ratelimit import TokenBucket, pace_from_headers
+
+
+class TestTokenBucket:
+    """Test token reservation and refill."""
+
+    def test_burst_available_immediately(self, clock):
+        """Up to burst requests may go out without waiting."""
+        bucket = TokenBucket(60, burst=3, clock=clock)
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_reservations_queue_at_budget_rate(self, clock):
+        """Requests beyond the burst are spaced at the per-minute budget."""
+        bucket = TokenBucket(60, burst=1, clock=clock)
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 1.0, 2.0, 3.0]
+
+    def test_tokens_refill_over_time(self, clock):
+        """Idle time refills tokens, capped at burst."""
+        bucket = TokenBucket(30, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now += 60  # long idle refills to burst, not beyond
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 2.0]
+
+    def test_invalid_rate_rejected(self):
+        """A zero budget is a config error."""
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+    def test_concurrent_acquire_respects_budget(self):
+        """Concurrent acquirers are released no faster than the budget."""
+        bucket = TokenBucket(1200, burst=1)  # one every 50 ms
+
+        async def acquire_all():
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+            return time.monotonic() - start
+
+        assert asyncio.run(acquire_all()) >= 0.19
+
+    def test_set_rate_changes_spacing(self, clock):
+        """A new rate applies to reservations made after it."""
+        bucket = TokenBucket(60, burst=1, clock=clock)
+        bucket.reserve()
+        bucket.set_rate(120)
+        assert bucket.reserve() == 0.5
+        assert bucket.requests_per_minute == 120
+
+    def test_pause_delays_next_reservation(self, clock):
+        """pause() holds back the next request for the given seconds."""
+        bucket = TokenBucket(60, burst=1, clock=clock)
+        bucket.pause(10)
+        assert bucket.reserve() == pytest.approx(11.0)
+
+    def test_overlapping_pauses_do_not_add_up(self, clock):
+        """Concurrent pauses hold requests until the latest deadline, once."""
+        bucket = TokenBucket(60, burst=1, clock=clock)
+        for _ in range(4):
+            bucket.pause(60)
+        clock.now += 1
+        bucket.pause(30)  # Ends before the first pauses
+        assert bucket.reserve() == pytest.approx(60.0)
+
+    def test_set_rate_keeps_pause(self, clock):
+        """Re-pacing after a pause does not shorten it."""
+        bucket = TokenBucket(60, burst=1, clock=clock)
+        bucket.pause(60)
+        bucket.set_rate(100)
+        assert bucket.reserve() == pytest.approx(60.6)
+
+    def test_no_refill_during_pause(self, clock):
+        """Requests after a pause are spaced at the budget, not sent as a burst."""
+        bucket = TokenBucket(60, burst=5, clock=clock)
+        bucket.pause(10)
+        clock.now += 10
+        assert [bucket.reserve() for _ in range(2)] == pytest.approx([1.0, 2.0])
+
+    def test_waited_accumulates(self):
+        """Time callers spent waiting is tracked."""
+        bucket = TokenBucket(1200, burst=1)
+
+        async def acquire_all():
+            await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+        asyncio.run(acquire_all())
+        assert bucket.waited == pytest.approx(0.15, abs=0.02)
+        assert bucket.throttled == 0.0
+
+    def test_pause_waits_counted_as_throttled(self):
+        """Waits inside a pause() are throttled time; the rest is pacing."""
+        bucket = TokenBucket(1200, burst=1)  # one every 50 ms
+        bucket.pause(0.1)
+
+        async def acquire_all():
+            await asyncio.gather(*(bucket.acquire() for _ in range(2)))
+
+        asyncio.run(acquire_all())
+        # Waits of 0.15 and 0.2 s, each 0.1 s of it inside the pause
+        assert bucket.waited == pytest.approx(0.35, abs=0.02)
+        assert bucket.throttled == pytest.approx(0.2, abs=0.02)
+
+
+class TestPaceFromHeaders:
+    """Test reading Reddit's rate-limit headers."""
+
+    def test_spreads_remaining_budget(self):
+        """Remaining requests are spread over the seconds to reset."""
+        headers = {"X-Ratelimit-Remaining": "50.0", "X-Ratelimit-Reset": "100"}
+        assert pace_from_headers(headers, 100) == ("rate", 30.0)
+
+    def test_capped(self):
+        """The rate never exceeds the configured maximum."""
+        headers = {"X-Ratelimit-Remaining": "99", "X-Ratelimit-Reset": "10"}
+        assert pace_from_headers(headers, 60) == ("rate", 60)
+
+    def test_spent_budget_pauses_until_reset(self):
+        """An exhausted budget pauses until the window resets."""
+        headers = {"X-Ratelimit-Remaining": "0.0", "X-Ratelimit-Reset": "42"}
+        assert pace_from_headers(headers, 100) == ("pause", 42.0)
+
+    def test_missing_or_bad_headers(self):
+        """Responses without usable headers leave pacing alone."""
+        assert pace_from_headers({}, 100) is None
+        assert pace_from_headers({"X-Ratelimit-Remaining": "x",
+                                  "X-Ratelimit-Reset": "1"}, 100) is None
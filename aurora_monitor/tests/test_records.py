@@ -0,0 +1,73 @@
+"""Tests for the slotted record types."""
+
+import json
+import pickle
+import sys
+
+import pytest
+
+from aurora_monitor.records import Comment, MatchResult, Post
+
+
+@pytest.fixture
+def post():
+    return Post(id="abc123", subreddit="aurora4x", author="Tester",
+                title="Hull space", selftext="Armor per HS", created_utc=1708000000.0)
+
+
+class TestRecordMapping:
+    """Test dict-compatible access."""
+
+    def test_item_access(self, post):
+        assert post["id"] == "abc123"
+        assert post.get("title") == "Hull space"
+        assert post.get("missing", "default") == "default"
+        with pytest.raises(KeyError):
+            post["missing"]
+
+    def test_membership_distinguishes_posts_from_comments(self, post):
+        """Matcher tells items apart by key presence, as with dicts."""
+        comment = Comment(id="c1", body="Tested it")
+        assert "selftext" in post and "body" not in post
+        assert "body" in comment and "selftext" not in comment
+
+    def test_equals_normalized_dict(self, post):
+        as_dict = dict(post)
+        assert post == as_dict
+        assert {**post} == as_dict
+        assert list(post) == list(Post.__slots__)
+
+    def test_item_assignment(self):
+        """Existing fields can be assigned; new keys cannot."""
+        match = MatchResult(post_id="abc123")
+        match["parent_title"] = "Hull space"
+        assert match.parent_title == "Hull space"
+        with pytest.raises(KeyError):
+            match["extra"] = 1
+
+    def test_json_via_dict(self, post):
+        assert json.loads(json.dumps(dict(post)))["author"] == "Tester"
+
+    def test_from_dict_ignores_unknown_keys(self):
+        comment = Comment.from_dict({"id": "c1", "body": "x", "score": 5})
+        assert comment["body"] == "x"
+        assert comment["author"] == "[deleted]"
+
+    def test_pickles(self, post):
+        """Records cross process boundaries for MatcherPool."""
+        assert pickle.loads(pickle.dumps(post)) == post
+
+
+class TestCompactness:
+    """Test the memory-saving properties."""
+
+    def test_no_instance_dict(self, post):
+        assert not hasattr(post, "__dict__")
+        assert sys.getsizeof(post) < sys.getsizeof(dict(post))
+
+    def test_repeated_strings_interned(self):
+        """Separately decoded authors and routings share one string object."""
+        first = MatchResult(**json.loads('{"post_id": "a", "author": "Tester", "routing": "triage"}'))
+        second = MatchResult(**json.loads('{"post_id": "b", "author": "Tester", "routing": "triage"}'))
+        assert first.author is second.author
+        assert first.routing is second.routing
@@ -2,10 +2,13 @@
 
 import json
 import os
+import threading
+import time
+from datetime import timedelta
 from unittest.mock import patch, MagicMock
 import pytest
 
-from aurora_monitor.sources.reddit import RedditFetcher
+from aurora_monitor.sources.reddit import AsyncRedditFetcher, CommentTreeWalk, RedditFetcher
 
 FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
 
@@ -126,12 +129,13 @@ def mock_comments():
 class TestFetchPosts:
     """Test fetching new posts from a subreddit."""
 
-    @patch("aurora_monitor.sources.reddit.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_new_posts(self, mock_get, fetcher, mock_listing):
         """Should return normalized post dicts from Reddit API."""
         mock_response = MagicMock()
+        mock_response.elapsed = timedelta(0)
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_listing
+        mock_response.content = json.dumps(mock_listing).encode("utf-8")
         mock_get.return_value = mock_response
 
         posts, after = fetcher.fetch_new_posts("aurora4x")
@@ -143,12 +147,13 @@ class TestFetchPosts:
         assert posts[0]["title"] == "Test post about missiles"
         assert after == "t3_next_page"
 
-    @patch("aurora_monitor.sources.reddit.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_with_after_token(self, mock_get, fetcher, mock_listing):
         """Should pass after token for pagination."""
         mock_response = MagicMock()
+        mock_response.elapsed = timedelta(0)
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_listing
+        mock_response.content = json.dumps(mock_listing).encode("utf-8")
         mock_get.return_value = mock_response
 
         fetcher.fetch_new_posts("aurora4x", after="t3_prev_page")
@@ -161,12 +166,13 @@ class TestFetchPosts:
 class TestFetchComments:
     """Test fetching comments for a post."""
 
-    @patch("aurora_monitor.sources.reddit.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_post_comments(self, mock_get, fetcher, mock_comments):
         """Should return normalized comment dicts."""
         mock_response = MagicMock()
+        mock_response.elapsed = timedelta(0)
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_comments
+        mock_response.content = json.dumps(mock_comments).encode("utf-8")
         mock_get.return_value = mock_response
 
         comments = fetcher.fetch_post_comments("aurora4x", "abc123")
@@ -177,20 +183,206 @@ class TestFetchComments:
         assert "tested this" in comments[0]["body"]
 
 
+def _comment(comment_id, parent_id, replies=None):
+    """A raw t1 comment thing, with optional reply things."""
+    data = {"id": comment_id, "author": "a", "body": comment_id,
+            "parent_id": parent_id, "created_utc": 1708000000.0}
+    data["replies"] = {"kind": "Listing", "data": {"children": replies}} if replies else ""
+    return {"kind": "t1", "data": data}
+
+
+def _more(children, parent_id="t3_abc123"):
+    return {"kind": "more", "data": {"id": "_", "count": len(children),
+                                     "children": children, "parent_id": parent_id}}
+
+
+def _comments_page(things):
+    return [{"kind": "Listing", "data": {"children": []}},
+            {"kind": "Listing", "data": {"children": things}}]
+
+
+def _json_response(payload):
+    response = MagicMock(status_code=200, elapsed=timedelta(0), headers={})
+    response.content = json.dumps(payload).encode("utf-8")
+    return response
+
+
+class TestCommentTree:
+    """Test full comment tree retrieval with stub expansion."""
+
+    def _serve(self, mock_get, pages):
+        """Route mocked GETs by URL substring; record requested URLs."""
+        requested = []
+
+        def fake_get(url, timeout=None, headers=None):
+            requested.append(url)
+            for key, payload in pages:
+                if key in url:
+                    return _json_response(payload(url) if callable(payload) else payload)
+            raise AssertionError(f"unexpected URL {url}")
+
+        mock_get.side_effect = fake_get
+        return requested
+
+    @patch("requests.Session.get")
+    def test_nested_replies_depth_first(self, mock_get, fetcher):
+        """Replies are returned in thread order after their parents."""
+        page = _comments_page([
+            _comment("c1", "t3_abc123", [_comment("c1a", "t1_c1", [_comment("c1a1", "t1_c1a")])]),
+            _comment("c2", "t3_abc123"),
+        ])
+        self._serve(mock_get, [("/comments/abc123", page)])
+        comments = fetcher.fetch_post_comments("aurora4x", "abc123")
+        assert [c["id"] for c in comments] == ["c1", "c1a", "c1a1", "c2"]
+        assert comments[1]["parent_id"] == "t1_c1"
+        assert {c["link_id"] for c in comments} == {"t3_abc123"}
+
+    def test_deep_thread_without_recursion_limit(self):
+        """Reply chains deeper than the recursion limit are walked.
+
+        Walked directly: no JSON decoder will nest this deep, and Reddit
+        cuts threads into "continue this thread" pages long before.
+        """
+        node = _comment("d5000", "t1_d4999")
+        for depth in range(4999, -1, -1):
+            node = _comment(f"d{depth}", f"t1_d{depth - 1}", [node])
+        assert len(list(CommentTreeWalk("aurora4x").walk([node]))) == 5001
+
+    @patch("requests.Session.get")
+    def test_more_stubs_expanded_in_batches(self, mock_get, fetcher):
+        """More IDs are requested 100 per morechildren call."""
+        ids = [f"m{i}" for i in range(150)]
+
+        def morechildren(url):
+            children = url.split("children=")[1].split("&")[0].split(",")
+            return {"json": {"errors": [], "data": {
+                "things": [_comment(cid, "t3_abc123") for cid in children]}}}
+
+        page = _comments_page([_comment("c1", "t3_abc123"), _more(ids)])
+        requested = self._serve(mock_get, [("/api/morechildren", morechildren),
+                                           ("/comments/abc123", page)])
+        comments = fetcher.fetch_post_comments("aurora4x", "abc123")
+        assert [c["id"] for c in comments] == ["c1"] + ids
+        more_calls = [url for url in requested if "morechildren" in url]
+        assert len(more_calls) == 2
+        assert "link_id=t3_abc123" in more_calls[0]
+
+    @patch("requests.Session.get")
+    def test_expanded_stubs_are_expanded_again(self, mock_get, fetcher):
+        """Stubs returned by morechildren are queued for the next round."""
+        responses = {
+            "children=m1&": [_comment("m1", "t3_abc123"), _more(["m2"])],
+            "children=m2&": [_comment("m2", "t3_abc123")],
+        }
+
+        def morechildren(url):
+            things = next(v for k, v in responses.items() if k in url)
+            return {"json": {"data": {"things": things}}}
+
+        page = _comments_page([_more(["m1"])])
+        self._serve(mock_get, [("/api/morechildren", morechildren),
+                               ("/comments/abc123", page)])
+        comments = fetcher.fetch_post_comments("aurora4x", "abc123")
+        assert [c["id"] for c in comments] == ["m1", "m2"]
+
+    @patch("requests.Session.get")
+    def test_continue_thread_stub(self, mock_get, fetcher):
+        """A stub without IDs is expanded from its parent's thread page."""
+        page = _comments_page([_comment("c1", "t3_abc123", [_more([], parent_id="t1_c1")])])
+        thread = _comments_page([_comment("c1", "t3_abc123", [_comment("c1a", "t1_c1")])])
+        requested = self._serve(mock_get, [("/comments/abc123/_/c1", thread),
+                                           ("/comments/abc123", page)])
+        comments = fetcher.fetch_post_comments("aurora4x", "abc123")
+        assert [c["id"] for c in comments] == ["c1", "c1a"]
+        assert len(requested) == 2
+
+    @patch("requests.Session.get")
+    def test_expansion_request_cap(self, mock_get, config, capsys):
+        """Expansion stops at max_expand_requests with a warning."""
+        config["reddit"]["max_expand_requests"] = 1
+        fetcher = RedditFetcher(config)
+        page = _comments_page([_more([f"m{i}" for i in range(250)])])
+        requested = self._serve(mock_get, [
+            ("/api/morechildren", {"json": {"data": {"things": []}}}),
+            ("/comments/abc123", page),
+        ])
+        fetcher.fetch_post_comments("aurora4x", "abc123")
+        assert len(requested) == 2
+        assert "150 comments and 0 threads" in capsys.readouterr().out
+
+    @patch("requests.Session.get")
+    def test_expansion_disabled(self, mock_get, config):
+        """With expand_comments off only the comments page is fetched."""
+        config["reddit"]["expand_comments"] = False
+        fetcher = RedditFetcher(config)
+        page = _comments_page([_comment("c1", "t3_abc123"), _more(["m1"])])
+        requested = self._serve(mock_get, [("/comments/abc123", page)])
+        assert len(fetcher.fetch_post_comments("aurora4x", "abc123")) == 1
+        assert len(requested) == 1
+
+    @patch("requests.Session.get")
+    def test_failed_expansion_keeps_other_comments(self, mock_get, fetcher):
+        """A failing morechildren call loses only that branch."""
+        page = _comments_page([_comment("c1", "t3_abc123"), _more(["m1"])])
+        requested = []
+
+        def fake_get(url, timeout=None, headers=None):
+            requested.append(url)
+            if "morechildren" in url:
+                response = MagicMock(status_code=500, elapsed=timedelta(0), headers={})
+                response.raise_for_status.side_effect = Exception("500 Server Error")
+                return response
+            return _json_response(page)
+
+        mock_get.side_effect = fake_get
+        comments = fetcher.fetch_post_comments("aurora4x", "abc123")
+        assert [c["id"] for c in comments] == ["c1"]
+
+    @patch("requests.Session.get")
+    def test_iter_post_comments_streams(self, mock_get, fetcher):
+        """Page comments are yielded before any expansion request."""
+        page = _comments_page([_comment("c1", "t3_abc123"), _more(["m1"])])
+        requested = self._serve(mock_get, [
+            ("/api/morechildren", {"json": {"data": {"things": [_comment("m1", "t3_abc123")]}}}),
+            ("/comments/abc123", page),
+        ])
+        stream = fetcher.iter_post_comments("aurora4x", "abc123")
+        assert next(stream)["id"] == "c1"
+        assert len(requested) == 1
+        assert [c["id"] for c in stream] == ["m1"]
+
+    @patch("requests.Session.get")
+    def test_async_expansion(self, mock_get, config):
+        """The async fetcher expands stubs the same way."""
+        config["reddit"]["requests_per_minute"] = 60000
+        fetcher = AsyncRedditFetcher(config)
+        page = _comments_page([_comment("c1", "t3_abc123"), _more(["m1", "m2"])])
+        self._serve(mock_get, [
+            ("/api/morechildren", {"json": {"data": {"things": [
+                _comment("m1", "t3_abc123"), _comment("m2", "t1_m1")]}}}),
+            ("/comments/abc123", page),
+        ])
+        [comments] = fetcher.fetch_comments_many([("aurora4x", "abc123")])
+        assert [c["id"] for c in comments] == ["c1", "m1", "m2"]
+
+
 class TestRateLimiting:
     """Test rate limiting and error handling."""
 
-    @patch("aurora_monitor.sources.reddit.requests.get")
+    @patch("requests.Session.get")
     def test_429_retry(self, mock_get, fetcher, mock_listing):
         """Should retry on 429 with backoff."""
         mock_429 = MagicMock()
+        mock_429.elapsed = timedelta(0)
         mock_429.status_code = 429
         mock_429.headers = {"Retry-After": "1"}
         mock_429.raise_for_status.side_effect = Exception("429 Too Many Requests")
 
         mock_ok = MagicMock()
+
+        mock_ok.elapsed = timedelta(0)
         mock_ok.status_code = 200
-        mock_ok.json.return_value = mock_listing
+        mock_ok.content = json.dumps(mock_listing).encode("utf-8")
 
         mock_get.side_effect = [mock_429, mock_ok]
 
@@ -198,10 +390,11 @@ class TestRateLimiting:
         assert len(posts) == 2
         assert mock_get.call_count == 2
 
-    @patch("aurora_monitor.sources.reddit.requests.get")
+    @patch("requests.Session.get")
     def test_max_retries_exceeded(self, mock_get, fetcher):
         """Should raise after max retries."""
         mock_429 = MagicMock()
+        mock_429.elapsed = timedelta(0)
         mock_429.status_code = 429
         mock_429.headers = {"Retry-After": "1"}
         mock_429.raise_for_status.side_effect = Exception("429")
@@ -215,7 +408,7 @@ class TestRateLimiting:
 class TestBackfill:
     """Test backfill pagination."""
 
-    @patch("aurora_monitor.sources.reddit.requests.get")
+    @patch("requests.Session.get")
     def test_backfill_paginates(self, mock_get, fetcher):
         """Backfill should follow pagination tokens."""
         page1 = {
@@ -267,10 +460,10 @@ class TestBackfill:
             },
         }
 
-        mock_resp1 = MagicMock(status_code=200)
-        mock_resp1.json.return_value = page1
-        mock_resp2 = MagicMock(status_code=200)
-        mock_resp2.json.return_value = page2
+        mock_resp1 = MagicMock(status_code=200, elapsed=timedelta(0))
+        mock_resp1.content = json.dumps(page1).encode("utf-8")
+        mock_resp2 = MagicMock(status_code=200, elapsed=timedelta(0))
+        mock_resp2.content = json.dumps(page2).encode("utf-8")
         mock_get.side_effect = [mock_resp1, mock_resp2]
 
         posts = fetcher.backfill("aurora4x")
@@ -281,7 +474,7 @@ class TestBackfill:
 class TestFlairFiltering:
     """Test flair-based post filtering."""
 
-    @patch("aurora_monitor.sources.reddit.requests.get")
+    @patch("requests.Session.get")
     def test_skip_aar_flair(self, mock_get, fetcher):
         """Posts with Captain's Log flair should be skipped."""
         listing = {
@@ -337,15 +530,15 @@ class TestFlairFiltering:
                 ],
             },
         }
-        mock_response = MagicMock(status_code=200)
-        mock_response.json.return_value = listing
+        mock_response = MagicMock(status_code=200, elapsed=timedelta(0))
+        mock_response.content = json.dumps(listing).encode("utf-8")
         mock_get.return_value = mock_response
 
         posts, _ = fetcher.fetch_new_posts("aurora4x")
         assert len(posts) == 1
         assert posts[0]["id"] == "mechanics_post"
 
-    @patch("aurora_monitor.sources.reddit.requests.get")
+    @patch("requests.Session.get")
     def test_no_flair_passes_through(self, mock_get, fetcher):
         """Posts without flair should not be filtered."""
         listing = {
@@ -371,14 +564,14 @@ class TestFlairFiltering:
                 ],
             },
         }
-        mock_response = MagicMock(status_code=200)
-        mock_response.json.return_value = listing
+        mock_response = MagicMock(status_code=200, elapsed=timedelta(0))
+        mock_response.content = json.dumps(listing).encode("utf-8")
         mock_get.return_value = mock_response
 
         posts, _ = fetcher.fetch_new_posts("aurora4x")
         assert len(posts) == 1
 
-    @patch("aurora_monitor.sources.reddit.requests.get")
+    @patch("requests.Session.get")
     def test_flair_case_insensitive(self, mock_get, fetcher):
         """Flair filtering should be case-insensitive."""
         listing = {
@@ -404,9 +597,274 @@ class TestFlairFiltering:
                 ],
             },
         }
-        mock_response = MagicMock(status_code=200)
-        mock_response.json.return_value = listing
+        mock_response = MagicMock(status_code=200, elapsed=timedelta(0))
+        mock_response.content = json.dumps(listing).encode("utf-8")
         mock_get.return_value = mock_response
 
         posts, _ = fetcher.fetch_new_posts("aurora4x")
         assert len(posts) == 0
+
+
+class TestAsyncFetcher:
+    """Test the concurrent fetcher."""
+
+    @pytest.fixture
+    def async_fetcher(self, config):
+        config["reddit"]["requests_per_minute"] = 60000  # effectively unlimited
+        config["reddit"]["max_in_flight"] = 2
+        return AsyncRedditFetcher(config)
+
+    @staticmethod
+    def _ok(payload, headers=None):
+        response = MagicMock()
+        response.elapsed = timedelta(0)
+        response.headers = headers or {}
+        response.status_code = 200
+        response.content = json.dumps(payload).encode("utf-8")
+        return response
+
+    def test_budget_defaults_from_delay(self, config):
+        """Without requests_per_minute the budget follows rate_limit_delay."""
+        config["reddit"]["rate_limit_delay"] = 2.5
+        assert AsyncRedditFetcher(config).requests_per_minute == 24
+
+    @patch("requests.Session.get")
+    def test_fetch_new_posts_many(self, mock_get, async_fetcher, mock_listing):
+        """Each subreddit's newest page is parsed like fetch_new_posts."""
+        mock_get.return_value = self._ok(mock_listing)
+        results = async_fetcher.fetch_new_posts_many(["aurora4x", "aurora"])
+        assert list(results) == ["aurora4x", "aurora"]
+        assert [p["id"] for p in results["aurora4x"]] == ["abc123", "def456"]
+        assert mock_get.call_count == 2
+
+    @patch("requests.Session.get")
+    def test_fetch_comments_many_keeps_order_and_errors(self, mock_get, async_fetcher,
+                                                        mock_comments):
+        """Results follow target order; a failed fetch is returned, not raised."""
+        def fake_get(url, timeout=None, headers=None):
+            if "bad" in url:
+                response = MagicMock()
+                response.elapsed = timedelta(0)
+                response.headers = {}
+                response.status_code = 500
+                response.raise_for_status.side_effect = Exception("500 Server Error")
+                return response
+            return self._ok(mock_comments)
+
+        mock_get.side_effect = fake_get
+        results = async_fetcher.fetch_comments_many(
+            [("aurora4x", "abc123"), ("aurora4x", "bad"), ("aurora", "def456")]
+        )
+        assert len(results) == 3
+        assert results[0][0]["subreddit"] == "aurora4x"
+        assert isinstance(results[1], Exception)
+        assert results[2][0]["subreddit"] == "aurora"
+
+    @patch("requests.Session.get")
+    def test_backfill_many_paginates(self, mock_get, async_fetcher, mock_listing):
+        """Each subreddit is paginated up to backfill_max_pages."""
+        mock_get.return_value = self._ok(mock_listing)
+        results = async_fetcher.backfill_many(["aurora4x", "aurora"])
+        assert [len(posts) for posts in results.values()] == [4, 4]
+        assert mock_get.call_count == 4
+        after_urls = [c.args[0] for c in mock_get.call_args_list if "after=" in c.args[0]]
+        assert len(after_urls) == 2
+
+    @patch("requests.Session.get")
+    def test_iter_backfill_yields_pages(self, mock_get, async_fetcher, mock_listing):
+        """Every page of every subreddit is yielded as (subreddit, posts)."""
+        mock_get.return_value = self._ok(mock_listing)
+        pages = list(async_fetcher.iter_backfill(["aurora4x", "aurora"]))
+        assert sorted(sub for sub, _ in pages) == ["aurora", "aurora", "aurora4x", "aurora4x"]
+        assert all(len(posts) == 2 for _, posts in pages)
+
+    @patch("requests.Session.get")
+    def test_iter_backfill_bounded_buffer(self, mock_get, config, mock_listing):
+        """Fetching stays at most buffer_pages (plus one in hand) ahead of the consumer."""
+        config["reddit"]["requests_per_minute"] = 60000
+        config["reddit"]["backfill_max_pages"] = 10
+        fetcher = AsyncRedditFetcher(config)
+        mock_get.return_value = self._ok(mock_listing)
+        pages = fetcher.iter_backfill(["aurora4x"], buffer_pages=1)
+        next(pages)
+        time.sleep(0.2)
+        assert mock_get.call_count <= 3
+        assert len(list(pages)) == 9
+
+    @patch("requests.Session.get")
+    def test_iter_backfill_close_stops_fetching(self, mock_get, config, mock_listing):
+        """Closing the generator early stops the fetch loop."""
+        config["reddit"]["requests_per_minute"] = 60000
+        config["reddit"]["backfill_max_pages"] = 50
+        fetcher = AsyncRedditFetcher(config)
+        mock_get.return_value = self._ok(mock_listing)
+        pages = fetcher.iter_backfill(["aurora4x"], buffer_pages=1)
+        next(pages)
+        pages.close()
+        calls = mock_get.call_count
+        time.sleep(0.2)
+        assert mock_get.call_count == calls < 50
+
+    @patch("requests.Session.get")
+    def test_in_flight_limit(self, mock_get, async_fetcher, mock_comments):
+        """No more than max_in_flight requests run at once."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_get(url, timeout=None, headers=None):
+            with lock:
+                active.append(url)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(url)
+            return self._ok(mock_comments)
+
+        mock_get.side_effect = slow_get
+        async_fetcher.fetch_comments_many([("aurora4x", f"p{i}") for i in range(6)])
+        assert max(peak) == 2
+
+
+class TestFetchUntilSeen:
+    """Test steady-state paging back to the previous run."""
+
+    @staticmethod
+    def _page(ids, after):
+        response = MagicMock(status_code=200, elapsed=timedelta(0), headers={})
+        response.content = json.dumps({"kind": "Listing", "data": {
+            "after": after,
+            "children": [
+                {"kind": "t3", "data": {"id": post_id, "title": "", "selftext": "",
+                                        "created_utc": created}}
+                for post_id, created in ids
+            ],
+        }}).encode("utf-8")
+        return response
+
+    @pytest.fixture
+    def async_fetcher(self, config):
+        config["reddit"]["requests_per_minute"] = 60000
+        config["reddit"]["seen_run_stop"] = 2
+        config["reddit"]["steady_max_pages"] = 3
+        return AsyncRedditFetcher(config)
+
+    def _fetch(self, fetcher, seen=(), watermark=None):
+        results = fetcher.fetch_until_seen_many(
+            ["aurora4x"], lambda post_id: post_id in seen, {"aurora4x": watermark}
+        )
+        posts, pages = results["aurora4x"]
+        return [p["id"] for p in posts], pages
+
+    @patch("requests.Session.get")
+    def test_stops_at_watermark(self, mock_get, async_fetcher):
+        """Paging stops at the first post older than the watermark."""
+        mock_get.side_effect = [
+            self._page([("p1", 100), ("p2", 90)], "t3_p2"),
+            self._page([("p3", 80), ("p4", 70)], "t3_p4"),
+        ]
+        ids, pages = self._fetch(async_fetcher, watermark=80)
+        assert ids == ["p1", "p2", "p3"]
+        assert pages == 2
+
+    @patch("requests.Session.get")
+    def test_stops_after_seen_run(self, mock_get, async_fetcher):
+        """A run of seen_run_stop seen posts ends paging."""
+        mock_get.side_effect = [
+            self._page([("p1", 100), ("s1", 90)], "t3_s1"),
+            self._page([("p2", 85), ("s2", 80), ("s3", 70)], "t3_s3"),
+        ]
+        ids, pages = self._fetch(async_fetcher, seen={"s1", "s2", "s3"})
+        assert ids == ["p1", "s1", "p2", "s2"]
+        assert pages == 2
+
+    @patch("requests.Session.get")
+    def test_single_page_when_nothing_new(self, mock_get, async_fetcher):
+        """A quiet subreddit costs a single request."""
+        mock_get.side_effect = [self._page([("s1", 90), ("s2", 80)], "t3_s2")]
+        ids, pages = self._fetch(async_fetcher, seen={"s1", "s2"}, watermark=90)
+        assert ids == ["s1"]
+        assert pages == 1
+        assert mock_get.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_max_pages_warns(self, mock_get, async_fetcher, capsys):
+        """Running out of pages before the previous run is reported."""
+        mock_get.side_effect = [
+            self._page([(f"p{i}", 100 - i)], f"t3_p{i}") for i in range(3)
+        ]
+        ids, pages = self._fetch(async_fetcher, watermark=10)
+        assert ids == ["p0", "p1", "p2"]
+        assert pages == 3
+        assert "may be missed" in capsys.readouterr().out
+
+
+class TestAdaptiveRateLimit:
+    """Test pacing from Reddit's rate-limit headers."""
+
+    @pytest.fixture
+    def async_fetcher(self, config):
+        config["reddit"]["requests_per_minute"] = 60000
+        config["reddit"]["max_requests_per_minute"] = 60000
+        return AsyncRedditFetcher(config)
+
+    @patch("requests.Session.get")
+    def test_headers_repace_bucket(self, mock_get, async_fetcher, mock_listing):
+        """Remaining budget is spread evenly over the reset window."""
+        mock_get.return_value = TestAsyncFetcher._ok(
+            mock_listing, {"X-Ratelimit-Remaining": "90.0", "X-Ratelimit-Reset": "60"}
+        )
+        async_fetcher.fetch_new_posts_many(["aurora4x"])
+        assert async_fetcher.bucket.requests_per_minute == pytest.approx(90)
+
+    @patch("requests.Session.get")
+    def test_rate_capped(self, mock_get, config, mock_listing):
+        """A generous budget is capped at max_requests_per_minute."""
+        config["reddit"]["max_requests_per_minute"] = 30
+        fetcher = AsyncRedditFetcher(config)
+        mock_get.return_value = TestAsyncFetcher._ok(
+            mock_listing, {"X-Ratelimit-Remaining": "600", "X-Ratelimit-Reset": "60"}
+        )
+        fetcher.fetch_new_posts_many(["aurora4x"])
+        assert fetcher.bucket.requests_per_minute == pytest.approx(30)
+
+    @patch("requests.Session.get")
+    def test_429_pauses_shared_bucket(self, mock_get, async_fetcher, mock_listing):
+        """A 429 holds back the next request by Retry-After and is reported."""
+        throttled = MagicMock(status_code=429, elapsed=timedelta(0),
+                              headers={"Retry-After": "0.2"})
+        mock_get.side_effect = [throttled, TestAsyncFetcher._ok(mock_listing)]
+        start = time.monotonic()
+        results = async_fetcher.fetch_new_posts_many(["aurora4x"])
+        assert time.monotonic() - start >= 0.19
+        assert len(results["aurora4x"]) == 2
+        summary = async_fetcher.rate_summary()
+        assert summary["rate_limited_429s"] == 1
+        assert summary["throttled_seconds"] >= 0.1
+        assert summary["pacing_wait_seconds"] < 0.1
+
+    @patch("requests.Session.get")
+    def test_rate_summary(self, mock_get, async_fetcher, mock_comments):
+        """The summary reports the achieved request rate."""
+        mock_get.return_value = TestAsyncFetcher._ok(mock_comments)
+        async_fetcher.fetch_comments_many([("aurora4x", f"p{i}") for i in range(3)])
+        summary = async_fetcher.rate_summary()
+        assert summary["requests_per_minute"] > 0
+        assert summary["rate_limited_429s"] == 0
+        assert summary["throttled_seconds"] == 0
+
+    @patch("requests.Session.get")
+    def test_pacing_not_reported_as_throttled(self, mock_get, config, mock_comments):
+        """Spacing requests under requests_per_minute is pacing, not throttling."""
+        config["reddit"]["requests_per_minute"] = 600  # one every 100 ms
+        fetcher = AsyncRedditFetcher(config)
+        fetcher.adaptive_rate_limit = False
+        mock_get.return_value = TestAsyncFetcher._ok(mock_comments)
+        fetcher.fetch_comments_many([("aurora4x", f"p{i}") for i in range(3)])
+        summary = fetcher.rate_summary()
+        assert summary["throttled_seconds"] == 0
+        assert summary["pacing_wait_seconds"] >= 0.2
+
+    def test_rate_summary_before_any_request(self, async_fetcher):
+        """No requests means no achieved rate."""
+        assert async_fetcher.rate_summary()["requests_per_minute"] is None
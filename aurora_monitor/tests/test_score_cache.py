@@ -0,0 +1,82 @@
+"""Tests for the persistent score cache module."""
+
+import json
+
+from aurora_monitor.score_cache import ScoreCache, config_hash, content_hash
+
+
+class TestHashes:
+    """Test content and config hashing."""
+
+    def test_content_hash_stable(self):
+        """The same parts always hash the same."""
+        assert content_hash("title", "body") == content_hash("title", "body")
+
+    def test_content_hash_part_boundaries(self):
+        """Moving text between parts changes the hash."""
+        assert content_hash("ab", "c") != content_hash("a", "bc")
+
+    def test_config_hash_ignores_operational_keys(self):
+        """Keys listed in ignore do not change the hash."""
+        base = {"thresholds": {"low": 40}, "workers": 1}
+        assert config_hash(base, ignore=("workers",)) == \
+            config_hash({**base, "workers": 8}, ignore=("workers",))
+
+    def test_config_hash_tracks_scoring_keys(self):
+        """Changing a threshold changes the hash."""
+        assert config_hash({"thresholds": {"low": 40}}) != \
+            config_hash({"thresholds": {"low": 45}})
+
+
+class TestScoreCache:
+    """Test cache lookups, persistence and eviction."""
+
+    def test_miss_then_hit(self, tmp_path):
+        """A stored score is served on the next lookup."""
+        cache = ScoreCache(str(tmp_path / "cache.json"), "cfg")
+        assert cache.get("post", "issue") is None
+        cache.put("post", "issue", 72.5)
+        assert cache.get("post", "issue") == 72.5
+        assert cache.stats() == {"score_cache_hits": 1, "score_cache_misses": 1}
+
+    def test_persists_across_runs(self, tmp_path):
+        """Saved entries load back under the same config hash."""
+        path = str(tmp_path / "state" / "cache.json")
+        cache = ScoreCache(path, "cfg")
+        cache.put("post", "issue", 64.0)
+        cache.save()
+        assert ScoreCache(path, "cfg").get("post", "issue") == 64.0
+
+    def test_config_change_invalidates(self, tmp_path):
+        """A cache saved under another config hash is discarded."""
+        path = str(tmp_path / "cache.json")
+        cache = ScoreCache(path, "old-cfg")
+        cache.put("post", "issue", 64.0)
+        cache.save()
+        assert ScoreCache(path, "new-cfg").get("post", "issue") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Exceeding max_entries evicts the least recently used entry."""
+        cache = ScoreCache(str(tmp_path / "cache.json"), "cfg", max_entries=2)
+        cache.put("a", "i", 1)
+        cache.put("b", "i", 2)
+        cache.get("a", "i")  # a is now most recently used
+        cache.put("c", "i", 3)
+        assert cache.get("b", "i") is None
+        assert cache.get("a", "i") == 1
+        assert cache.get("c", "i") == 3
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        """A corrupt cache file is ignored rather than failing the run."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+        assert ScoreCache(str(path), "cfg").entries == {}
+
+    def test_save_is_atomic(self, tmp_path):
+        """Saving leaves only the final file behind."""
+        path = tmp_path / "cache.json"
+        cache = ScoreCache(str(path), "cfg")
+        cache.put("post", "issue", 50.0)
+        cache.save()
+        assert json.loads(path.read_text())["entries"] == {"post:issue": 50.0}
+        assert not (tmp_path / "cache.json.tmp").exists()
@@ -5,7 +5,11 @@ import os
 import tempfile
 import pytest
 
-from aurora_monitor.state import load_state, save_state, is_seen, mark_seen
+from aurora_monitor.state import (
+    load_state, save_state, is_seen, mark_seen,
+    changed_issues, record_issue_snapshot, load_corpus, save_corpus, record_item,
+    get_watermark, advance_watermark,
+)
 
 
 class TestLoadState:
@@ -98,3 +102,137 @@ class TestBackfillSafety:
         """State with backfill_complete=False should be detectable."""
         state = load_state("/nonexistent/path.json")
         assert state["backfill_complete"] is False
+
+
+class TestIssueSnapshot:
+    """Test detection of new and edited issues between runs."""
+
+    @pytest.fixture
+    def issues(self):
+        return [
+            {"number": 1, "title": "Fire control range", "body": "Beam FC range formula"},
+            {"number": 2, "title": "Shipyard tooling", "body": None},
+        ]
+
+    def test_all_issues_changed_without_snapshot(self, issues):
+        """With no recorded snapshot every issue counts as new."""
+        state = load_state("/nonexistent/path.json")
+        assert changed_issues(state, issues) == issues
+
+    def test_no_changes_after_snapshot(self, issues):
+        """Issues recorded in the snapshot are not reported again."""
+        state = load_state("/nonexistent/path.json")
+        record_issue_snapshot(state, issues)
+        assert changed_issues(state, issues) == []
+
+    def test_new_and_edited_issues_detected(self, issues):
+        """A new issue and an edited body are both reported."""
+        state = load_state("/nonexistent/path.json")
+        record_issue_snapshot(state, issues)
+        edited = {**issues[0], "body": "Beam FC range formula, corrected"}
+        added = {"number": 3, "title": "Jump point survey", "body": ""}
+        assert changed_issues(state, [edited, issues[1], added]) == [edited, added]
+
+    def test_snapshot_survives_save(self, tmp_path, issues):
+        """The snapshot round-trips through the state file."""
+        state_file = str(tmp_path / "reddit.json")
+        state = load_state(state_file)
+        record_issue_snapshot(state, issues)
+        save_state(state_file, state)
+        assert changed_issues(load_state(state_file), issues) == []
+
+
+class TestCorpus:
+    """Test the seen-item corpus."""
+
+    def test_load_missing_corpus(self, tmp_path):
+        """A missing corpus file loads as an empty corpus."""
+        corpus = load_corpus(str(tmp_path / "corpus.json"))
+        assert corpus == {"posts": {}, "comments": {}}
+
+    def test_record_item_keeps_matching_fields(self):
+        """Only the fields needed to re-match an item are stored."""
+        corpus = {"posts": {}, "comments": {}}
+        post = {"id": "p1", "title": "T", "selftext": "S", "author": "a",
+                "subreddit": "aurora4x", "score": 12, "num_comments": 3}
+        record_item(corpus, post, kind="post")
+        assert corpus["posts"]["p1"] == {"id": "p1", "title": "T", "selftext": "S",
+                                         "author": "a", "subreddit": "aurora4x"}
+
+    def test_record_comment(self):
+        """Comments are stored separately from posts."""
+        corpus = {"posts": {}, "comments": {}}
+        record_item(corpus, {"id": "c1", "body": "text"}, kind="comment")
+        assert "c1" in corpus["comments"]
+        assert corpus["posts"] == {}
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """A saved corpus loads back unchanged."""
+        path = str(tmp_path / "state" / "corpus.json")
+        corpus = {"posts": {}, "comments": {}}
+        record_item(corpus, {"id": "p1", "title": "T", "created_utc": 1}, kind="post")
+        save_corpus(path, corpus)
+        assert load_corpus(path) == corpus
+
+    def test_save_keeps_newest_items(self, tmp_path):
+        """max_items keeps the newest items of each kind by created_utc."""
+        path = str(tmp_path / "corpus.json")
+        corpus = {"posts": {}, "comments": {}}
+        for i in range(5):
+            record_item(corpus, {"id": f"p{i}", "created_utc": i}, kind="post")
+        record_item(corpus, {"id": "c1", "created_utc": 0}, kind="comment")
+        save_corpus(path, corpus, max_items=2)
+        loaded = load_corpus(path)
+        assert set(loaded["posts"]) == {"p3", "p4"}
+        assert set(loaded["comments"]) == {"c1"}
+
+
+    def test_record_item_caps_corpus(self):
+        """max_items evicts the oldest items on insert, so memory stays bounded."""
+        corpus = {"posts": {"p0": {"id": "p0", "created_utc": 0}}, "comments": {}}
+        for i in (5, 1, 9, 3, 7, 2, 8, 4, 6):
+            record_item(corpus, {"id": f"p{i}", "created_utc": i}, kind="post", max_items=3)
+            assert len(corpus["posts"]) <= 3
+        assert set(corpus["posts"]) == {"p7", "p8", "p9"}
+        assert len(corpus["_oldest"]["posts"]) == 3
+
+    def test_capped_corpus_saves_without_heap(self, tmp_path):
+        """The eviction heap is not written to the corpus file."""
+        path = str(tmp_path / "corpus.json")
+        corpus = {"posts": {}, "comments": {}}
+        for i in range(4):
+            record_item(corpus, {"id": f"p{i}", "created_utc": i}, kind="post", max_items=2)
+        save_corpus(path, corpus, max_items=2)
+        assert load_corpus(path) == {"posts": {"p2": {"id": "p2", "created_utc": 2},
+                                               "p3": {"id": "p3", "created_utc": 3}},
+                                     "comments": {}}
+
+class TestWatermarks:
+    """Test per-subreddit created_utc high-water marks."""
+
+    def test_no_watermark_by_default(self):
+        """A fresh state has no watermark for any subreddit."""
+        state = load_state("/nonexistent/path.json")
+        assert get_watermark(state, "aurora4x") is None
+
+    def test_advance_to_newest_post(self):
+        """The watermark moves to the newest created_utc seen."""
+        state = load_state("/nonexistent/path.json")
+        advance_watermark(state, "aurora4x", [{"created_utc": 5}, {"created_utc": 9}])
+        assert get_watermark(state, "aurora4x") == 9
+        assert get_watermark(state, "aurora") is None
+
+    def test_never_moves_backwards(self):
+        """Older or empty batches leave the watermark alone."""
+        state = load_state("/nonexistent/path.json")
+        advance_watermark(state, "aurora4x", [{"created_utc": 9}])
+        advance_watermark(state, "aurora4x", [{"created_utc": 3}])
+        advance_watermark(state, "aurora4x", [])
+        assert get_watermark(state, "aurora4x") == 9
+
+    def test_legacy_state_without_watermarks(self):
+        """State files written before watermarks existed still work."""
+        state = {"backfill_complete": True, "seen_posts": {}, "seen_comments": {}}
+        assert get_watermark(state, "aurora4x") is None
+        advance_watermark(state, "aurora4x", [{"created_utc": 1}])
+        assert state["watermarks"] == {"aurora4x": 1}